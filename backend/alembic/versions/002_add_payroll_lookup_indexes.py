@@ -0,0 +1,37 @@
+"""Add composite indexes for payroll lookups.
+
+Revision ID: 002_add_payroll_lookup_indexes
+Revises: 001_add_policies
+Create Date: 2026-10-16
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "002_add_payroll_lookup_indexes"
+down_revision: Union[str, None] = "001_add_policies"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_empsal_tenant_emp_current",
+        "employee_salaries",
+        ["tenant_id", "employee_id"],
+        postgresql_where=sa.text("is_current = true"),
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_payslip_period_tenant",
+        "payslips",
+        ["period_id", "tenant_id"],
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_payslip_period_tenant", table_name="payslips")
+    op.drop_index("ix_empsal_tenant_emp_current", table_name="employee_salaries")
@@ -0,0 +1,57 @@
+"""Copy period year/month onto payslips.
+
+Revision ID: 003_denormalize_payslip_period
+Revises: 002_add_payroll_lookup_indexes
+Create Date: 2026-10-17
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "003_denormalize_payslip_period"
+down_revision: Union[str, None] = "002_add_payroll_lookup_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Databases bootstrapped by init_db's create_all already have the columns
+    columns = {c["name"] for c in sa.inspect(op.get_bind()).get_columns("payslips")}
+    if "year" in columns:
+        return
+
+    op.add_column("payslips", sa.Column("year", sa.Integer(), nullable=True))
+    op.add_column("payslips", sa.Column("month", sa.Integer(), nullable=True))
+
+    op.execute(
+        """
+        UPDATE payslips
+        SET year = (
+                SELECT payroll_periods.year FROM payroll_periods
+                WHERE payroll_periods.id = payslips.period_id
+            ),
+            month = (
+                SELECT payroll_periods.month FROM payroll_periods
+                WHERE payroll_periods.id = payslips.period_id
+            )
+        """
+    )
+
+    with op.batch_alter_table("payslips") as batch_op:
+        batch_op.alter_column("year", existing_type=sa.Integer(), nullable=False)
+        batch_op.alter_column("month", existing_type=sa.Integer(), nullable=False)
+
+    op.create_index(
+        "ix_payslip_tenant_emp_year_month",
+        "payslips",
+        ["tenant_id", "employee_id", "year", "month"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_payslip_tenant_emp_year_month", table_name="payslips")
+    with op.batch_alter_table("payslips") as batch_op:
+        batch_op.drop_column("month")
+        batch_op.drop_column("year")
@@ -0,0 +1,29 @@
+"""Enforce unique tenant contact emails.
+
+Revision ID: 004_unique_tenant_email
+Revises: 003_denormalize_payslip_period
+Create Date: 2026-10-17
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "004_unique_tenant_email"
+down_revision: Union[str, None] = "003_denormalize_payslip_period"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_tenants_email",
+        "tenants",
+        ["email"],
+        unique=True,
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tenants_email", table_name="tenants")
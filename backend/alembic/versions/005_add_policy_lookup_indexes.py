@@ -0,0 +1,58 @@
+"""Add composite and trigram indexes for policy lookups.
+
+Revision ID: 005_add_policy_lookup_indexes
+Revises: 004_unique_tenant_email
+Create Date: 2026-10-17
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "005_add_policy_lookup_indexes"
+down_revision: Union[str, None] = "004_unique_tenant_email"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_policies_tenant_status",
+        "policies",
+        ["tenant_id", "status"],
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_policies_tenant_category",
+        "policies",
+        ["tenant_id", "category"],
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_policies_tenant_name",
+        "policies",
+        ["tenant_id", "name"],
+        if_not_exists=True,
+    )
+
+    # Substring ILIKE searches on name cannot use a b-tree; a trigram GIN
+    # index serves them on PostgreSQL. Kept out of the model so create_all
+    # does not depend on the pg_trgm extension.
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.create_index(
+            "ix_policies_name_trgm",
+            "policies",
+            ["name"],
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.drop_index("ix_policies_name_trgm", table_name="policies")
+    op.drop_index("ix_policies_tenant_name", table_name="policies")
+    op.drop_index("ix_policies_tenant_category", table_name="policies")
+    op.drop_index("ix_policies_tenant_status", table_name="policies")
@@ -0,0 +1,48 @@
+"""Add trigram indexes for tenant search.
+
+Revision ID: 006_add_tenant_search_indexes
+Revises: 005_add_policy_lookup_indexes
+Create Date: 2026-10-17
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "006_add_tenant_search_indexes"
+down_revision: Union[str, None] = "005_add_policy_lookup_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # search_tenants matches substrings of name and domain with ILIKE, which
+    # only a trigram GIN index can serve; PostgreSQL only, like 005
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "ix_tenants_name_trgm",
+        "tenants",
+        ["name"],
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_tenants_domain_trgm",
+        "tenants",
+        ["domain"],
+        postgresql_using="gin",
+        postgresql_ops={"domain": "gin_trgm_ops"},
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.drop_index("ix_tenants_domain_trgm", table_name="tenants")
+    op.drop_index("ix_tenants_name_trgm", table_name="tenants")
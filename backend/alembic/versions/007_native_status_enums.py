@@ -0,0 +1,86 @@
+"""Store tenant and policy status/category as native enums.
+
+Revision ID: 007_native_status_enums
+Revises: 006_add_tenant_search_indexes
+Create Date: 2026-10-17
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "007_native_status_enums"
+down_revision: Union[str, None] = "006_add_tenant_search_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, enum type, values, previous VARCHAR length)
+ENUM_COLUMNS = [
+    (
+        "tenants",
+        "status",
+        "tenant_status",
+        ("active", "suspended", "pending", "cancelled"),
+        50,
+    ),
+    ("policies", "status", "policy_status", ("draft", "active", "archived"), 20),
+    (
+        "policies",
+        "category",
+        "policy_category",
+        (
+            "general",
+            "leave",
+            "attendance",
+            "conduct",
+            "benefits",
+            "compensation",
+            "safety",
+            "it",
+            "travel",
+            "expense",
+            "other",
+        ),
+        50,
+    ),
+]
+
+
+def upgrade() -> None:
+    # Other dialects keep the VARCHAR columns, which the models map to as-is
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    # Databases bootstrapped by init_db's create_all already have the types
+    # and enum-typed columns
+    existing_types = set(bind.scalars(sa.text("SELECT typname FROM pg_type")))
+    inspector = sa.inspect(bind)
+
+    for table, column, type_name, values, _ in ENUM_COLUMNS:
+        if type_name not in existing_types:
+            labels = ", ".join(f"'{value}'" for value in values)
+            op.execute(f"CREATE TYPE {type_name} AS ENUM ({labels})")
+
+        current = next(
+            c["type"] for c in inspector.get_columns(table) if c["name"] == column
+        )
+        if getattr(current, "name", None) == type_name:
+            continue
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} "
+            f"TYPE {type_name} USING {column}::{type_name}"
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for table, column, type_name, _, length in reversed(ENUM_COLUMNS):
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} "
+            f"TYPE VARCHAR({length}) USING {column}::text"
+        )
+        op.execute(f"DROP TYPE {type_name}")
@@ -0,0 +1,30 @@
+"""Add a partial index over policies awaiting indexing.
+
+Revision ID: 008_add_unindexed_policy_index
+Revises: 007_native_status_enums
+Create Date: 2026-10-17
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "008_add_unindexed_policy_index"
+down_revision: Union[str, None] = "007_native_status_enums"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_policies_unindexed",
+        "policies",
+        ["tenant_id", "id"],
+        postgresql_where=sa.text("is_indexed IS false"),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_policies_unindexed", table_name="policies")
@@ -0,0 +1,38 @@
+"""Cover category policy listings with a single composite index.
+
+Revision ID: 009_policy_category_listing_index
+Revises: 008_add_unindexed_policy_index
+Create Date: 2026-10-17
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "009_policy_category_listing_index"
+down_revision: Union[str, None] = "008_add_unindexed_policy_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_policies_tenant_category_status_name",
+        "policies",
+        ["tenant_id", "category", "status", "name", "id"],
+        if_not_exists=True,
+    )
+    # Its (tenant_id, category) prefix makes the narrower index redundant
+    op.drop_index(
+        "ix_policies_tenant_category", table_name="policies", if_exists=True
+    )
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_policies_tenant_category",
+        "policies",
+        ["tenant_id", "category"],
+        if_not_exists=True,
+    )
+    op.drop_index("ix_policies_tenant_category_status_name", table_name="policies")
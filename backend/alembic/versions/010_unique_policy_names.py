@@ -0,0 +1,36 @@
+"""Enforce unique live policy names per tenant.
+
+Revision ID: 010_unique_policy_names
+Revises: 009_policy_category_listing_index
+Create Date: 2026-10-17
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "010_unique_policy_names"
+down_revision: Union[str, None] = "009_policy_category_listing_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Matches the case-insensitive duplicate check uploads used to run, which
+# ignored archived policies
+LIVE_POLICIES = sa.text("status <> 'archived'")
+
+
+def upgrade() -> None:
+    op.create_index(
+        "uq_policies_tenant_name",
+        "policies",
+        ["tenant_id", sa.text("lower(name)")],
+        unique=True,
+        postgresql_where=LIVE_POLICIES,
+        sqlite_where=LIVE_POLICIES,
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_policies_tenant_name", table_name="policies")
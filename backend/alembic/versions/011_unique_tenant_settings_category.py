@@ -0,0 +1,41 @@
+"""Make tenant settings unique per category.
+
+Revision ID: 011_unique_tenant_settings_category
+Revises: 010_unique_policy_names
+Create Date: 2026-10-17
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "011_unique_tenant_settings_category"
+down_revision: Union[str, None] = "010_unique_policy_names"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Settings are upserted on (tenant_id, category), which needs a unique
+    # index as the conflict target
+    op.create_index(
+        "uq_tenant_settings_tenant_category",
+        "tenant_settings",
+        ["tenant_id", "category"],
+        unique=True,
+        if_not_exists=True,
+    )
+    # Category alone is low-selectivity and never queried without tenant_id
+    op.drop_index(
+        "ix_tenant_settings_category", table_name="tenant_settings", if_exists=True
+    )
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_tenant_settings_category",
+        "tenant_settings",
+        ["category"],
+        if_not_exists=True,
+    )
+    op.drop_index("uq_tenant_settings_tenant_category", table_name="tenant_settings")
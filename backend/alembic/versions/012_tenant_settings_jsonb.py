@@ -0,0 +1,36 @@
+"""Store tenant settings as JSONB on PostgreSQL.
+
+Revision ID: 012_tenant_settings_jsonb
+Revises: 011_unique_tenant_settings_category
+Create Date: 2026-10-17
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "012_tenant_settings_jsonb"
+down_revision: Union[str, None] = "011_unique_tenant_settings_category"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Other dialects have a single JSON type, which the model keeps using
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute(
+        "ALTER TABLE tenant_settings "
+        "ALTER COLUMN settings TYPE jsonb USING settings::jsonb"
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute(
+        "ALTER TABLE tenant_settings "
+        "ALTER COLUMN settings TYPE json USING settings::json"
+    )
@@ -30,6 +30,9 @@ class ChunkingConfig:
     chunk_size: int = 1000
     chunk_overlap: int = 200
     separators: list[str] = field(default_factory=lambda: ["\n\n", "\n", ". ", " ", ""])
+    # Drop repeated chunks (page headers, footers, boilerplate) so identical
+    # text is stored and embedded once per document
+    deduplicate: bool = False
 
 
 class DocumentLoader:
@@ -104,6 +107,9 @@ class DocumentLoader:
             self.config.separators,
         )
 
+        if self.config.deduplicate:
+            chunks = list(dict.fromkeys(chunks))
+
         base_metadata = base_metadata or {}
 
         return [
@@ -0,0 +1,125 @@
+"""Persistent cache of chunk embeddings keyed by content hash.
+
+Forced reindexes and near-duplicate policies keep producing chunks whose
+text was embedded before. Looking vectors up by content hash first means
+only genuinely new text is sent to the embedding backend.
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+from array import array
+from collections.abc import Mapping, Sequence
+from functools import lru_cache
+from itertools import batched
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from app.core.config import settings
+
+if TYPE_CHECKING:
+    from chromadb.api.types import Documents, EmbeddingFunction, PyEmbeddings
+
+logger = logging.getLogger(__name__)
+
+
+# Keep each IN list well under SQLite's bound parameter limit
+LOOKUP_CHUNK_SIZE = 500
+
+
+def embedding_key(text: str) -> str:
+    """Content hash identifying a chunk's text in the cache."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class EmbeddingCache:
+    """SQLite-backed store of float32 vectors per (model, content hash)."""
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        # Indexing runs in worker threads; one connection, serialized
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embedding_cache ("
+                " hash TEXT NOT NULL,"
+                " model TEXT NOT NULL,"
+                " vector BLOB NOT NULL,"
+                " PRIMARY KEY (model, hash))"
+            )
+
+    def get_many(self, model: str, keys: Sequence[str]) -> dict[str, list[float]]:
+        """Return the cached vectors among ``keys``, in one query per chunk."""
+        found: dict[str, list[float]] = {}
+        with self._lock:
+            for chunk in batched(keys, LOOKUP_CHUNK_SIZE):
+                placeholders = ", ".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    "SELECT hash, vector FROM embedding_cache"
+                    f" WHERE model = ? AND hash IN ({placeholders})",
+                    (model, *chunk),
+                )
+                for key, blob in rows:
+                    found[key] = array("f", blob).tolist()
+        return found
+
+    def put_many(self, model: str, vectors: Mapping[str, Sequence[float]]) -> None:
+        """Store new vectors; keys already cached are left untouched."""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO embedding_cache (hash, model, vector)"
+                " VALUES (?, ?, ?)",
+                [
+                    (key, model, array("f", vector).tobytes())
+                    for key, vector in vectors.items()
+                ],
+            )
+
+
+@lru_cache
+def get_embedding_cache() -> EmbeddingCache:
+    """Get the process-wide embedding cache."""
+    return EmbeddingCache(settings.embedding_cache_path)
+
+
+class CachedEmbedder:
+    """Embedding function that serves repeated texts from an EmbeddingCache."""
+
+    def __init__(
+        self, embedding_function: "EmbeddingFunction[Documents]", cache: EmbeddingCache
+    ):
+        self.embedding_function = embedding_function
+        self.cache = cache
+        # Vectors from different models are not interchangeable
+        model_name = getattr(embedding_function, "model_name", None)
+        self.model_id = embedding_function.name() + (
+            f":{model_name}" if model_name else ""
+        )
+
+    def __call__(self, documents: list[str]) -> "PyEmbeddings":
+        """Embed documents, calling the backend once for all cache misses."""
+        keys = [embedding_key(document) for document in documents]
+        vectors = self.cache.get_many(self.model_id, keys)
+
+        misses = {
+            key: document
+            for key, document in zip(keys, documents, strict=True)
+            if key not in vectors
+        }
+        if misses:
+            embedded = self.embedding_function(list(misses.values()))
+            new_vectors = {
+                key: [float(x) for x in vector]
+                for key, vector in zip(misses, embedded, strict=True)
+            }
+            self.cache.put_many(self.model_id, new_vectors)
+            vectors.update(new_vectors)
+
+        logger.debug(
+            "Embedded %d documents (%d cached)",
+            len(documents),
+            len(documents) - len(misses),
+        )
+        return [vectors[key] for key in keys]
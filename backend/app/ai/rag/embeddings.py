@@ -4,11 +4,15 @@ import hashlib
 import logging
 import os
 from functools import lru_cache
+from typing import TYPE_CHECKING
 
 from pydantic import BaseModel
 
 from app.core.config import settings
 
+if TYPE_CHECKING:
+    from chromadb.api.types import Documents, EmbeddingFunction
+
 logger = logging.getLogger(__name__)
 
 
@@ -26,7 +30,7 @@ def get_embedding_config() -> EmbeddingConfig:
     return EmbeddingConfig()
 
 
-def get_embedding_function():
+def get_embedding_function() -> "EmbeddingFunction[Documents]":
     """Get the embedding function for ChromaDB.
 
     Uses OpenAI embeddings via ChromaDB's built-in support.
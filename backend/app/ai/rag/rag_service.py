@@ -6,7 +6,7 @@ from typing import Any
 
 from pydantic import BaseModel, Field
 
-from app.ai.rag.vectorstore import PolicyVectorStore
+from app.ai.rag.vectorstore import get_tenant_vectorstore
 
 logger = logging.getLogger(__name__)
 
@@ -50,7 +50,7 @@ class PolicyRAGService:
     ):
         self.tenant_id = tenant_id
         self.config = config or RAGConfig()
-        self.vectorstore = PolicyVectorStore(tenant_id)
+        self.vectorstore = get_tenant_vectorstore(tenant_id)
 
     async def retrieve_context(
         self,
@@ -2,6 +2,7 @@
 
 import logging
 from functools import lru_cache
+from itertools import batched
 from pathlib import Path
 from typing import Any
 
@@ -9,7 +10,12 @@ import chromadb
 from chromadb.config import Settings as ChromaSettings
 
 from app.ai.rag.document_loader import DocumentChunk
-from app.ai.rag.embeddings import compute_content_hash, get_embedding_function
+from app.ai.rag.embedding_cache import CachedEmbedder, get_embedding_cache
+from app.ai.rag.embeddings import (
+    compute_content_hash,
+    get_embedding_config,
+    get_embedding_function,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +58,7 @@ class PolicyVectorStore:
         self.client = get_chroma_client()
         self.collection_name = get_tenant_collection_name(tenant_id)
         self._collection = None
+        self._embedder: CachedEmbedder | None = None
 
     @property
     def collection(self) -> chromadb.Collection:
@@ -69,46 +76,76 @@ class PolicyVectorStore:
             )
         return self._collection
 
+    @property
+    def embedder(self) -> CachedEmbedder:
+        """Embedding function for new chunks, backed by the embedding cache."""
+        if self._embedder is None:
+            self._embedder = CachedEmbedder(
+                get_embedding_function(), get_embedding_cache()
+            )
+        return self._embedder
+
     def add_chunks(self, chunks: list[DocumentChunk], policy_id: str) -> int:
         """Add document chunks to the vector store.
 
         Returns the number of chunks added.
         """
-        if not chunks:
-            return 0
-
-        ids = []
-        documents = []
-        metadatas = []
-
-        for chunk in chunks:
-            chunk_id = f"{policy_id}::{chunk.chunk_index}"
-            content_hash = compute_content_hash(chunk.content)
-
-            metadata = {
-                **chunk.metadata,
-                "policy_id": policy_id,
-                "tenant_id": self.tenant_id,
-                "content_hash": content_hash,
-            }
-
-            ids.append(chunk_id)
-            documents.append(chunk.content)
-            metadatas.append(metadata)
-
-        self.collection.upsert(
-            ids=ids,
-            documents=documents,
-            metadatas=metadatas,
-        )
+        return self.add_chunks_batch({policy_id: chunks})[policy_id]
 
-        logger.info(
-            "Added %d chunks for policy %s in tenant %s",
-            len(chunks),
-            policy_id,
-            self.tenant_id,
-        )
-        return len(chunks)
+    def add_chunks_batch(
+        self,
+        chunks_by_policy: dict[str, list[DocumentChunk]],
+        batch_size: int | None = None,
+    ) -> dict[str, int]:
+        """Add chunks for several policies, embedding them in shared batches.
+
+        Each upsert embeds its documents in one call, so flattening chunks
+        across policies turns one embedding round trip per policy into one
+        per ``batch_size`` chunks.
+
+        Returns the number of chunks added per policy.
+        """
+        batch_size = batch_size or get_embedding_config().batch_size
+        records = [
+            self._chunk_record(chunk, policy_id)
+            for policy_id, chunks in chunks_by_policy.items()
+            for chunk in chunks
+        ]
+
+        for batch in batched(records, batch_size):
+            ids, documents, metadatas = zip(*batch, strict=True)
+            # Embedded here rather than by the collection so unchanged text
+            # is served from the embedding cache
+            self.collection.upsert(
+                ids=list(ids),
+                documents=list(documents),
+                metadatas=list(metadatas),
+                embeddings=self.embedder(list(documents)),
+            )
+
+        for policy_id, chunks in chunks_by_policy.items():
+            if chunks:
+                logger.info(
+                    "Added %d chunks for policy %s in tenant %s",
+                    len(chunks),
+                    policy_id,
+                    self.tenant_id,
+                )
+        return {
+            policy_id: len(chunks) for policy_id, chunks in chunks_by_policy.items()
+        }
+
+    def _chunk_record(
+        self, chunk: DocumentChunk, policy_id: str
+    ) -> tuple[str, str, dict[str, Any]]:
+        """ID, document and metadata stored for one chunk."""
+        metadata = {
+            **chunk.metadata,
+            "policy_id": policy_id,
+            "tenant_id": self.tenant_id,
+            "content_hash": compute_content_hash(chunk.content),
+        }
+        return f"{policy_id}::{chunk.chunk_index}", chunk.content, metadata
 
     def delete_policy(self, policy_id: str) -> int:
         """Delete all chunks for a policy.
@@ -216,3 +253,13 @@ class PolicyVectorStore:
                 self.collection_name,
             )
         return count
+
+
+@lru_cache(maxsize=256)
+def get_tenant_vectorstore(tenant_id: str) -> PolicyVectorStore:
+    """Get the shared vector store for a tenant.
+
+    Reusing it keeps the resolved collection and embedder across requests
+    instead of looking the collection up again for every service instance.
+    """
+    return PolicyVectorStore(tenant_id)
@@ -26,8 +26,12 @@ Usage:
     # Cache invalidation
     await cache.delete("key")
     await cache.delete_pattern("employees:*")
+
+    # Invalidation once the session's transaction commits
+    delete_after_commit(session, "stats")
 """
 
+import asyncio
 import functools
 import hashlib
 import inspect
@@ -39,6 +43,9 @@ from datetime import timedelta
 from typing import Any, ParamSpec, TypeVar
 
 from pydantic import BaseModel
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
 from app.core.redis import redis_pool
 
@@ -52,6 +59,9 @@ R = TypeVar("R")
 DEFAULT_TTL = 300  # 5 minutes
 KEY_PREFIX = "samvit:cache"
 
+# Session.info entry holding the (key, tenant_id) pairs to drop on commit
+_AFTER_COMMIT_DELETES = "cache_deletes_after_commit"
+
 
 class CacheSerializer:
     """Handles serialization/deserialization for cache values."""
@@ -625,3 +635,34 @@ def get_all_cache_stats() -> dict[str, dict[str, Any]]:
 
 # Global cache instance
 cache = Cache()
+
+
+# The loop only keeps weak references to tasks; hold each one until it ends
+_after_commit_tasks: set[asyncio.Task[None]] = set()
+
+
+def delete_after_commit(
+    session: AsyncSession, key: str, tenant_id: str | None = None
+) -> None:
+    """Drop a cache key once the session's transaction commits.
+
+    Deleting before the commit leaves a window in which a concurrent read
+    caches the old rows again. If the transaction rolls back instead, the
+    key is dropped after the next commit, which only costs a cache miss.
+    """
+    session.info.setdefault(_AFTER_COMMIT_DELETES, set()).add((key, tenant_id))
+
+
+async def _delete_keys(keys: set[tuple[str, str | None]]) -> None:
+    for key, tenant_id in keys:
+        await cache.delete(key, tenant_id=tenant_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _delete_committed_keys(session: Session) -> None:
+    """Schedule the deletes queued by delete_after_commit."""
+    keys = session.info.pop(_AFTER_COMMIT_DELETES, None)
+    if keys:
+        task = asyncio.get_running_loop().create_task(_delete_keys(keys))
+        _after_commit_tasks.add(task)
+        task.add_done_callback(_after_commit_tasks.discard)
@@ -1,6 +1,7 @@
 """Application configuration using pydantic-settings."""
 
 from functools import lru_cache
+from pathlib import Path
 from typing import Literal
 
 from pydantic import field_validator
@@ -30,12 +31,21 @@ class Settings(BaseSettings):
     # API
     api_v1_prefix: str = "/api/v1"
 
+    # Server
+    # Install uvloop's event loop policy at import time (when uvloop is available)
+    use_uvloop: bool = False
+    # Threads for blocking work offloaded with asyncio.to_thread (file I/O,
+    # document parsing, embedding calls)
+    blocking_io_workers: int = 8
+
     # Database
     database_url: str = "sqlite+aiosqlite:///./samvit_test.db"
     db_pool_size: int = 5
     db_pool_max_overflow: int = 10
     db_pool_timeout: int = 30
     db_pool_recycle: int = 3600
+    # Size of SQLAlchemy's compiled statement LRU cache (shared across requests)
+    db_query_cache_size: int = 1200
 
     # Security
     secret_key: str = "your-super-secret-key-change-in-production"
@@ -69,6 +79,8 @@ class Settings(BaseSettings):
     anthropic_api_key: str | None = None
     google_api_key: str | None = None
     ai_model: str = "openai:gpt-4o-mini"  # Default model for Pydantic AI agents
+    # SQLite file of chunk embeddings reused across reindexes (safe to delete)
+    embedding_cache_path: Path = Path("data/embedding_cache.sqlite3")
 
     @field_validator("secret_key")
     @classmethod
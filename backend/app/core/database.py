@@ -18,6 +18,7 @@ current_tenant_id: ContextVar[str | None] = ContextVar(
 # Create async engine with appropriate settings based on database type
 engine_kwargs = {
     "echo": settings.debug,
+    "query_cache_size": settings.db_query_cache_size,
 }
 
 # SQLite doesn't support pool_size and max_overflow
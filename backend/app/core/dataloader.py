@@ -0,0 +1,110 @@
+"""Request-scoped batching of by-key lookups.
+
+A DataLoader collects every ``load(key)`` issued during the same event-loop
+tick and resolves them with a single call to a batch function, typically one
+``SELECT ... WHERE id IN (...)``. Results are memoized for the loader's
+lifetime, so loaders should be created per request (e.g. on a service).
+
+Usage:
+    async def load_components(ids: list[str]) -> dict[str, SalaryComponent]:
+        result = await session.execute(
+            select(SalaryComponent).where(SalaryComponent.id.in_(ids))
+        )
+        return {c.id: c for c in result.scalars()}
+
+    loader = DataLoader(load_components)
+    a, b = await asyncio.gather(loader.load("id-1"), loader.load("id-2"))
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Iterable, Mapping
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+BatchLoadFn = Callable[[list[K]], Awaitable[Mapping[K, V]]]
+
+
+class DataLoader(Generic[K, V]):
+    """Coalesce lookups issued in the same tick into one batch call.
+
+    Keys missing from the batch result resolve to None.
+    """
+
+    __slots__ = ("_batch_load_fn", "_dispatch_tasks", "_futures", "_queue")
+
+    def __init__(self, batch_load_fn: BatchLoadFn[K, V]) -> None:
+        self._batch_load_fn = batch_load_fn
+        self._futures: dict[K, asyncio.Future[V | None]] = {}
+        self._queue: list[K] = []
+        # The loop only keeps weak references to tasks; hold each dispatch
+        # until it finishes so it cannot be garbage collected mid-batch
+        self._dispatch_tasks: set[asyncio.Task[None]] = set()
+
+    def load(self, key: K) -> asyncio.Future[V | None]:
+        """Schedule a key for the next batch and return a future for its value."""
+        future = self._futures.get(key)
+        if future is not None:
+            return future
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._futures[key] = future
+        self._queue.append(key)
+        if len(self._queue) == 1:
+            loop.call_soon(self._start_dispatch)
+        return future
+
+    async def load_many(self, keys: Iterable[K]) -> list[V | None]:
+        """Load several keys in one batch."""
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def prime(self, key: K, value: V) -> None:
+        """Seed the loader with an already known value."""
+        if key not in self._futures:
+            future = asyncio.get_running_loop().create_future()
+            future.set_result(value)
+            self._futures[key] = future
+
+    def clear(self, key: K) -> None:
+        """Forget a memoized key so the next load hits the batch function."""
+        self._futures.pop(key, None)
+
+    def _start_dispatch(self) -> None:
+        """Start a batch for the queued keys, keeping its task referenced."""
+        task = asyncio.get_running_loop().create_task(self._dispatch())
+        self._dispatch_tasks.add(task)
+        task.add_done_callback(self._dispatch_tasks.discard)
+
+    async def _dispatch(self) -> None:
+        """Run the batch function for every queued key."""
+        keys, self._queue = self._queue, []
+        try:
+            results = await self._batch_load_fn(keys)
+        except Exception as e:
+            self._reject(keys, e)
+            return
+        except BaseException:
+            # A cancelled batch must not leave its loads awaiting forever
+            self._reject(keys, None)
+            raise
+
+        for key in keys:
+            future = self._futures.get(key)
+            if future is not None and not future.done():
+                future.set_result(results.get(key))
+
+    def _reject(self, keys: list[K], error: Exception | None) -> None:
+        """Fail the unresolved futures of a batch, cancelling them without an error.
+
+        The keys are forgotten, so a later load retries them.
+        """
+        for key in keys:
+            future = self._futures.pop(key, None)
+            if future is None or future.done():
+                continue
+            if error is None:
+                future.cancel()
+            else:
+                future.set_exception(error)
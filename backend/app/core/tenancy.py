@@ -1,9 +1,11 @@
 """Multi-tenancy middleware and utilities."""
 
+import time
 from typing import Annotated
 
 from fastapi import Depends, HTTPException, Request, status
 from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.responses import Response
 
@@ -38,6 +40,53 @@ def is_reserved_domain(domain: str) -> bool:
     return domain in settings.reserved_domains or domain in ["localhost", "127.0.0.1"]
 
 
+# Every tenant request resolves its domain, so active domain -> tenant ID
+# mappings are kept briefly per process. Suspending or deleting a tenant
+# invalidates locally; other workers catch up within the TTL.
+DOMAIN_CACHE_TTL = 30
+DOMAIN_CACHE_MAX_SIZE = 1024
+_domain_cache: dict[str, tuple[str, float]] = {}
+
+
+def get_cached_tenant_id(domain: str) -> str | None:
+    """Return the cached tenant ID for a domain if it has not expired."""
+    entry = _domain_cache.get(domain)
+    if entry is None:
+        return None
+    tenant_id, expires_at = entry
+    if expires_at <= time.monotonic():
+        _domain_cache.pop(domain, None)
+        return None
+    return tenant_id
+
+
+async def lookup_tenant_id(session: AsyncSession, domain: str) -> str | None:
+    """Look up the active tenant for a domain and cache the result."""
+    from app.modules.tenants.models import Tenant
+
+    tenant_id = await session.scalar(
+        select(Tenant.id).where(Tenant.domain == domain, Tenant.is_active.is_(True))
+    )
+    if tenant_id is None:
+        return None
+
+    if len(_domain_cache) >= DOMAIN_CACHE_MAX_SIZE:
+        # Dicts keep insertion order, so this evicts the oldest entry
+        _domain_cache.pop(next(iter(_domain_cache)))
+    _domain_cache[domain] = (tenant_id, time.monotonic() + DOMAIN_CACHE_TTL)
+    return tenant_id
+
+
+def invalidate_tenant_domain(domain: str) -> None:
+    """Forget a cached domain after its tenant is suspended or deleted."""
+    _domain_cache.pop(domain.lower(), None)
+
+
+def clear_tenant_domain_cache() -> None:
+    """Forget every cached domain."""
+    _domain_cache.clear()
+
+
 class TenantMiddleware(BaseHTTPMiddleware):
     """Middleware to extract tenant from Host header and set in request context.
 
@@ -82,9 +131,6 @@ class TenantMiddleware(BaseHTTPMiddleware):
         call_next: RequestResponseEndpoint,
     ) -> Response:
         """Process request and set tenant context from Host header."""
-        # Import here to avoid circular imports
-        from app.modules.tenants.models import Tenant
-
         path = request.url.path
 
         # Initialize request state
@@ -112,19 +158,16 @@ class TenantMiddleware(BaseHTTPMiddleware):
                 media_type="application/json",
             )
 
-        # Look up tenant by domain in database
-        async with async_session_maker() as session:
-            result = await session.execute(
-                select(Tenant).where(
-                    Tenant.domain == domain, Tenant.is_active.is_(True)
-                )
-            )
-            tenant = result.scalar_one_or_none()
+        # Look up tenant by domain, hitting the database only on a cache miss
+        tenant_id = get_cached_tenant_id(domain)
+        if tenant_id is None:
+            async with async_session_maker() as session:
+                tenant_id = await lookup_tenant_id(session, domain)
 
-        if tenant:
+        if tenant_id:
             # Set tenant context for the request
-            request.state.tenant_id = tenant.id
-            current_tenant_id.set(tenant.id)
+            request.state.tenant_id = tenant_id
+            current_tenant_id.set(tenant_id)
         elif path not in self.OPTIONAL_TENANT_PATHS:
             # Tenant not found and path requires tenant
             return Response(
@@ -156,8 +199,6 @@ async def get_current_tenant(
         return TenantContext(tenant_id=tenant_id, domain=domain)
 
     # Need to resolve tenant (middleware might have skipped this path)
-    from app.modules.tenants.models import Tenant
-
     host = request.headers.get("host", "")
     domain = extract_domain_from_host(host)
 
@@ -169,23 +210,20 @@ async def get_current_tenant(
         )
 
     # Look up tenant by domain
-    result = await session.execute(
-        select(Tenant).where(Tenant.domain == domain, Tenant.is_active.is_(True))
-    )
-    tenant = result.scalar_one_or_none()
+    tenant_id = get_cached_tenant_id(domain) or await lookup_tenant_id(session, domain)
 
-    if not tenant:
+    if not tenant_id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Tenant not found for domain: {domain}",
         )
 
     # Set tenant in context variable and request state
-    current_tenant_id.set(tenant.id)
-    request.state.tenant_id = tenant.id
+    current_tenant_id.set(tenant_id)
+    request.state.tenant_id = tenant_id
     request.state.domain = domain
 
-    return TenantContext(tenant_id=tenant.id, domain=domain)
+    return TenantContext(tenant_id=tenant_id, domain=domain)
 
 
 # Type alias for dependency injection
@@ -4,8 +4,11 @@ SAMVIT HRMS - Main Application.
 AI-powered multi-tenant Human Resource Management System.
 """
 
+import asyncio
 from collections.abc import AsyncGenerator
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
+from typing import Any
 
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
@@ -51,6 +54,15 @@ from app.modules.tenants.settings_routes import router as tenant_settings_router
 setup_logging()
 logger = get_logger(__name__)
 
+# Use uvloop when requested; Uvicorn should also be started with --loop uvloop
+if settings.use_uvloop:
+    try:
+        import uvloop
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        logger.warning("USE_UVLOOP is set but uvloop is not installed")
+
 
 @asynccontextmanager
 async def lifespan(_app: FastAPI) -> AsyncGenerator:
@@ -58,6 +70,14 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator:
     # Startup
     logger.info("Starting %s v%s", settings.app_name, settings.app_version)
     logger.info("Environment: %s, Debug: %s", settings.environment, settings.debug)
+    loop = asyncio.get_running_loop()
+    logger.info("Event loop: %s", type(loop).__module__)
+    loop.set_default_executor(
+        ThreadPoolExecutor(
+            max_workers=settings.blocking_io_workers,
+            thread_name_prefix="samvit-io",
+        )
+    )
     await init_db()
     logger.info("Database initialized")
 
@@ -287,7 +307,7 @@ app.include_router(ai_router, prefix=API_V1_PREFIX)
 
 
 @app.get("/health", tags=["Health"])
-async def health_check() -> dict:
+async def health_check() -> dict[str, Any]:
     """Health check endpoint with database and Redis connectivity verification."""
     import time
 
@@ -326,16 +346,28 @@ async def health_check() -> dict:
     else:
         overall_status = "degraded"  # Redis down = degraded (fail-open)
 
+    database_check: dict[str, Any] = {
+        "status": db_status,
+        "latency_ms": round(db_latency_ms, 2) if db_latency_ms else None,
+    }
+    if settings.debug:
+        # Expose pool and compiled statement cache usage to spot cache misses.
+        # The cache is a private SQLAlchemy attribute, so report no size if a
+        # release renames it rather than failing the health check
+        compiled_cache = getattr(engine.sync_engine, "_compiled_cache", None)
+        database_check["pool"] = engine.pool.status()
+        database_check["compiled_cache"] = {
+            "size": len(compiled_cache) if compiled_cache is not None else None,
+            "capacity": settings.db_query_cache_size,
+        }
+
     return {
         "status": overall_status,
         "app": settings.app_name,
         "version": settings.app_version,
         "environment": settings.environment,
         "checks": {
-            "database": {
-                "status": db_status,
-                "latency_ms": round(db_latency_ms, 2) if db_latency_ms else None,
-            },
+            "database": database_check,
             "redis": {
                 "status": redis_status,
                 "latency_ms": round(redis_latency_ms, 2) if redis_latency_ms else None,
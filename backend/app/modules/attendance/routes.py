@@ -4,6 +4,7 @@ from datetime import date
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Query, Request, status
+from pydantic import TypeAdapter
 
 from app.core.database import DbSession
 from app.core.rate_limit import rate_limit
@@ -24,6 +25,10 @@ from app.modules.attendance.service import AttendanceService
 
 router = APIRouter(prefix="/attendance", tags=["Attendance"])
 
+# List adapters validate whole result sets in one pydantic-core call
+_ATTENDANCE_RESPONSES = TypeAdapter(list[AttendanceResponse])
+_SHIFT_RESPONSES = TypeAdapter(list[ShiftResponse])
+
 
 def get_attendance_service(
     tenant: TenantDep,
@@ -59,7 +64,7 @@ async def list_shifts(
 ) -> list[ShiftResponse]:
     """List all shifts."""
     shifts = await service.list_shifts()
-    return [ShiftResponse.model_validate(s) for s in shifts]
+    return _SHIFT_RESPONSES.validate_python(shifts, from_attributes=True)
 
 
 @router.get(
@@ -143,7 +148,7 @@ async def get_my_attendance(
 ) -> list[AttendanceResponse]:
     """Get current user's attendance for a date range."""
     records = await service.get_attendance_range(user_id, start_date, end_date)
-    return [AttendanceResponse.model_validate(r) for r in records]
+    return _ATTENDANCE_RESPONSES.validate_python(records, from_attributes=True)
 
 
 @router.get(
@@ -159,7 +164,7 @@ async def get_employee_attendance(
 ) -> list[AttendanceResponse]:
     """Get an employee's attendance for a date range."""
     records = await service.get_attendance_range(employee_id, start_date, end_date)
-    return [AttendanceResponse.model_validate(r) for r in records]
+    return _ATTENDANCE_RESPONSES.validate_python(records, from_attributes=True)
 
 
 @router.post(
@@ -20,6 +20,7 @@ from app.modules.attendance.schemas import (
     ShiftCreate,
     ShiftUpdate,
 )
+from app.shared.schemas import apply_patch
 
 
 class AttendanceService:
@@ -70,9 +71,7 @@ class AttendanceService:
     async def update_shift(self, shift_id: str, data: ShiftUpdate) -> Shift:
         """Update a shift."""
         shift = await self.get_shift(shift_id)
-        update_data = data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(shift, field, value)
+        apply_patch(shift, data)
         await self.session.flush()
         await self.session.refresh(shift)
         return shift
@@ -4,6 +4,7 @@ from datetime import datetime
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Query
+from pydantic import TypeAdapter
 
 from app.core.database import DbSession
 from app.core.rate_limit import rate_limit
@@ -19,6 +20,8 @@ from app.shared.schemas import PaginatedResponse
 
 router = APIRouter(prefix="/audit", tags=["Audit Logs"])
 
+_AUDIT_LOG_SUMMARIES = TypeAdapter(list[AuditLogSummary])
+
 
 def get_audit_service(
     tenant: TenantDep,
@@ -66,7 +69,7 @@ async def list_audit_logs(
         start_date=start_date,
         end_date=end_date,
     )
-    items = [AuditLogSummary.model_validate(log) for log in audit_logs]
+    items = _AUDIT_LOG_SUMMARIES.validate_python(audit_logs, from_attributes=True)
     return PaginatedResponse.create(items, total, page, page_size)
 
 
@@ -103,7 +106,7 @@ async def get_user_audit_logs(
         offset=offset,
         limit=page_size,
     )
-    items = [AuditLogSummary.model_validate(log) for log in audit_logs]
+    items = _AUDIT_LOG_SUMMARIES.validate_python(audit_logs, from_attributes=True)
     return PaginatedResponse.create(items, total, page, page_size)
 
 
@@ -128,7 +131,7 @@ async def get_entity_audit_logs(
         offset=offset,
         limit=page_size,
     )
-    items = [AuditLogSummary.model_validate(log) for log in audit_logs]
+    items = _AUDIT_LOG_SUMMARIES.validate_python(audit_logs, from_attributes=True)
     return PaginatedResponse.create(items, total, page, page_size)
 
 
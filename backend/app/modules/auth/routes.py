@@ -4,6 +4,7 @@ from datetime import datetime, timezone
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status
+from pydantic import TypeAdapter
 
 from app.core.audit import AuditAction, log_audit
 from app.core.database import DbSession
@@ -312,6 +313,8 @@ async def change_password(
 
 admin_router = APIRouter(prefix="/users", tags=["Users (Admin)"])
 
+_USER_SUMMARIES = TypeAdapter(list[UserSummary])
+
 
 @admin_router.get(
     "",
@@ -326,7 +329,7 @@ async def list_users(
     """List all users in tenant (admin only)."""
     offset = (page - 1) * page_size
     users, total = await service.list_users(offset=offset, limit=page_size)
-    items = [UserSummary.model_validate(u) for u in users]
+    items = _USER_SUMMARIES.validate_python(users, from_attributes=True)
     return PaginatedResponse.create(items, total, page, page_size)
 
 
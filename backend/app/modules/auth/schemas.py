@@ -1,6 +1,5 @@
 """Auth schemas."""
 
-import re
 from enum import Enum
 
 from pydantic import EmailStr, Field, field_validator
@@ -71,8 +70,8 @@ class CompanyRegisterRequest(BaseSchema):
     @classmethod
     def validate_subdomain(cls, v: str) -> str:
         """Validate subdomain format."""
-        v = v.lower().strip()
-        if not re.match(r"^[a-z0-9][a-z0-9-]*[a-z0-9]$|^[a-z0-9]$", v):
+        # The Field pattern has already limited v to lowercase a-z, 0-9 and -
+        if v.startswith("-") or v.endswith("-"):
             raise ValueError(
                 "Subdomain must start and end with alphanumeric characters"
             )
@@ -29,7 +29,9 @@ from app.modules.auth.schemas import (
     UserCreate,
     UserUpdate,
 )
+from app.modules.platform.service import invalidate_platform_stats
 from app.modules.tenants.models import Tenant, TenantStatus
+from app.shared.schemas import apply_patch
 
 
 class AuthService:
@@ -123,6 +125,7 @@ class AuthService:
         )
         self.session.add(user)
         await self.session.flush()
+        invalidate_platform_stats(self.session, tenant.id)
 
         # Create tokens with domain as issuer
         access_token, refresh_token, expires_in = self._create_tokens(user, domain)
@@ -160,6 +163,7 @@ class AuthService:
         self.session.add(user)
         await self.session.flush()
         await self.session.refresh(user)
+        invalidate_platform_stats(self.session, self.tenant_id)
 
         return user
 
@@ -322,6 +326,7 @@ class AuthService:
         self.session.add(user)
         await self.session.flush()
         await self.session.refresh(user)
+        invalidate_platform_stats(self.session, self.tenant_id)
 
         return user
 
@@ -329,9 +334,7 @@ class AuthService:
         """Update user profile."""
         user = await self.get_user(user_id)
 
-        update_data = data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(user, field, value)
+        apply_patch(user, data)
 
         await self.session.flush()
         await self.session.refresh(user)
@@ -3,6 +3,7 @@
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Query, status
+from pydantic import TypeAdapter
 
 from app.core.database import DbSession
 from app.core.rate_limit import rate_limit
@@ -28,6 +29,11 @@ department_router = APIRouter(prefix="/departments", tags=["Departments"])
 position_router = APIRouter(prefix="/positions", tags=["Positions"])
 employee_router = APIRouter(prefix="/employees", tags=["Employees"])
 
+# Page items are validated as one list instead of model by model
+_DEPARTMENT_SUMMARIES = TypeAdapter(list[DepartmentSummary])
+_EMPLOYEE_SUMMARIES = TypeAdapter(list[EmployeeSummary])
+_POSITION_SUMMARIES = TypeAdapter(list[PositionSummary])
+
 
 def get_employee_service(
     tenant: TenantDep,
@@ -66,7 +72,7 @@ async def list_departments(
     """List all departments."""
     offset = (page - 1) * page_size
     departments, total = await service.list_departments(offset=offset, limit=page_size)
-    items = [DepartmentSummary.model_validate(d) for d in departments]
+    items = _DEPARTMENT_SUMMARIES.validate_python(departments, from_attributes=True)
     return PaginatedResponse.create(items, total, page, page_size)
 
 
@@ -143,7 +149,7 @@ async def list_positions(
     """List all positions."""
     offset = (page - 1) * page_size
     positions, total = await service.list_positions(offset=offset, limit=page_size)
-    items = [PositionSummary.model_validate(p) for p in positions]
+    items = _POSITION_SUMMARIES.validate_python(positions, from_attributes=True)
     return PaginatedResponse.create(items, total, page, page_size)
 
 
@@ -225,7 +231,7 @@ async def list_employees(
         limit=page_size,
         department_id=department_id,
     )
-    items = [EmployeeSummary.model_validate(e) for e in employees]
+    items = _EMPLOYEE_SUMMARIES.validate_python(employees, from_attributes=True)
     return PaginatedResponse.create(items, total, page, page_size)
 
 
@@ -241,7 +247,7 @@ async def search_employees(
 ) -> list[EmployeeSummary]:
     """Search employees by name, email, or code."""
     employees = await service.search_employees(q, limit=limit)
-    return [EmployeeSummary.model_validate(e) for e in employees]
+    return _EMPLOYEE_SUMMARIES.validate_python(employees, from_attributes=True)
 
 
 @employee_router.get(
@@ -296,7 +302,7 @@ async def get_direct_reports(
 ) -> list[EmployeeSummary]:
     """Get employees reporting to this employee."""
     employees = await service.get_direct_reports(employee_id)
-    return [EmployeeSummary.model_validate(e) for e in employees]
+    return _EMPLOYEE_SUMMARIES.validate_python(employees, from_attributes=True)
 
 
 @employee_router.post(
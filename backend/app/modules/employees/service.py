@@ -17,6 +17,8 @@ from app.modules.employees.schemas import (
     PositionCreate,
     PositionUpdate,
 )
+from app.modules.platform.service import invalidate_platform_stats
+from app.shared.schemas import apply_patch
 
 
 class EmployeeService:
@@ -56,9 +58,7 @@ class EmployeeService:
     ) -> Department:
         """Update department."""
         department = await self.get_department(department_id)
-        update_data = data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(department, field, value)
+        apply_patch(department, data)
         return await self.department_repo.update(department)
 
     async def list_departments(
@@ -105,9 +105,7 @@ class EmployeeService:
     ) -> Position:
         """Update position."""
         position = await self.get_position(position_id)
-        update_data = data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(position, field, value)
+        apply_patch(position, data)
         return await self.position_repo.update(position)
 
     async def list_positions(
@@ -166,7 +164,9 @@ class EmployeeService:
             bank_account_number=data.bank_account_number,
             ifsc_code=data.ifsc_code,
         )
-        return await self.employee_repo.create(employee)
+        employee = await self.employee_repo.create(employee)
+        invalidate_platform_stats(self.session, self.tenant_id)
+        return employee
 
     async def get_employee(self, employee_id: str) -> Employee:
         """Get employee by ID."""
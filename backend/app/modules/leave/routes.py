@@ -3,6 +3,7 @@
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Query, status
+from pydantic import TypeAdapter
 
 from app.core.database import DbSession
 from app.core.rate_limit import rate_limit
@@ -24,6 +25,12 @@ from app.modules.leave.service import LeaveService
 
 router = APIRouter(prefix="/leave", tags=["Leave Management"])
 
+# Validating a list in one adapter call avoids per-item model dispatch
+_HOLIDAY_RESPONSES = TypeAdapter(list[HolidayResponse])
+_LEAVE_BALANCE_RESPONSES = TypeAdapter(list[LeaveBalanceResponse])
+_LEAVE_POLICY_RESPONSES = TypeAdapter(list[LeavePolicyResponse])
+_LEAVE_REQUEST_RESPONSES = TypeAdapter(list[LeaveRequestResponse])
+
 
 def get_leave_service(
     tenant: TenantDep,
@@ -63,7 +70,7 @@ async def list_policies(
 ) -> list[LeavePolicyResponse]:
     """List all leave policies."""
     policies = await service.list_policies(active_only)
-    return [LeavePolicyResponse.model_validate(p) for p in policies]
+    return _LEAVE_POLICY_RESPONSES.validate_python(policies, from_attributes=True)
 
 
 @router.get(
@@ -111,7 +118,7 @@ async def get_my_balances(
 ) -> list[LeaveBalanceResponse]:
     """Get current user's leave balances."""
     balances = await service.get_employee_balances(user_id, year)
-    return [LeaveBalanceResponse.model_validate(b) for b in balances]
+    return _LEAVE_BALANCE_RESPONSES.validate_python(balances, from_attributes=True)
 
 
 @router.get(
@@ -126,7 +133,7 @@ async def get_employee_balances(
 ) -> list[LeaveBalanceResponse]:
     """Get an employee's leave balances."""
     balances = await service.get_employee_balances(employee_id, year)
-    return [LeaveBalanceResponse.model_validate(b) for b in balances]
+    return _LEAVE_BALANCE_RESPONSES.validate_python(balances, from_attributes=True)
 
 
 @router.post(
@@ -142,7 +149,7 @@ async def initialize_balances(
 ) -> list[LeaveBalanceResponse]:
     """Initialize leave balances for an employee."""
     balances = await service.initialize_balances(employee_id, year)
-    return [LeaveBalanceResponse.model_validate(b) for b in balances]
+    return _LEAVE_BALANCE_RESPONSES.validate_python(balances, from_attributes=True)
 
 
 # --- Leave Request Routes ---
@@ -178,7 +185,7 @@ async def get_my_requests(
 ) -> list[LeaveRequestResponse]:
     """Get current user's leave requests."""
     requests = await service.get_employee_requests(user_id, leave_status, year)
-    return [LeaveRequestResponse.model_validate(r) for r in requests]
+    return _LEAVE_REQUEST_RESPONSES.validate_python(requests, from_attributes=True)
 
 
 @router.get(
@@ -192,7 +199,7 @@ async def get_pending_approvals(
 ) -> list[LeaveRequestResponse]:
     """Get pending leave requests for approval."""
     requests = await service.get_pending_approvals(user_id)
-    return [LeaveRequestResponse.model_validate(r) for r in requests]
+    return _LEAVE_REQUEST_RESPONSES.validate_python(requests, from_attributes=True)
 
 
 @router.get(
@@ -272,4 +279,4 @@ async def list_holidays(
 ) -> list[HolidayResponse]:
     """List holidays for a year."""
     holidays = await service.list_holidays(year)
-    return [HolidayResponse.model_validate(h) for h in holidays]
+    return _HOLIDAY_RESPONSES.validate_python(holidays, from_attributes=True)
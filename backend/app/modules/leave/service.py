@@ -24,6 +24,7 @@ from app.modules.leave.schemas import (
     LeavePolicyUpdate,
     LeaveRequestCreate,
 )
+from app.shared.schemas import apply_patch
 
 
 class LeaveService:
@@ -87,9 +88,7 @@ class LeaveService:
     ) -> LeavePolicy:
         """Update leave policy."""
         policy = await self.get_policy(policy_id)
-        update_data = data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(policy, field, value)
+        apply_patch(policy, data)
         await self.session.flush()
         await self.session.refresh(policy)
         return policy
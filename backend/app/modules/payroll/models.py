@@ -1,9 +1,20 @@
 """Payroll models."""
 
 from datetime import date
+from decimal import Decimal
 from enum import Enum
 
-from sqlalchemy import Boolean, Date, ForeignKey, Integer, Numeric, String, Text
+from sqlalchemy import (
+    Boolean,
+    Date,
+    ForeignKey,
+    Index,
+    Integer,
+    Numeric,
+    String,
+    Text,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.shared.models import TenantBaseModel
@@ -92,8 +103,10 @@ class SalaryStructureComponent(TenantBaseModel):
     )
 
     # Value
-    default_amount: Mapped[float | None] = mapped_column(Numeric(12, 2), nullable=True)
-    percentage: Mapped[float | None] = mapped_column(Numeric(5, 2), nullable=True)
+    default_amount: Mapped[Decimal | None] = mapped_column(
+        Numeric(12, 2), nullable=True
+    )
+    percentage: Mapped[Decimal | None] = mapped_column(Numeric(5, 2), nullable=True)
 
     # Relationships
     structure: Mapped[SalaryStructure] = relationship(
@@ -120,9 +133,20 @@ class EmployeeSalary(TenantBaseModel):
         nullable=False,
     )
 
+    # Current-salary lookups always filter by tenant, employee and is_current
+    __table_args__ = (
+        Index(
+            "ix_empsal_tenant_emp_current",
+            "tenant_id",
+            "employee_id",
+            postgresql_where=text("is_current = true"),
+        ),
+        {"extend_existing": True},
+    )
+
     # CTC breakdown
-    annual_ctc: Mapped[float] = mapped_column(Numeric(12, 2), nullable=False)
-    monthly_gross: Mapped[float] = mapped_column(Numeric(12, 2), nullable=False)
+    annual_ctc: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False)
+    monthly_gross: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False)
 
     # Effective dates
     effective_from: Mapped[date] = mapped_column(Date, nullable=False)
@@ -155,7 +179,7 @@ class EmployeeSalaryComponent(TenantBaseModel):
         ForeignKey("salary_components.id"),
         nullable=False,
     )
-    amount: Mapped[float] = mapped_column(Numeric(12, 2), nullable=False)
+    amount: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False)
 
     # Relationships
     employee_salary: Mapped[EmployeeSalary] = relationship(
@@ -206,16 +230,33 @@ class Payslip(TenantBaseModel):
         nullable=False,
     )
 
+    # Copied from the period so per-employee listings need no JOIN
+    year: Mapped[int] = mapped_column(Integer, nullable=False)
+    month: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    # Approval and summaries work on every payslip of a period
+    __table_args__ = (
+        Index("ix_payslip_period_tenant", "period_id", "tenant_id"),
+        Index(
+            "ix_payslip_tenant_emp_year_month",
+            "tenant_id",
+            "employee_id",
+            "year",
+            "month",
+        ),
+        {"extend_existing": True},
+    )
+
     # Salary details
-    gross_earnings: Mapped[float] = mapped_column(Numeric(12, 2), default=0)
-    total_deductions: Mapped[float] = mapped_column(Numeric(12, 2), default=0)
-    net_pay: Mapped[float] = mapped_column(Numeric(12, 2), default=0)
+    gross_earnings: Mapped[Decimal] = mapped_column(Numeric(12, 2), default=0)
+    total_deductions: Mapped[Decimal] = mapped_column(Numeric(12, 2), default=0)
+    net_pay: Mapped[Decimal] = mapped_column(Numeric(12, 2), default=0)
 
     # Attendance
     working_days: Mapped[int] = mapped_column(Integer, default=0)
-    present_days: Mapped[float] = mapped_column(Numeric(5, 2), default=0)
-    leave_days: Mapped[float] = mapped_column(Numeric(5, 2), default=0)
-    lop_days: Mapped[float] = mapped_column(Numeric(5, 2), default=0)
+    present_days: Mapped[Decimal] = mapped_column(Numeric(5, 2), default=0)
+    leave_days: Mapped[Decimal] = mapped_column(Numeric(5, 2), default=0)
+    lop_days: Mapped[Decimal] = mapped_column(Numeric(5, 2), default=0)
 
     # Status
     status: Mapped[str] = mapped_column(String(20), default=PayrollStatus.DRAFT.value)
@@ -249,7 +290,7 @@ class PayslipItem(TenantBaseModel):
         ForeignKey("salary_components.id"),
         nullable=False,
     )
-    amount: Mapped[float] = mapped_column(Numeric(12, 2), nullable=False)
+    amount: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False)
 
     # Relationships
     payslip: Mapped[Payslip] = relationship("Payslip", back_populates="items")
@@ -1,10 +1,14 @@
 """Payroll API routes."""
 
+from datetime import datetime
 from typing import Annotated
+from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from pydantic import TypeAdapter
 
 from app.core.database import DbSession
+from app.core.exceptions import EntityNotFoundError
 from app.core.rate_limit import rate_limit
 from app.core.security import CurrentUserId
 from app.core.tenancy import TenantDep
@@ -25,6 +29,11 @@ from app.modules.payroll.service import PayrollService
 
 router = APIRouter(prefix="/payroll", tags=["Payroll"])
 
+_EMPLOYEE_SALARY_RESPONSES = TypeAdapter(list[EmployeeSalaryResponse])
+_PAYROLL_PERIOD_RESPONSES = TypeAdapter(list[PayrollPeriodResponse])
+_PAYSLIP_RESPONSES = TypeAdapter(list[PayslipResponse])
+_SALARY_STRUCTURE_RESPONSES = TypeAdapter(list[SalaryStructureResponse])
+
 
 def get_payroll_service(
     tenant: TenantDep,
@@ -34,6 +43,21 @@ def get_payroll_service(
     return PayrollService(session, tenant.tenant_id)
 
 
+def _make_etag(fingerprint: tuple[int, datetime | None]) -> str:
+    """Build a weak ETag from a (count, max updated_at) fingerprint."""
+    count, max_updated_at = fingerprint
+    stamp = max_updated_at.timestamp() if max_updated_at else 0
+    return f'W/"{count}-{stamp}"'
+
+
+def _is_not_modified(request: Request, etag: str) -> bool:
+    """Check whether the client's If-None-Match already matches the ETag."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    return any(tag.strip() in (etag, "*") for tag in if_none_match.split(","))
+
+
 # --- Salary Component Routes ---
 
 
@@ -59,12 +83,21 @@ async def create_component(
     summary="List salary components",
 )
 async def list_components(
+    request: Request,
+    response: Response,
     active_only: bool = Query(default=True),
     service: PayrollService = Depends(get_payroll_service),
-) -> list[SalaryComponentResponse]:
+) -> list[SalaryComponentResponse] | Response:
     """List all salary components."""
-    components = await service.list_components(active_only)
-    return [SalaryComponentResponse.model_validate(c) for c in components]
+    fingerprint = await service.components_fingerprint(active_only)
+    etag = _make_etag(fingerprint)
+    if _is_not_modified(request, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+    response.headers["ETag"] = etag
+
+    return await service.list_components(active_only, fingerprint)
 
 
 @router.get(
@@ -73,11 +106,11 @@ async def list_components(
     summary="Get salary component",
 )
 async def get_component(
-    component_id: str,
+    component_id: UUID,
     service: PayrollService = Depends(get_payroll_service),
 ) -> SalaryComponentResponse:
     """Get salary component by ID."""
-    component = await service.get_component(component_id)
+    component = await service.get_component(str(component_id))
     return SalaryComponentResponse.model_validate(component)
 
 
@@ -87,13 +120,13 @@ async def get_component(
     summary="Update salary component",
 )
 async def update_component(
-    component_id: str,
+    component_id: UUID,
     data: SalaryComponentUpdate,
     service: PayrollService = Depends(get_payroll_service),
     _: Annotated[None, Depends(rate_limit(20, 60))] = None,  # 20 per minute
 ) -> SalaryComponentResponse:
     """Update a salary component."""
-    component = await service.update_component(component_id, data)
+    component = await service.update_component(str(component_id), data)
     return SalaryComponentResponse.model_validate(component)
 
 
@@ -122,12 +155,21 @@ async def create_structure(
     summary="List salary structures",
 )
 async def list_structures(
+    request: Request,
+    response: Response,
     active_only: bool = Query(default=True),
     service: PayrollService = Depends(get_payroll_service),
-) -> list[SalaryStructureResponse]:
+) -> list[SalaryStructureResponse] | Response:
     """List all salary structures."""
+    etag = _make_etag(await service.structures_fingerprint(active_only))
+    if _is_not_modified(request, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+    response.headers["ETag"] = etag
+
     structures = await service.list_structures(active_only)
-    return [SalaryStructureResponse.model_validate(s) for s in structures]
+    return _SALARY_STRUCTURE_RESPONSES.validate_python(structures, from_attributes=True)
 
 
 @router.get(
@@ -136,11 +178,11 @@ async def list_structures(
     summary="Get salary structure",
 )
 async def get_structure(
-    structure_id: str,
+    structure_id: UUID,
     service: PayrollService = Depends(get_payroll_service),
 ) -> SalaryStructureResponse:
     """Get salary structure by ID."""
-    structure = await service.get_structure(structure_id)
+    structure = await service.get_structure(str(structure_id))
     return SalaryStructureResponse.model_validate(structure)
 
 
@@ -165,18 +207,18 @@ async def assign_salary(
 
 @router.get(
     "/employee-salaries/{employee_id}",
-    response_model=EmployeeSalaryResponse | None,
+    response_model=EmployeeSalaryResponse,
     summary="Get employee salary",
 )
 async def get_employee_salary(
-    employee_id: str,
+    employee_id: UUID,
     service: PayrollService = Depends(get_payroll_service),
-) -> EmployeeSalaryResponse | None:
+) -> EmployeeSalaryResponse:
     """Get current salary for an employee."""
-    salary = await service.get_employee_salary(employee_id)
-    if salary:
-        return EmployeeSalaryResponse.model_validate(salary)
-    return None
+    salary = await service.get_employee_salary(str(employee_id))
+    if salary is None:
+        raise EntityNotFoundError("EmployeeSalary", str(employee_id))
+    return EmployeeSalaryResponse.model_validate(salary)
 
 
 @router.get(
@@ -185,12 +227,12 @@ async def get_employee_salary(
     summary="Get employee salary history",
 )
 async def get_employee_salary_history(
-    employee_id: str,
+    employee_id: UUID,
     service: PayrollService = Depends(get_payroll_service),
 ) -> list[EmployeeSalaryResponse]:
     """Get salary history for an employee."""
-    salaries = await service.get_employee_salary_history(employee_id)
-    return [EmployeeSalaryResponse.model_validate(s) for s in salaries]
+    salaries = await service.get_employee_salary_history(str(employee_id))
+    return _EMPLOYEE_SALARY_RESPONSES.validate_python(salaries, from_attributes=True)
 
 
 # --- Payroll Period Routes ---
@@ -218,12 +260,21 @@ async def create_period(
     summary="List payroll periods",
 )
 async def list_periods(
+    request: Request,
+    response: Response,
     year: int | None = Query(default=None),
     service: PayrollService = Depends(get_payroll_service),
-) -> list[PayrollPeriodResponse]:
+) -> list[PayrollPeriodResponse] | Response:
     """List all payroll periods."""
+    etag = _make_etag(await service.periods_fingerprint(year))
+    if _is_not_modified(request, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+    response.headers["ETag"] = etag
+
     periods = await service.list_periods(year)
-    return [PayrollPeriodResponse.model_validate(p) for p in periods]
+    return _PAYROLL_PERIOD_RESPONSES.validate_python(periods, from_attributes=True)
 
 
 @router.get(
@@ -232,11 +283,11 @@ async def list_periods(
     summary="Get payroll period",
 )
 async def get_period(
-    period_id: str,
+    period_id: UUID,
     service: PayrollService = Depends(get_payroll_service),
 ) -> PayrollPeriodResponse:
     """Get payroll period by ID."""
-    period = await service.get_period(period_id)
+    period = await service.get_period(str(period_id))
     return PayrollPeriodResponse.model_validate(period)
 
 
@@ -246,15 +297,15 @@ async def get_period(
     summary="Generate payslips",
 )
 async def generate_payslips(
-    period_id: str,
+    period_id: UUID,
     service: PayrollService = Depends(get_payroll_service),
     _: Annotated[
         None, Depends(rate_limit(2, 60))
     ] = None,  # 2 per minute - expensive operation
 ) -> list[PayslipResponse]:
     """Generate payslips for a payroll period."""
-    payslips = await service.generate_payslips(period_id)
-    return [PayslipResponse.model_validate(p) for p in payslips]
+    payslips = await service.generate_payslips(str(period_id))
+    return _PAYSLIP_RESPONSES.validate_python(payslips, from_attributes=True)
 
 
 @router.post(
@@ -263,12 +314,12 @@ async def generate_payslips(
     summary="Approve payroll",
 )
 async def approve_payroll(
-    period_id: str,
+    period_id: UUID,
     service: PayrollService = Depends(get_payroll_service),
     _: Annotated[None, Depends(rate_limit(5, 60))] = None,  # 5 per minute
 ) -> PayrollPeriodResponse:
     """Approve payroll for a period."""
-    period = await service.approve_payroll(period_id)
+    period = await service.approve_payroll(str(period_id))
     return PayrollPeriodResponse.model_validate(period)
 
 
@@ -278,12 +329,11 @@ async def approve_payroll(
     summary="Get payroll summary",
 )
 async def get_payroll_summary(
-    period_id: str,
+    period_id: UUID,
     service: PayrollService = Depends(get_payroll_service),
 ) -> PayrollSummary:
     """Get payroll summary for a period."""
-    summary = await service.get_payroll_summary(period_id)
-    return PayrollSummary(**summary)
+    return await service.get_payroll_summary(str(period_id))
 
 
 # --- Payslip Routes ---
@@ -301,7 +351,7 @@ async def get_my_payslips(
 ) -> list[PayslipResponse]:
     """Get current user's payslips."""
     payslips = await service.get_employee_payslips(user_id, year)
-    return [PayslipResponse.model_validate(p) for p in payslips]
+    return _PAYSLIP_RESPONSES.validate_python(payslips, from_attributes=True)
 
 
 @router.get(
@@ -310,9 +360,9 @@ async def get_my_payslips(
     summary="Get payslip",
 )
 async def get_payslip(
-    payslip_id: str,
+    payslip_id: UUID,
     service: PayrollService = Depends(get_payroll_service),
 ) -> PayslipResponse:
     """Get payslip by ID."""
-    payslip = await service.get_payslip(payslip_id)
+    payslip = await service.get_payslip(str(payslip_id))
     return PayslipResponse.model_validate(payslip)
@@ -1,6 +1,7 @@
 """Payroll schemas."""
 
 from datetime import date
+from decimal import Decimal
 from enum import Enum
 
 from pydantic import Field
@@ -118,7 +119,7 @@ class EmployeeSalaryComponentInput(BaseSchema):
     """Component input for employee salary."""
 
     component_id: str
-    amount: float = Field(..., ge=0)
+    amount: Decimal = Field(..., ge=0)
 
 
 class EmployeeSalaryCreate(BaseSchema):
@@ -126,7 +127,7 @@ class EmployeeSalaryCreate(BaseSchema):
 
     employee_id: str
     structure_id: str
-    annual_ctc: float = Field(..., gt=0)
+    annual_ctc: Decimal = Field(..., gt=0)
     effective_from: date
     components: list[EmployeeSalaryComponentInput] = []
 
@@ -143,10 +144,18 @@ class EmployeeSalaryResponse(TenantEntitySchema):
     is_current: bool
 
 
+class EmployeeSalaryComponentDetail(BaseSchema):
+    """Component line of an employee salary."""
+
+    component_name: str
+    component_type: ComponentType
+    amount: float
+
+
 class EmployeeSalaryDetail(EmployeeSalaryResponse):
     """Detailed employee salary with components."""
 
-    components: list[dict]  # List of {component_name, component_type, amount}
+    components: list[EmployeeSalaryComponentDetail]
 
 
 # --- Payroll Period Schemas ---
@@ -199,6 +208,8 @@ class PayslipResponse(TenantEntitySchema):
 
     employee_id: str
     period_id: str
+    year: int
+    month: int
     gross_earnings: float
     total_deductions: float
     net_pay: float
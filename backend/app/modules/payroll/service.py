@@ -1,13 +1,32 @@
 """Payroll service."""
 
-from datetime import date
-
-from sqlalchemy import select
+import time
+from datetime import date, datetime, timezone
+from decimal import ROUND_HALF_UP, Decimal
+from functools import partial
+from typing import Any
+
+from sqlalchemy import (
+    Insert,
+    case,
+    false,
+    func,
+    insert,
+    lambda_stmt,
+    literal,
+    select,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.interfaces import ORMOption
+from sqlalchemy.orm.util import identity_key
+from sqlalchemy.sql.elements import ColumnElement
 
+from app.core.dataloader import DataLoader
 from app.core.exceptions import BusinessRuleViolationError, EntityNotFoundError
 from app.modules.payroll.models import (
+    ComponentType,
     EmployeeSalary,
     EmployeeSalaryComponent,
     PayrollPeriod,
@@ -20,10 +39,35 @@ from app.modules.payroll.models import (
 from app.modules.payroll.schemas import (
     EmployeeSalaryCreate,
     PayrollPeriodCreate,
+    PayrollSummary,
     SalaryComponentCreate,
+    SalaryComponentResponse,
     SalaryComponentUpdate,
     SalaryStructureCreate,
 )
+from app.modules.payroll.schemas import (
+    PayrollStatus as PayrollSummaryStatus,
+)
+from app.shared.models import GenerateUUID
+from app.shared.schemas import apply_patch
+
+CENTS = Decimal("0.01")
+
+# Salary components are small, read-mostly reference data per tenant, so
+# their lists are kept in process memory for a short while. Entries are keyed
+# by (tenant_id, active_only) and hold (expires_at, fingerprint, components).
+COMPONENTS_CACHE_TTL = 60
+COMPONENTS_CACHE_MAXSIZE = 10_000
+_components_cache: dict[
+    tuple[str, bool],
+    tuple[float, tuple[int, datetime | None], tuple[SalaryComponentResponse, ...]],
+] = {}
+
+
+def invalidate_components_cache(tenant_id: str) -> None:
+    """Drop a tenant's cached salary component lists."""
+    for active_only in (True, False):
+        _components_cache.pop((tenant_id, active_only), None)
 
 
 class PayrollService:
@@ -33,6 +77,69 @@ class PayrollService:
         self.session = session
         self.tenant_id = tenant_id
 
+        # Request-scoped loaders coalesce by-id lookups into one IN query
+        self.component_loader: DataLoader[str, SalaryComponent] = DataLoader(
+            partial(self._load_by_ids, SalaryComponent)
+        )
+        self.structure_loader: DataLoader[str, SalaryStructure] = DataLoader(
+            partial(
+                self._load_by_ids,
+                SalaryStructure,
+                options=(selectinload(SalaryStructure.components),),
+            )
+        )
+        self.period_loader: DataLoader[str, PayrollPeriod] = DataLoader(
+            partial(self._load_by_ids, PayrollPeriod)
+        )
+        self.payslip_loader: DataLoader[str, Payslip] = DataLoader(
+            partial(
+                self._load_by_ids,
+                Payslip,
+                options=(selectinload(Payslip.items),),
+            )
+        )
+
+    async def _load_by_ids(
+        self,
+        model: Any,
+        ids: list[str],
+        options: tuple[ORMOption, ...] = (),
+    ) -> dict[str, Any]:
+        """Batch-load tenant rows of a model by primary key.
+
+        Without loader options, rows already in the identity map are returned
+        directly (as session.get would) and only the misses hit the database.
+        """
+        found: dict[str, Any] = {}
+        if not options:
+            for id_ in ids:
+                row = self.session.identity_map.get(identity_key(model, id_))
+                if row is not None and row.tenant_id == self.tenant_id:
+                    found[id_] = row
+            ids = [id_ for id_ in ids if id_ not in found]
+            if not ids:
+                return found
+
+        result = await self.session.execute(
+            select(model)
+            .options(*options)
+            .where(model.id.in_(ids), model.tenant_id == self.tenant_id)
+        )
+        found.update((row.id, row) for row in result.scalars())
+        return found
+
+    async def _fingerprint(
+        self, model: Any, *criteria: Any
+    ) -> tuple[int, datetime | None]:
+        """Return (row count, latest updated_at) for tenant rows of a model."""
+        result = await self.session.execute(
+            select(func.count(model.id), func.max(model.updated_at)).where(
+                model.tenant_id == self.tenant_id, *criteria
+            )
+        )
+        count, max_updated_at = result.one()
+        return count, max_updated_at
+
     async def create_component(self, data: SalaryComponentCreate) -> SalaryComponent:
         """Create a salary component."""
         component = SalaryComponent(
@@ -50,31 +157,71 @@ class PayrollService:
         )
         self.session.add(component)
         await self.session.flush()
-        await self.session.refresh(component)
+        invalidate_components_cache(self.tenant_id)
         return component
 
     async def get_component(self, component_id: str) -> SalaryComponent:
         """Get salary component by ID."""
-        result = await self.session.execute(
-            select(SalaryComponent).where(
-                SalaryComponent.id == component_id,
-                SalaryComponent.tenant_id == self.tenant_id,
-            )
-        )
-        component = result.scalar_one_or_none()
+        component = await self.component_loader.load(component_id)
         if not component:
             raise EntityNotFoundError("SalaryComponent", component_id)
         return component
 
-    async def list_components(self, active_only: bool = True) -> list[SalaryComponent]:
-        """List all salary components."""
-        query = select(SalaryComponent).where(
-            SalaryComponent.tenant_id == self.tenant_id
+    async def list_components(
+        self,
+        active_only: bool = True,
+        fingerprint: tuple[int, datetime | None] | None = None,
+    ) -> list[SalaryComponentResponse]:
+        """List all salary components, served from process memory when warm.
+
+        Pass the rows' fingerprint when the caller already has it: a cached
+        list taken from different rows (e.g. written by another worker) is
+        then reloaded rather than served.
+        """
+        key = (self.tenant_id, active_only)
+        entry = _components_cache.get(key)
+        if entry is not None:
+            expires_at, cached_fingerprint, cached = entry
+            if expires_at > time.monotonic() and fingerprint in (
+                None,
+                cached_fingerprint,
+            ):
+                return list(cached)
+
+        if fingerprint is None:
+            fingerprint = await self.components_fingerprint(active_only)
+
+        # Lambda statements cache their construction as well as the SQL string;
+        # closure variables such as tenant_id are extracted as bound parameters
+        tenant_id = self.tenant_id
+        query = lambda_stmt(
+            lambda: select(SalaryComponent).where(
+                SalaryComponent.tenant_id == tenant_id
+            )
         )
         if active_only:
-            query = query.where(SalaryComponent.is_active.is_(True))
+            query += lambda s: s.where(SalaryComponent.is_active.is_(True))
         result = await self.session.execute(query)
-        return list(result.scalars().all())
+        validate = SalaryComponentResponse.model_validate
+        components = tuple(validate(c) for c in result.scalars())
+
+        _components_cache.pop(key, None)
+        if len(_components_cache) >= COMPONENTS_CACHE_MAXSIZE:
+            # Dicts keep insertion order, so this evicts the oldest entry
+            del _components_cache[next(iter(_components_cache))]
+        _components_cache[key] = (
+            time.monotonic() + COMPONENTS_CACHE_TTL,
+            fingerprint,
+            components,
+        )
+        return list(components)
+
+    async def components_fingerprint(
+        self, active_only: bool = True
+    ) -> tuple[int, datetime | None]:
+        """Fingerprint the rows returned by list_components."""
+        criteria = [SalaryComponent.is_active.is_(True)] if active_only else []
+        return await self._fingerprint(SalaryComponent, *criteria)
 
     async def update_component(
         self,
@@ -83,11 +230,9 @@ class PayrollService:
     ) -> SalaryComponent:
         """Update a salary component."""
         component = await self.get_component(component_id)
-        update_data = data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(component, field, value)
+        apply_patch(component, data)
         await self.session.flush()
-        await self.session.refresh(component)
+        invalidate_components_cache(self.tenant_id)
         return component
 
     async def create_structure(self, data: SalaryStructureCreate) -> SalaryStructure:
@@ -100,40 +245,41 @@ class PayrollService:
         )
         self.session.add(structure)
         await self.session.flush()
-        await self.session.refresh(structure)
         return structure
 
     async def get_structure(self, structure_id: str) -> SalaryStructure:
         """Get salary structure by ID."""
-        result = await self.session.execute(
-            select(SalaryStructure)
-            .options(selectinload(SalaryStructure.components))
-            .where(
-                SalaryStructure.id == structure_id,
-                SalaryStructure.tenant_id == self.tenant_id,
-            )
-        )
-        structure = result.scalar_one_or_none()
+        structure = await self.structure_loader.load(structure_id)
         if not structure:
             raise EntityNotFoundError("SalaryStructure", structure_id)
         return structure
 
     async def list_structures(self, active_only: bool = True) -> list[SalaryStructure]:
         """List all salary structures."""
-        query = select(SalaryStructure).where(
-            SalaryStructure.tenant_id == self.tenant_id
+        tenant_id = self.tenant_id
+        query = lambda_stmt(
+            lambda: select(SalaryStructure).where(
+                SalaryStructure.tenant_id == tenant_id
+            )
         )
         if active_only:
-            query = query.where(SalaryStructure.is_active.is_(True))
+            query += lambda s: s.where(SalaryStructure.is_active.is_(True))
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
+    async def structures_fingerprint(
+        self, active_only: bool = True
+    ) -> tuple[int, datetime | None]:
+        """Fingerprint the rows returned by list_structures."""
+        criteria = [SalaryStructure.is_active.is_(True)] if active_only else []
+        return await self._fingerprint(SalaryStructure, *criteria)
+
     async def assign_salary(self, data: EmployeeSalaryCreate) -> EmployeeSalary:
         """Assign salary structure to employee."""
         # Deactivate current salary
         await self._deactivate_current_salary(data.employee_id)
 
-        monthly_gross = data.annual_ctc / 12
+        monthly_gross = (data.annual_ctc / 12).quantize(CENTS, ROUND_HALF_UP)
 
         employee_salary = EmployeeSalary(
             tenant_id=self.tenant_id,
@@ -158,7 +304,6 @@ class PayrollService:
             self.session.add(salary_component)
 
         await self.session.flush()
-        await self.session.refresh(employee_salary)
         return employee_salary
 
     async def get_employee_salary(self, employee_id: str) -> EmployeeSalary | None:
@@ -191,17 +336,15 @@ class PayrollService:
 
     async def _deactivate_current_salary(self, employee_id: str) -> None:
         """Deactivate current salary for an employee."""
-        result = await self.session.execute(
-            select(EmployeeSalary).where(
+        await self.session.execute(
+            update(EmployeeSalary)
+            .where(
                 EmployeeSalary.tenant_id == self.tenant_id,
                 EmployeeSalary.employee_id == employee_id,
                 EmployeeSalary.is_current.is_(True),
             )
+            .values(is_current=False, effective_to=date.today())
         )
-        current = result.scalar_one_or_none()
-        if current:
-            current.is_current = False
-            current.effective_to = date.today()
 
     async def create_period(self, data: PayrollPeriodCreate) -> PayrollPeriod:
         """Create a payroll period."""
@@ -219,31 +362,36 @@ class PayrollService:
         )
         self.session.add(period)
         await self.session.flush()
-        await self.session.refresh(period)
         return period
 
     async def get_period(self, period_id: str) -> PayrollPeriod:
         """Get payroll period by ID."""
-        result = await self.session.execute(
-            select(PayrollPeriod).where(
-                PayrollPeriod.id == period_id,
-                PayrollPeriod.tenant_id == self.tenant_id,
-            )
-        )
-        period = result.scalar_one_or_none()
+        period = await self.period_loader.load(period_id)
         if not period:
             raise EntityNotFoundError("PayrollPeriod", period_id)
         return period
 
     async def list_periods(self, year: int | None = None) -> list[PayrollPeriod]:
         """List payroll periods."""
-        query = select(PayrollPeriod).where(PayrollPeriod.tenant_id == self.tenant_id)
+        tenant_id = self.tenant_id
+        query = lambda_stmt(
+            lambda: select(PayrollPeriod).where(PayrollPeriod.tenant_id == tenant_id)
+        )
         if year:
-            query = query.where(PayrollPeriod.year == year)
-        query = query.order_by(PayrollPeriod.year.desc(), PayrollPeriod.month.desc())
+            query += lambda s: s.where(PayrollPeriod.year == year)
+        query += lambda s: s.order_by(
+            PayrollPeriod.year.desc(), PayrollPeriod.month.desc()
+        )
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
+    async def periods_fingerprint(
+        self, year: int | None = None
+    ) -> tuple[int, datetime | None]:
+        """Fingerprint the rows returned by list_periods."""
+        criteria = [PayrollPeriod.year == year] if year else []
+        return await self._fingerprint(PayrollPeriod, *criteria)
+
     async def generate_payslips(self, period_id: str) -> list[Payslip]:
         """Generate payslips for a payroll period."""
         period = await self.get_period(period_id)
@@ -254,86 +402,150 @@ class PayrollService:
                 "Can only generate payslips for draft periods",
             )
 
-        # Get all active employee salaries
-        result = await self.session.execute(
-            select(EmployeeSalary)
-            .options(selectinload(EmployeeSalary.components))
-            .where(
-                EmployeeSalary.tenant_id == self.tenant_id,
-                EmployeeSalary.is_current.is_(True),
-            )
-        )
-        employee_salaries = list(result.scalars().all())
-
-        payslips = []
-        for emp_salary in employee_salaries:
-            payslip = await self._create_payslip(period, emp_salary)
-            payslips.append(payslip)
+        # Totals are aggregated and written by the database, so salary rows
+        # never travel to the application
+        now = datetime.now(timezone.utc)
+        await self.session.execute(self._insert_payslips_stmt(period, now))
+        await self.session.execute(self._insert_payslip_items_stmt(period, now))
 
         period.status = PayrollStatus.PROCESSING.value
-
         await self.session.flush()
-        return payslips
-
-    async def _create_payslip(
-        self,
-        period: PayrollPeriod,
-        employee_salary: EmployeeSalary,
-    ) -> Payslip:
-        """Create a payslip for an employee."""
-        # Calculate working days (simplified - would need actual calendar)
-        working_days = 22  # Simplified
 
-        # Create payslip
-        payslip = Payslip(
-            tenant_id=self.tenant_id,
-            employee_id=employee_salary.employee_id,
-            period_id=period.id,
-            working_days=working_days,
-            present_days=working_days,  # Simplified
-            status=PayrollStatus.DRAFT.value,
+        result = await self.session.execute(
+            select(Payslip).where(
+                Payslip.period_id == period.id,
+                Payslip.tenant_id == self.tenant_id,
+            )
         )
-        self.session.add(payslip)
-        await self.session.flush()
-
-        # Add items from employee salary components
-        gross = 0.0
-        deductions = 0.0
+        return list(result.scalars().all())
 
-        for emp_comp in employee_salary.components:
-            component = await self.get_component(emp_comp.component_id)
+    def _insert_payslips_stmt(self, period: PayrollPeriod, now: datetime) -> Insert:
+        """INSERT ... SELECT one payslip per current employee salary."""
+        # Calculate working days (simplified - would need actual calendar)
+        working_days = 22  # Simplified
 
-            item = PayslipItem(
-                tenant_id=self.tenant_id,
-                payslip_id=payslip.id,
-                component_id=emp_comp.component_id,
-                amount=float(emp_comp.amount),
+        def total(component_type: ComponentType) -> ColumnElement[Decimal]:
+            return func.coalesce(
+                func.sum(
+                    case(
+                        (
+                            SalaryComponent.component_type == component_type.value,
+                            EmployeeSalaryComponent.amount,
+                        ),
+                        else_=0,
+                    )
+                ),
+                0,
             )
-            self.session.add(item)
 
-            if component.component_type == "earning":
-                gross += float(emp_comp.amount)
-            elif component.component_type == "deduction":
-                deductions += float(emp_comp.amount)
-
-        payslip.gross_earnings = gross
-        payslip.total_deductions = deductions
-        payslip.net_pay = gross - deductions
-
-        await self.session.refresh(payslip)
-        return payslip
+        gross = total(ComponentType.EARNING)
+        deductions = total(ComponentType.DEDUCTION)
+
+        # Outer joins keep employees without components, matching a zero payslip
+        rows = (
+            select(
+                GenerateUUID(),
+                literal(self.tenant_id),
+                EmployeeSalary.employee_id,
+                literal(period.id),
+                literal(period.year),
+                literal(period.month),
+                gross,
+                deductions,
+                gross - deductions,
+                literal(working_days),
+                literal(Decimal(working_days)),  # Simplified
+                literal(Decimal(0)),
+                literal(Decimal(0)),
+                literal(PayrollStatus.DRAFT.value),
+                false(),
+                literal(now),
+                literal(now),
+            )
+            .select_from(EmployeeSalary)
+            .outerjoin(
+                EmployeeSalaryComponent,
+                EmployeeSalaryComponent.employee_salary_id == EmployeeSalary.id,
+            )
+            .outerjoin(
+                SalaryComponent,
+                SalaryComponent.id == EmployeeSalaryComponent.component_id,
+            )
+            .where(
+                EmployeeSalary.tenant_id == self.tenant_id,
+                EmployeeSalary.is_current.is_(True),
+            )
+            .group_by(EmployeeSalary.id, EmployeeSalary.employee_id)
+        )
+        return insert(Payslip).from_select(
+            [
+                "id",
+                "tenant_id",
+                "employee_id",
+                "period_id",
+                "year",
+                "month",
+                "gross_earnings",
+                "total_deductions",
+                "net_pay",
+                "working_days",
+                "present_days",
+                "leave_days",
+                "lop_days",
+                "status",
+                "is_published",
+                "created_at",
+                "updated_at",
+            ],
+            rows,
+        )
 
-    async def get_payslip(self, payslip_id: str) -> Payslip:
-        """Get payslip by ID."""
-        result = await self.session.execute(
-            select(Payslip)
-            .options(selectinload(Payslip.items))
+    def _insert_payslip_items_stmt(
+        self, period: PayrollPeriod, now: datetime
+    ) -> Insert:
+        """INSERT ... SELECT the salary components of each generated payslip."""
+        rows = (
+            select(
+                GenerateUUID(),
+                literal(self.tenant_id),
+                Payslip.id,
+                EmployeeSalaryComponent.component_id,
+                EmployeeSalaryComponent.amount,
+                literal(now),
+                literal(now),
+            )
+            .select_from(Payslip)
+            .join(
+                EmployeeSalary,
+                (EmployeeSalary.employee_id == Payslip.employee_id)
+                & (EmployeeSalary.tenant_id == self.tenant_id)
+                & EmployeeSalary.is_current.is_(True),
+            )
+            .join(
+                EmployeeSalaryComponent,
+                EmployeeSalaryComponent.employee_salary_id == EmployeeSalary.id,
+            )
             .where(
-                Payslip.id == payslip_id,
+                Payslip.period_id == period.id,
                 Payslip.tenant_id == self.tenant_id,
             )
         )
-        payslip = result.scalar_one_or_none()
+        return insert(PayslipItem).from_select(
+            [
+                "id",
+                "tenant_id",
+                "payslip_id",
+                "component_id",
+                "amount",
+                "created_at",
+                "updated_at",
+            ],
+            rows,
+        )
+
+    async def get_payslip(self, payslip_id: str) -> Payslip:
+        """Get payslip by ID."""
+        payslip = await self.payslip_loader.load(payslip_id)
         if not payslip:
             raise EntityNotFoundError("Payslip", payslip_id)
         return payslip
@@ -344,17 +556,13 @@ class PayrollService:
         year: int | None = None,
     ) -> list[Payslip]:
         """Get payslips for an employee."""
-        query = (
-            select(Payslip)
-            .join(PayrollPeriod)
-            .where(
-                Payslip.tenant_id == self.tenant_id,
-                Payslip.employee_id == employee_id,
-            )
+        query = select(Payslip).where(
+            Payslip.tenant_id == self.tenant_id,
+            Payslip.employee_id == employee_id,
         )
         if year:
-            query = query.where(PayrollPeriod.year == year)
-        query = query.order_by(PayrollPeriod.year.desc(), PayrollPeriod.month.desc())
+            query = query.where(Payslip.year == year)
+        query = query.order_by(Payslip.year.desc(), Payslip.month.desc())
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
@@ -370,40 +578,43 @@ class PayrollService:
 
         period.status = PayrollStatus.APPROVED.value
 
-        # Update all payslips
-        result = await self.session.execute(
-            select(Payslip).where(
+        # Update all payslips in a single statement
+        await self.session.execute(
+            update(Payslip)
+            .where(
                 Payslip.period_id == period_id,
                 Payslip.tenant_id == self.tenant_id,
             )
+            .values(status=PayrollStatus.APPROVED.value)
         )
-        payslips = result.scalars().all()
-        for payslip in payslips:
-            payslip.status = PayrollStatus.APPROVED.value
 
         await self.session.flush()
-        await self.session.refresh(period)
         return period
 
-    async def get_payroll_summary(self, period_id: str) -> dict:
+    async def get_payroll_summary(self, period_id: str) -> PayrollSummary:
         """Get payroll summary for a period."""
         period = await self.get_period(period_id)
 
         result = await self.session.execute(
-            select(Payslip).where(
+            select(
+                func.count(Payslip.id),
+                func.coalesce(func.sum(Payslip.gross_earnings), 0),
+                func.coalesce(func.sum(Payslip.total_deductions), 0),
+                func.coalesce(func.sum(Payslip.net_pay), 0),
+            ).where(
                 Payslip.period_id == period_id,
                 Payslip.tenant_id == self.tenant_id,
             )
         )
-        payslips = list(result.scalars().all())
-
-        return {
-            "period_id": period.id,
-            "month": period.month,
-            "year": period.year,
-            "total_employees": len(payslips),
-            "total_gross": sum(float(p.gross_earnings) for p in payslips),
-            "total_deductions": sum(float(p.total_deductions) for p in payslips),
-            "total_net_pay": sum(float(p.net_pay) for p in payslips),
-            "status": period.status,
-        }
+        total_employees, total_gross, total_deductions, total_net_pay = result.one()
+
+        return PayrollSummary(
+            period_id=period.id,
+            month=period.month,
+            year=period.year,
+            total_employees=total_employees,
+            total_gross=float(total_gross),
+            total_deductions=float(total_deductions),
+            total_net_pay=float(total_net_pay),
+            status=PayrollSummaryStatus(period.status),
+        )
@@ -1,86 +1,137 @@
 """Platform service - Business logic for platform administration."""
 
 from datetime import datetime, timedelta, timezone
+from typing import Any
 
-from sqlalchemy import func, select
+from sqlalchemy import Select, case, func, lambda_stmt, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
 
+from app.core.cache import cache, delete_after_commit
 from app.core.config import settings
+from app.core.database import Base, DbSession
 from app.core.exceptions import EntityAlreadyExistsError, EntityNotFoundError
+from app.core.tenancy import invalidate_tenant_domain
 from app.modules.auth.models import User
 from app.modules.employees.models import Employee
 from app.modules.platform.schemas import PlatformStatsResponse, TenantStatsResponse
 from app.modules.tenants.models import Tenant, TenantStatus
 from app.modules.tenants.schemas import TenantCreate, TenantUpdate
+from app.modules.tenants.service import invalidate_tenant_info
+from app.shared.repository import estimated_row_count
+
+# Plain status strings, resolved from the enum once at import
+_ACTIVE = TenantStatus.ACTIVE.value
+_SUSPENDED = TenantStatus.SUSPENDED.value
+_PENDING = TenantStatus.PENDING.value
+
+# Platform aggregates need not be real-time; serve repeats from Redis briefly
+STATS_CACHE_TTL = 30
+PLATFORM_STATS_CACHE_KEY = "platform:stats"
+
+# Rows fetched per round trip when streaming tenant stats pages
+TENANT_STATS_BATCH_SIZE = 100
+
+# Platform totals switch to planner estimates once a table is this large
+APPROXIMATE_COUNT_THRESHOLD = 1_000_000
+
+
+def _tenant_stats_cache_key(tenant_id: str) -> str:
+    """Cache key for a single tenant's statistics."""
+    return f"platform:tenant_stats:{tenant_id}"
+
+
+def invalidate_platform_stats(
+    session: AsyncSession, tenant_id: str | None = None
+) -> None:
+    """Drop cached platform stats and, when given, one tenant's, after commit.
+
+    Call from any write that changes tenant, user or employee counts.
+    """
+    delete_after_commit(session, PLATFORM_STATS_CACHE_KEY)
+    if tenant_id:
+        delete_after_commit(session, _tenant_stats_cache_key(tenant_id))
 
 
 class PlatformService:
     """Service for platform-level administration."""
 
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: DbSession):
         self.session = session
 
+    def _total_rows_column(self, model: type[Base]) -> ColumnElement[int]:
+        """Column yielding a table's row count, estimated once it is large."""
+        exact = select(func.count()).select_from(model).scalar_subquery()
+        if self.session.bind.dialect.name != "postgresql":
+            return exact
+        # Uncorrelated subqueries run as lazy InitPlans, so the exact count
+        # is only computed when the estimate is below the threshold
+        estimate = estimated_row_count(model.__tablename__)
+        return case(
+            (estimate >= APPROXIMATE_COUNT_THRESHOLD, estimate),
+            else_=exact,
+        )
+
     async def get_platform_stats(self) -> PlatformStatsResponse:
         """Get platform-wide statistics."""
+        cached = await cache.get(PLATFORM_STATS_CACHE_KEY)
+        if cached is not None:
+            return PlatformStatsResponse.model_validate(cached)
+
         now = datetime.now(timezone.utc)
         thirty_days_ago = now - timedelta(days=30)
         seven_days_ago = now - timedelta(days=7)
 
-        total_tenants = await self.session.scalar(select(func.count(Tenant.id)))
-        active_tenants = await self.session.scalar(
-            select(func.count(Tenant.id)).where(
-                Tenant.status == TenantStatus.ACTIVE.value
-            )
-        )
-        suspended_tenants = await self.session.scalar(
-            select(func.count(Tenant.id)).where(
-                Tenant.status == TenantStatus.SUSPENDED.value
-            )
-        )
-        pending_tenants = await self.session.scalar(
-            select(func.count(Tenant.id)).where(
-                Tenant.status == TenantStatus.PENDING.value
+        # One round trip: FILTERed aggregates over tenants, plus the user and
+        # employee totals as uncorrelated scalar subqueries (or estimates)
+        tenant_count = func.count()
+        user_count = self._total_rows_column(User)
+        employee_count = self._total_rows_column(Employee)
+        (
+            total_tenants,
+            active_tenants,
+            suspended_tenants,
+            pending_tenants,
+            total_users,
+            total_employees,
+            tenants_last_30_days,
+            tenants_last_7_days,
+        ) = (
+            await self.session.execute(
+                select(
+                    tenant_count,
+                    tenant_count.filter(Tenant.status == _ACTIVE),
+                    tenant_count.filter(Tenant.status == _SUSPENDED),
+                    tenant_count.filter(Tenant.status == _PENDING),
+                    user_count,
+                    employee_count,
+                    tenant_count.filter(Tenant.created_at >= thirty_days_ago),
+                    tenant_count.filter(Tenant.created_at >= seven_days_ago),
+                ).select_from(Tenant)
             )
-        )
-        total_users = await self.session.scalar(select(func.count(User.id)))
-        total_employees = await self.session.scalar(select(func.count(Employee.id)))
-        tenants_last_30_days = await self.session.scalar(
-            select(func.count(Tenant.id)).where(Tenant.created_at >= thirty_days_ago)
-        )
-        tenants_last_7_days = await self.session.scalar(
-            select(func.count(Tenant.id)).where(Tenant.created_at >= seven_days_ago)
-        )
+        ).one()
 
-        return PlatformStatsResponse(
-            total_tenants=total_tenants or 0,
-            active_tenants=active_tenants or 0,
-            suspended_tenants=suspended_tenants or 0,
-            pending_tenants=pending_tenants or 0,
-            total_users=total_users or 0,
-            total_employees=total_employees or 0,
-            tenants_created_last_30_days=tenants_last_30_days or 0,
-            tenants_created_last_7_days=tenants_last_7_days or 0,
+        stats = PlatformStatsResponse(
+            total_tenants=total_tenants,
+            active_tenants=active_tenants,
+            suspended_tenants=suspended_tenants,
+            pending_tenants=pending_tenants,
+            total_users=total_users,
+            total_employees=total_employees,
+            tenants_created_last_30_days=tenants_last_30_days,
+            tenants_created_last_7_days=tenants_last_7_days,
         )
+        await cache.set(PLATFORM_STATS_CACHE_KEY, stats, ttl=STATS_CACHE_TTL)
+        return stats
 
     async def create_tenant(self, data: TenantCreate) -> Tenant:
         """Create a new tenant."""
-        domain = data.domain.lower()
+        domain = data.domain
 
         if domain in settings.reserved_domains:
             raise EntityAlreadyExistsError("Tenant", f"Domain '{domain}' is reserved")
 
-        existing_domain = await self.session.scalar(
-            select(Tenant).where(Tenant.domain == domain)
-        )
-        if existing_domain:
-            raise EntityAlreadyExistsError("Tenant", domain)
-
-        existing_email = await self.session.scalar(
-            select(Tenant).where(Tenant.email == data.email)
-        )
-        if existing_email:
-            raise EntityAlreadyExistsError("Tenant", data.email)
-
         tenant = Tenant(
             name=data.name,
             domain=domain,
@@ -93,11 +144,24 @@ class PlatformService:
             postal_code=data.postal_code,
             timezone=data.timezone,
             currency=data.currency,
-            status=TenantStatus.PENDING.value,
+            status=_PENDING,
         )
-        self.session.add(tenant)
-        await self.session.flush()
-        await self.session.refresh(tenant)
+
+        # Unique indexes on domain and email guard the insert, so there are no
+        # racy pre-checks; only a conflict pays for the follow-up lookup
+        try:
+            async with self.session.begin_nested():
+                self.session.add(tenant)
+                await self.session.flush()
+        except IntegrityError:
+            taken_domain = await self.session.scalar(
+                select(Tenant.id).where(Tenant.domain == domain)
+            )
+            raise EntityAlreadyExistsError(
+                "Tenant", domain if taken_domain else data.email
+            )
+
+        invalidate_platform_stats(self.session)
         return tenant
 
     async def get_tenant(self, tenant_id: str) -> Tenant:
@@ -109,39 +173,52 @@ class PlatformService:
 
     async def get_tenant_by_domain(self, domain: str) -> Tenant:
         """Get tenant by domain."""
-        tenant = await self.session.scalar(
-            select(Tenant).where(Tenant.domain == domain.lower())
+        domain = domain.lower()
+        tenant: Tenant | None = await self.session.scalar(
+            lambda_stmt(lambda: select(Tenant).where(Tenant.domain == domain))
         )
         if not tenant:
             raise EntityNotFoundError("Tenant", domain)
         return tenant
 
+    async def _update_tenant(self, tenant_id: str, **values: Any) -> Tenant:
+        """Apply column values with one UPDATE ... RETURNING round trip."""
+        tenant = await self.session.scalar(
+            update(Tenant)
+            .where(Tenant.id == tenant_id)
+            .values(**values)
+            .returning(Tenant)
+            .execution_options(synchronize_session="fetch")
+        )
+        if not tenant:
+            raise EntityNotFoundError("Tenant", tenant_id)
+        invalidate_platform_stats(self.session, tenant_id)
+        await invalidate_tenant_info(tenant.domain)
+        return tenant
+
     async def update_tenant(self, tenant_id: str, data: TenantUpdate) -> Tenant:
         """Update tenant."""
-        tenant = await self.get_tenant(tenant_id)
-        update_data = data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(tenant, field, value)
-        await self.session.flush()
-        await self.session.refresh(tenant)
-        return tenant
+        # Email is unique; a savepoint keeps a clash from poisoning the session
+        try:
+            async with self.session.begin_nested():
+                return await self._update_tenant(
+                    tenant_id, **data.model_dump(exclude_unset=True)
+                )
+        except IntegrityError:
+            if "email" not in data.model_fields_set:
+                raise
+            raise EntityAlreadyExistsError("Tenant", data.email) from None
 
     async def activate_tenant(self, tenant_id: str) -> Tenant:
         """Activate a tenant."""
-        tenant = await self.get_tenant(tenant_id)
-        tenant.status = TenantStatus.ACTIVE.value
-        tenant.is_active = True
-        await self.session.flush()
-        await self.session.refresh(tenant)
-        return tenant
+        return await self._update_tenant(tenant_id, status=_ACTIVE, is_active=True)
 
     async def suspend_tenant(self, tenant_id: str) -> Tenant:
         """Suspend a tenant."""
-        tenant = await self.get_tenant(tenant_id)
-        tenant.status = TenantStatus.SUSPENDED.value
-        tenant.is_active = False
-        await self.session.flush()
-        await self.session.refresh(tenant)
+        tenant = await self._update_tenant(
+            tenant_id, status=_SUSPENDED, is_active=False
+        )
+        invalidate_tenant_domain(tenant.domain)
         return tenant
 
     async def delete_tenant(self, tenant_id: str) -> None:
@@ -149,27 +226,80 @@ class PlatformService:
         tenant = await self.get_tenant(tenant_id)
         await self.session.delete(tenant)
         await self.session.flush()
+        invalidate_tenant_domain(tenant.domain)
+        await invalidate_tenant_info(tenant.domain)
+        invalidate_platform_stats(self.session, tenant_id)
 
     async def get_tenant_stats(self, tenant_id: str) -> TenantStatsResponse | None:
         """Get statistics for a specific tenant."""
-        tenant = await self.session.get(Tenant, tenant_id)
-        if not tenant:
+        cache_key = _tenant_stats_cache_key(tenant_id)
+        cached = await cache.get(cache_key)
+        if cached is not None:
+            return TenantStatsResponse.model_validate(cached)
+
+        # Tenant row and both counts in one round trip
+        row = (
+            await self.session.execute(
+                select(
+                    Tenant,
+                    select(func.count(User.id))
+                    .where(User.tenant_id == tenant_id)
+                    .scalar_subquery(),
+                    select(func.count(Employee.id))
+                    .where(Employee.tenant_id == tenant_id)
+                    .scalar_subquery(),
+                ).where(Tenant.id == tenant_id)
+            )
+        ).one_or_none()
+        if row is None:
             return None
 
-        user_count = await self.session.scalar(
-            select(func.count(User.id)).where(User.tenant_id == tenant_id)
+        stats = self._to_tenant_stats(*row)
+        await cache.set(cache_key, stats, ttl=STATS_CACHE_TTL)
+        return stats
+
+    def _tenant_stats_select(self, *extra_columns: Any) -> Select[Any]:
+        """Select tenants with their user and employee counts.
+
+        The counts come from per-tenant grouped subqueries joined once, rather
+        than two COUNT queries per tenant row.
+        """
+        user_counts = (
+            select(User.tenant_id, func.count(User.id).label("cnt"))
+            .group_by(User.tenant_id)
+            .subquery()
+        )
+        employee_counts = (
+            select(Employee.tenant_id, func.count(Employee.id).label("cnt"))
+            .group_by(Employee.tenant_id)
+            .subquery()
         )
-        employee_count = await self.session.scalar(
-            select(func.count(Employee.id)).where(Employee.tenant_id == tenant_id)
+        return (
+            select(
+                Tenant,
+                func.coalesce(user_counts.c.cnt, 0),
+                func.coalesce(employee_counts.c.cnt, 0),
+                *extra_columns,
+            )
+            .outerjoin(user_counts, user_counts.c.tenant_id == Tenant.id)
+            .outerjoin(employee_counts, employee_counts.c.tenant_id == Tenant.id)
         )
 
-        return TenantStatsResponse(
+    @staticmethod
+    def _to_tenant_stats(
+        tenant: Tenant, user_count: int, employee_count: int
+    ) -> TenantStatsResponse:
+        """Build the stats response for a tenant row.
+
+        Every field comes from typed ORM columns, so validation is skipped.
+        """
+        return TenantStatsResponse.model_construct(
             tenant_id=tenant.id,
             tenant_name=tenant.name,
             domain=tenant.domain,
             status=tenant.status,
-            user_count=user_count or 0,
-            employee_count=employee_count or 0,
+            user_count=user_count,
+            employee_count=employee_count,
             created_at=tenant.created_at,
             last_activity=tenant.updated_at,
         )
@@ -180,37 +310,26 @@ class PlatformService:
         limit: int = 50,
     ) -> tuple[list[TenantStatsResponse], int]:
         """Get statistics for all tenants with pagination."""
-        result = await self.session.execute(
-            select(Tenant)
+        # The window count carries the unpaginated total on every page row;
+        # rows are streamed so large pages are never buffered twice
+        result = await self.session.stream(
+            self._tenant_stats_select(func.count().over())
+            .order_by(Tenant.created_at.desc())
             .offset(offset)
             .limit(limit)
-            .order_by(Tenant.created_at.desc())
+            .execution_options(yield_per=TENANT_STATS_BATCH_SIZE)
         )
-        tenants = result.scalars().all()
-        total = await self.session.scalar(select(func.count(Tenant.id)))
+        stats_list: list[TenantStatsResponse] = []
+        total = 0
+        async for tenant, user_count, employee_count, window_total in result:
+            total = window_total
+            stats_list.append(self._to_tenant_stats(tenant, user_count, employee_count))
 
-        stats_list = []
-        for tenant in tenants:
-            user_count = await self.session.scalar(
-                select(func.count(User.id)).where(User.tenant_id == tenant.id)
-            )
-            employee_count = await self.session.scalar(
-                select(func.count(Employee.id)).where(Employee.tenant_id == tenant.id)
-            )
-            stats_list.append(
-                TenantStatsResponse(
-                    tenant_id=tenant.id,
-                    tenant_name=tenant.name,
-                    domain=tenant.domain,
-                    status=tenant.status,
-                    user_count=user_count or 0,
-                    employee_count=employee_count or 0,
-                    created_at=tenant.created_at,
-                    last_activity=tenant.updated_at,
-                )
-            )
+        if not stats_list and offset:
+            # Past the last page there is no row to carry the total
+            total = await self.session.scalar(select(func.count(Tenant.id))) or 0
 
-        return stats_list, total or 0
+        return stats_list, total
 
     async def search_tenants(
         self,
@@ -219,7 +338,7 @@ class PlatformService:
         limit: int = 20,
     ) -> list[TenantStatsResponse]:
         """Search tenants by name or domain."""
-        stmt = select(Tenant).where(
+        stmt = self._tenant_stats_select().where(
             (Tenant.name.ilike(f"%{query}%")) | (Tenant.domain.ilike(f"%{query}%"))
         )
         if status:
@@ -227,27 +346,4 @@ class PlatformService:
         stmt = stmt.limit(limit).order_by(Tenant.name)
 
         result = await self.session.execute(stmt)
-        tenants = result.scalars().all()
-
-        stats_list = []
-        for tenant in tenants:
-            user_count = await self.session.scalar(
-                select(func.count(User.id)).where(User.tenant_id == tenant.id)
-            )
-            employee_count = await self.session.scalar(
-                select(func.count(Employee.id)).where(Employee.tenant_id == tenant.id)
-            )
-            stats_list.append(
-                TenantStatsResponse(
-                    tenant_id=tenant.id,
-                    tenant_name=tenant.name,
-                    domain=tenant.domain,
-                    status=tenant.status,
-                    user_count=user_count or 0,
-                    employee_count=employee_count or 0,
-                    created_at=tenant.created_at,
-                    last_activity=tenant.updated_at,
-                )
-            )
-
-        return stats_list
+        return [self._to_tenant_stats(*row) for row in result]
@@ -3,7 +3,8 @@
 from datetime import datetime
 from enum import Enum
 
-from sqlalchemy import Boolean, DateTime, Integer, String, Text
+from sqlalchemy import Boolean, DateTime, Index, Integer, String, Text, text
+from sqlalchemy import Enum as SqlEnum
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.shared.models import TenantBaseModel
@@ -33,6 +34,10 @@ class PolicyCategory(str, Enum):
     OTHER = "other"
 
 
+# Unique index on live policy names; conflicts on it mean "already exists"
+POLICY_NAME_INDEX = "uq_policies_tenant_name"
+
+
 class Policy(TenantBaseModel):
     """Policy document metadata model.
 
@@ -42,6 +47,41 @@ class Policy(TenantBaseModel):
 
     __tablename__ = "policies"
 
+    # Listings always filter by tenant first, then status, category or name
+    __table_args__ = (
+        Index("ix_policies_tenant_status", "tenant_id", "status"),
+        # Category listings filter on status too and page in name order, so
+        # the index yields a page without sorting every matching row
+        Index(
+            "ix_policies_tenant_category_status_name",
+            "tenant_id",
+            "category",
+            "status",
+            "name",
+            "id",
+        ),
+        Index("ix_policies_tenant_name", "tenant_id", "name"),
+        # Live policy names are unique per tenant regardless of case; archived
+        # ones keep their name so a replacement can reuse it
+        Index(
+            POLICY_NAME_INDEX,
+            "tenant_id",
+            text("lower(name)"),
+            unique=True,
+            postgresql_where=text("status <> 'archived'"),
+            sqlite_where=text("status <> 'archived'"),
+        ),
+        # Only the indexing backlog, in keyset order. The predicate matches
+        # is_indexed.is_(False) verbatim so even generic plans can use it.
+        Index(
+            "ix_policies_unindexed",
+            "tenant_id",
+            "id",
+            postgresql_where=text("is_indexed IS false"),
+        ),
+        {"extend_existing": True},
+    )
+
     name: Mapped[str] = mapped_column(
         String(255),
         nullable=False,
@@ -54,8 +94,9 @@ class Policy(TenantBaseModel):
         doc="Brief description of the policy",
     )
 
+    # category and status are native enums on PostgreSQL; the ORM reads strings
     category: Mapped[str] = mapped_column(
-        String(50),
+        SqlEnum(*(c.value for c in PolicyCategory), name="policy_category"),
         nullable=False,
         default=PolicyCategory.GENERAL.value,
         index=True,
@@ -88,7 +129,7 @@ class Policy(TenantBaseModel):
     )
 
     status: Mapped[str] = mapped_column(
-        String(20),
+        SqlEnum(*(s.value for s in PolicyStatus), name="policy_status"),
         nullable=False,
         default=PolicyStatus.ACTIVE.value,
         index=True,
@@ -1,10 +1,28 @@
 """Repository for policy data access."""
 
-from sqlalchemy import select
+from collections.abc import AsyncIterator
+from itertools import batched
+from typing import Any, cast
+
+from sqlalchemy import CursorResult, func, lambda_stmt, select, update
+from sqlalchemy.orm import raiseload
 
 from app.modules.policies.models import Policy, PolicyStatus
 from app.shared.repository import TenantRepository
 
+# Plain status strings, resolved from the enum once at import
+_POLICY_ACTIVE = PolicyStatus.ACTIVE.value
+_POLICY_ARCHIVED = PolicyStatus.ARCHIVED.value
+
+# Listings return plain rows; any relationship lazy load is a bug, so fail fast
+NO_LAZY_LOADS = raiseload("*")
+
+# Upper bound on bound parameters per IN list when loading policies by ID
+GET_BY_IDS_CHUNK_SIZE = 500
+
+# Policies loaded per keyset page while iterating unindexed policies
+UNINDEXED_BATCH_SIZE = 200
+
 
 class PolicyRepository(TenantRepository[Policy]):
     """Repository for Policy model."""
@@ -17,67 +35,156 @@ class PolicyRepository(TenantRepository[Policy]):
         include_archived: bool = False,
     ) -> list[Policy]:
         """Get policies by category."""
-        query = self._apply_tenant_filter(
-            select(Policy).where(Policy.category == category)
+        # Hot listings are lambda statements: construction and compilation are
+        # cached per call site, with closure variables bound as parameters
+        tenant_id = self.tenant_id
+        query = lambda_stmt(
+            lambda: (
+                select(Policy)
+                .options(NO_LAZY_LOADS)
+                .where(Policy.tenant_id == tenant_id, Policy.category == category)
+            )
         )
 
         if not include_archived:
-            query = query.where(Policy.status != PolicyStatus.ARCHIVED.value)
+            query += lambda s: s.where(Policy.status != _POLICY_ARCHIVED)
 
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
     async def get_active_policies(self) -> list[Policy]:
         """Get all active policies for the tenant."""
-        query = self._apply_tenant_filter(
-            select(Policy).where(Policy.status == PolicyStatus.ACTIVE.value)
+        tenant_id = self.tenant_id
+        query = lambda_stmt(
+            lambda: (
+                select(Policy)
+                .options(NO_LAZY_LOADS)
+                .where(
+                    Policy.tenant_id == tenant_id,
+                    Policy.status == _POLICY_ACTIVE,
+                )
+            )
         )
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
-    async def get_unindexed_policies(self) -> list[Policy]:
-        """Get policies that haven't been indexed."""
+    async def list_filtered(
+        self,
+        category: str | None = None,
+        status: str | None = None,
+        include_archived: bool = False,
+        offset: int = 0,
+        limit: int = 50,
+    ) -> tuple[list[Policy], int]:
+        """Get one page of policies and the total matching the filters.
+
+        Without a category only active policies are listed unless archived
+        ones are requested; a category listing hides archived policies only.
+        """
         query = self._apply_tenant_filter(
-            select(Policy).where(
-                Policy.status == PolicyStatus.ACTIVE.value,
-                Policy.is_indexed == False,  # noqa: E712
+            select(Policy, func.count().over()).options(NO_LAZY_LOADS)
+        )
+        if category:
+            query = query.where(Policy.category == category)
+            if not include_archived:
+                query = query.where(Policy.status != _POLICY_ARCHIVED)
+        elif not include_archived:
+            query = query.where(Policy.status == _POLICY_ACTIVE)
+        if status:
+            query = query.where(Policy.status == status)
+
+        # The window count carries the total on every row of the page
+        result = await self.session.execute(
+            query.order_by(Policy.name, Policy.id).offset(offset).limit(limit)
+        )
+        policies: list[Policy] = []
+        total = 0
+        for policy, window_total in result:
+            total = window_total
+            policies.append(policy)
+
+        if not policies and offset:
+            # Past the last page there is no row to carry the total
+            total = (
+                await self.session.scalar(
+                    select(func.count()).select_from(
+                        query.with_only_columns(Policy.id).subquery()
+                    )
+                )
+                or 0
+            )
+        return policies, total
+
+    async def iter_unindexed_policies(
+        self,
+        batch_size: int = UNINDEXED_BATCH_SIZE,
+    ) -> AsyncIterator[Policy]:
+        """Yield unindexed active policies in ID order, one page at a time.
+
+        Pages are keyed on the last ID seen rather than an offset, so policies
+        indexed (or failing) between pages never shift or repeat the window.
+        """
+        last_id = ""
+        while True:
+            query = self._apply_tenant_filter(
+                select(Policy)
+                .where(
+                    Policy.status == _POLICY_ACTIVE,
+                    Policy.is_indexed.is_(False),
+                    Policy.id > last_id,
+                )
+                .order_by(Policy.id)
+                .limit(batch_size)
             )
+            result = await self.session.execute(query)
+            page = list(result.scalars())
+            for policy in page:
+                yield policy
+
+            if len(page) < batch_size:
+                return
+            last_id = page[-1].id
+
+    async def reset_index_state(self) -> int:
+        """Mark every policy of the tenant unindexed in one UPDATE.
+
+        Returns the number of policies reset.
+        """
+        result = cast(
+            CursorResult[Any],
+            await self.session.execute(
+                update(Policy)
+                .where(Policy.tenant_id == self.tenant_id)
+                .values(is_indexed=False, indexed_at=None, chunk_count=0)
+            ),
         )
-        result = await self.session.execute(query)
-        return list(result.scalars().all())
+        return result.rowcount
 
     async def get_by_ids(self, policy_ids: list[str]) -> list[Policy]:
         """Get policies by list of IDs."""
         if not policy_ids:
             return []
 
-        query = self._apply_tenant_filter(
-            select(Policy).where(Policy.id.in_(policy_ids))
-        )
-        result = await self.session.execute(query)
-        return list(result.scalars().all())
+        # Chunk long ID lists so no single statement carries thousands of
+        # parameters; a session runs statements one at a time anyway
+        policies: list[Policy] = []
+        for chunk in batched(policy_ids, GET_BY_IDS_CHUNK_SIZE):
+            query = self._apply_tenant_filter(
+                select(Policy).where(Policy.id.in_(chunk))
+            )
+            result = await self.session.execute(query)
+            policies.extend(result.scalars())
+        return policies
 
     async def search_by_name(self, search_term: str) -> list[Policy]:
         """Search policies by name."""
         query = self._apply_tenant_filter(
-            select(Policy).where(
+            select(Policy)
+            .options(NO_LAZY_LOADS)
+            .where(
                 Policy.name.ilike(f"%{search_term}%"),
-                Policy.status != PolicyStatus.ARCHIVED.value,
+                Policy.status != _POLICY_ARCHIVED,
             )
         )
         result = await self.session.execute(query)
         return list(result.scalars().all())
-
-    async def get_by_name(
-        self,
-        name: str,
-        exclude_archived: bool = True,
-    ) -> Policy | None:
-        """Get policy by exact name (case-insensitive)."""
-        query = self._apply_tenant_filter(select(Policy).where(Policy.name.ilike(name)))
-
-        if exclude_archived:
-            query = query.where(Policy.status != PolicyStatus.ARCHIVED.value)
-
-        result = await self.session.execute(query)
-        return result.scalar_one_or_none()
@@ -4,11 +4,13 @@ import logging
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, File, Form, UploadFile, status
+from pydantic import TypeAdapter
 
 from app.core.database import DbSession
 from app.core.rate_limit import rate_limit
 from app.core.security import CurrentUser
 from app.core.tenancy import TenantDep
+from app.modules.policies.models import Policy
 from app.modules.policies.schemas import (
     PolicyCategory,
     PolicyCreate,
@@ -26,6 +28,20 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/policies", tags=["Policies"])
 
+# Built once so list pages validate in a single call rather than per item
+_POLICY_SUMMARIES = TypeAdapter(list[PolicySummary])
+_POLICY_RESPONSE_FIELDS = tuple(PolicyResponse.model_fields)
+
+
+def _to_policy_response(policy: Policy) -> PolicyResponse:
+    """Build a response from a loaded policy without re-validating it.
+
+    Every field maps to a typed ORM column of the same name.
+    """
+    return PolicyResponse.model_construct(
+        **{name: getattr(policy, name) for name in _POLICY_RESPONSE_FIELDS}
+    )
+
 
 def get_service(tenant: TenantDep, session: DbSession) -> PolicyService:
     """Dependency to create policy service."""
@@ -52,8 +68,6 @@ async def upload_policy(
 
     Supported file types: .txt, .md, .pdf
     """
-    content = await file.read()
-
     metadata = PolicyCreate(
         name=name,
         description=description,
@@ -62,12 +76,13 @@ async def upload_policy(
     )
 
     policy = await service.upload_policy(
-        file_content=content,
+        # Starlette spools large uploads to disk; copy from there in chunks
+        file=file.file,
         file_name=file.filename or "policy.txt",
         metadata=metadata,
     )
 
-    return PolicyResponse.model_validate(policy)
+    return _to_policy_response(policy)
 
 
 @router.get(
@@ -93,8 +108,8 @@ async def list_policies(
         limit=page_size,
     )
 
-    items = [PolicySummary.model_validate(p) for p in policies]
-    return PaginatedResponse.create(items, total, page, page_size)
+    items = _POLICY_SUMMARIES.validate_python(policies, from_attributes=True)
+    return PaginatedResponse[PolicySummary].create(items, total, page, page_size)
 
 
 @router.get(
@@ -123,7 +138,7 @@ async def get_policy(
 ) -> PolicyResponse:
     """Get details of a specific policy."""
     policy = await service.get_policy(policy_id)
-    return PolicyResponse.model_validate(policy)
+    return _to_policy_response(policy)
 
 
 @router.patch(
@@ -140,7 +155,7 @@ async def update_policy(
 ) -> PolicyResponse:
     """Update policy metadata. Triggers re-indexing if content-related fields change."""
     policy = await service.update_policy(policy_id, update_data)
-    return PolicyResponse.model_validate(policy)
+    return _to_policy_response(policy)
 
 
 @router.delete(
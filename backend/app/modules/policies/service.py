@@ -1,16 +1,28 @@
 """Service layer for policy management."""
 
+import asyncio
 import logging
+import shutil
+from collections.abc import AsyncIterator
 from datetime import datetime, timezone
+from functools import cached_property
 from pathlib import Path
-from typing import Any
+from secrets import token_hex
+from typing import Any, BinaryIO
 
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.ai.rag.document_loader import ChunkingConfig, DocumentLoader
-from app.ai.rag.vectorstore import PolicyVectorStore
-from app.core.exceptions import EntityAlreadyExistsError, ValidationError
-from app.modules.policies.models import Policy, PolicyStatus
+from app.ai.rag.document_loader import ChunkingConfig, DocumentChunk, DocumentLoader
+from app.ai.rag.embeddings import get_embedding_config
+from app.ai.rag.vectorstore import PolicyVectorStore, get_tenant_vectorstore
+from app.core.exceptions import (
+    EntityAlreadyExistsError,
+    EntityNotFoundError,
+    ValidationError,
+)
+from app.modules.policies.models import POLICY_NAME_INDEX, Policy, PolicyStatus
 from app.modules.policies.repository import PolicyRepository
 from app.modules.policies.schemas import PolicyCreate, PolicyUpdate
 
@@ -19,6 +31,27 @@ logger = logging.getLogger(__name__)
 
 POLICIES_BASE_DIR = Path("data/policies")
 
+# Uploads are copied in chunks so a document is never held in memory whole
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Policy files read and chunked at once during a bulk index, and how many
+# policies are gathered into one loading window
+INDEX_LOAD_CONCURRENCY = 8
+INDEX_LOAD_WINDOW = 32
+
+# Policy fields copied into every indexed chunk's metadata
+INDEXED_METADATA_FIELDS = frozenset({"name", "category", "version"})
+
+# Loading holds no per-request state, so one loader serves every service
+DOCUMENT_LOADER = DocumentLoader(
+    ChunkingConfig(chunk_size=1000, chunk_overlap=200, deduplicate=True)
+)
+
+
+def _is_name_conflict(error: IntegrityError) -> bool:
+    """Whether an integrity error came from the unique live-name index."""
+    return POLICY_NAME_INDEX in str(error.orig)
+
 
 def get_tenant_policy_dir(tenant_id: str) -> Path:
     """Get the policy directory for a tenant."""
@@ -27,6 +60,14 @@ def get_tenant_policy_dir(tenant_id: str) -> Path:
     return path
 
 
+def _write_upload(source: BinaryIO, destination: Path) -> int:
+    """Copy an uploaded file to disk in chunks and return its size in bytes."""
+    source.seek(0)
+    with open(destination, "wb") as f:
+        shutil.copyfileobj(source, f, UPLOAD_CHUNK_SIZE)
+        return f.tell()
+
+
 class PolicyService:
     """Service for managing policies and their indexing."""
 
@@ -34,17 +75,20 @@ class PolicyService:
         self.session = session
         self.tenant_id = tenant_id
         self.repo = PolicyRepository(session, tenant_id)
-        self.vectorstore = PolicyVectorStore(tenant_id)
-        self.document_loader = DocumentLoader(
-            ChunkingConfig(
-                chunk_size=1000,
-                chunk_overlap=200,
-            )
-        )
+        self.document_loader = DOCUMENT_LOADER
+
+    @cached_property
+    def vectorstore(self) -> PolicyVectorStore:
+        """Tenant vector store, resolved only by operations that need it.
+
+        Metadata-only requests (listing, reading, updating) never open the
+        Chroma client.
+        """
+        return get_tenant_vectorstore(self.tenant_id)
 
     async def upload_policy(
         self,
-        file_content: bytes,
+        file: BinaryIO,
         file_name: str,
         metadata: PolicyCreate,
     ) -> Policy:
@@ -57,19 +101,11 @@ class PolicyService:
                 f"Supported: {DocumentLoader.SUPPORTED_EXTENSIONS}"
             )
 
-        existing = await self.repo.get_by_name(metadata.name)
-        if existing:
-            raise EntityAlreadyExistsError("Policy", metadata.name)
-
         policy_dir = get_tenant_policy_dir(self.tenant_id)
-
-        import uuid
-
-        unique_name = f"{uuid.uuid4().hex[:8]}_{file_name}"
+        unique_name = f"{token_hex(4)}_{file_name}"
         file_path = policy_dir / unique_name
 
-        with open(file_path, "wb") as f:
-            f.write(file_content)
+        file_size = await asyncio.to_thread(_write_upload, file, file_path)
 
         policy = Policy(
             tenant_id=self.tenant_id,
@@ -79,7 +115,7 @@ class PolicyService:
             file_path=str(file_path.relative_to(POLICIES_BASE_DIR.parent)),
             file_name=file_name,
             file_type=file_ext.lstrip("."),
-            file_size=len(file_content),
+            file_size=file_size,
             version=metadata.version,
             effective_date=metadata.effective_date,
             expiry_date=metadata.expiry_date,
@@ -87,9 +123,17 @@ class PolicyService:
             is_indexed=False,
         )
 
-        self.session.add(policy)
-        await self.session.flush()
-        await self.session.refresh(policy)
+        # The unique name index decides duplicates atomically; only a losing
+        # upload pays for removing its file again
+        try:
+            async with self.session.begin_nested():
+                self.session.add(policy)
+                await self.session.flush()
+        except IntegrityError as error:
+            await asyncio.to_thread(file_path.unlink, missing_ok=True)
+            if not _is_name_conflict(error):
+                raise
+            raise EntityAlreadyExistsError("Policy", metadata.name) from None
 
         logger.info(
             "Policy '%s' uploaded for tenant %s (file: %s)",
@@ -113,45 +157,55 @@ class PolicyService:
         limit: int = 50,
     ) -> tuple[list[Policy], int]:
         """List policies with optional filtering."""
-        if category:
-            policies = await self.repo.get_by_category(category, include_archived)
-        else:
-            policies = await self.repo.get_active_policies()
-            if include_archived:
-                policies = await self.repo.get_all(offset=0, limit=1000)
-
-        if status:
-            policies = [p for p in policies if p.status == status]
-
-        total = len(policies)
-        policies = policies[offset : offset + limit]
-
-        return policies, total
+        return await self.repo.list_filtered(
+            category=category,
+            status=status,
+            include_archived=include_archived,
+            offset=offset,
+            limit=limit,
+        )
 
     async def update_policy(
         self,
         policy_id: str,
         update_data: PolicyUpdate,
     ) -> Policy:
-        """Update policy metadata."""
-        policy = await self.repo.get_by_id_or_raise(policy_id)
-
+        """Update policy metadata with one UPDATE ... RETURNING round trip."""
         updates = update_data.model_dump(exclude_unset=True)
+        if not updates:
+            return await self.repo.get_by_id_or_raise(policy_id)
 
         if "category" in updates and updates["category"]:
             updates["category"] = updates["category"].value
         if "status" in updates and updates["status"]:
             updates["status"] = updates["status"].value
 
-        for field, value in updates.items():
-            setattr(policy, field, value)
+        # Stale chunk metadata needs a reindex; reset it in the same UPDATE
+        if updates.keys() & INDEXED_METADATA_FIELDS:
+            updates["is_indexed"] = False
 
-        await self.session.flush()
-        await self.session.refresh(policy)
-
-        if policy.is_indexed:
-            policy.is_indexed = False
-            await self.session.flush()
+        statement = (
+            update(Policy)
+            .where(Policy.tenant_id == self.tenant_id, Policy.id == policy_id)
+            .values(**updates)
+            .returning(Policy)
+            .execution_options(synchronize_session="fetch")
+        )
+        if updates.keys() & {"name", "status"}:
+            # Renaming or un-archiving can collide with a live policy's name
+            try:
+                async with self.session.begin_nested():
+                    policy = await self.session.scalar(statement)
+            except IntegrityError as error:
+                if not _is_name_conflict(error):
+                    raise
+                raise EntityAlreadyExistsError(
+                    "Policy", updates.get("name", policy_id)
+                ) from None
+        else:
+            policy = await self.session.scalar(statement)
+        if not policy:
+            raise EntityNotFoundError("Policy", policy_id)
 
         logger.info("Policy '%s' updated", policy.name)
         return policy
@@ -160,12 +214,14 @@ class PolicyService:
         """Delete a policy and its indexed data."""
         policy = await self.repo.get_by_id_or_raise(policy_id)
 
-        self.vectorstore.delete_policy(policy_id)
+        await asyncio.to_thread(self.vectorstore.delete_policy, policy_id)
 
         file_path = POLICIES_BASE_DIR.parent / policy.file_path
-        if file_path.exists():
-            file_path.unlink()
+        try:
+            await asyncio.to_thread(file_path.unlink)
             logger.info("Deleted policy file: %s", file_path)
+        except FileNotFoundError:
+            pass
 
         await self.session.delete(policy)
         await self.session.flush()
@@ -183,14 +239,111 @@ class PolicyService:
             logger.info("Policy '%s' already indexed, skipping", policy.name)
             return policy.chunk_count
 
+        chunks = await self._load_chunks(policy, force)
+        chunk_count = await asyncio.to_thread(
+            self.vectorstore.add_chunks, chunks, policy.id
+        )
+        self._mark_indexed(policy, chunk_count)
+        await self.session.flush()
+
+        return chunk_count
+
+    async def index_all_policies(
+        self,
+        policy_ids: list[str] | None = None,
+        force: bool = False,
+    ) -> dict[str, Any]:
+        """Index multiple policies.
+
+        Policy files are loaded concurrently, chunks from several policies are
+        embedded together one vector store batch at a time, and every index
+        state change is flushed once.
+
+        Returns summary of indexing operation.
+        """
+        summary: dict[str, Any] = {
+            "indexed_count": 0,
+            "total_chunks": 0,
+            "policies": [],
+            "errors": [],
+        }
+        batch_size = get_embedding_config().batch_size
+        pending: list[tuple[Policy, list[DocumentChunk]]] = []
+        pending_chunks = 0
+
+        async def queue_window(window: list[Policy]) -> None:
+            nonlocal pending, pending_chunks
+            results = await self._load_window(window, force)
+            for policy, chunks in zip(window, results, strict=True):
+                if isinstance(chunks, BaseException):
+                    if not isinstance(chunks, Exception):
+                        # Cancellation is not a per-policy failure
+                        raise chunks
+                    self._record_error(summary, policy, chunks)
+                    continue
+
+                pending.append((policy, chunks))
+                pending_chunks += len(chunks)
+                if pending_chunks >= batch_size:
+                    await self._store_pending(pending, summary)
+                    pending = []
+                    pending_chunks = 0
+
+        # Each keyset page is a query; on an autoflushing session it would
+        # flush the index state changes made so far, once per page
+        with self.session.no_autoflush:
+            window: list[Policy] = []
+            async for policy in self._iter_policies_to_index(policy_ids, force):
+                if policy.is_indexed and not force:
+                    logger.info("Policy '%s' already indexed, skipping", policy.name)
+                    self._record_indexed(summary, policy, policy.chunk_count)
+                    continue
+
+                window.append(policy)
+                if len(window) >= INDEX_LOAD_WINDOW:
+                    await queue_window(window)
+                    window = []
+
+            await queue_window(window)
+            await self._store_pending(pending, summary)
+
+        # One flush writes every index state change as a single executemany
+        await self.session.flush()
+
+        return summary
+
+    async def _load_window(
+        self,
+        policies: list[Policy],
+        force: bool,
+    ) -> list[list[DocumentChunk] | BaseException]:
+        """Load several policy files concurrently, in the order given.
+
+        Loading never touches the session, so overlapping it is safe; a
+        failure is returned in place of that policy's chunks.
+        """
+        semaphore = asyncio.Semaphore(INDEX_LOAD_CONCURRENCY)
+
+        async def load(policy: Policy) -> list[DocumentChunk]:
+            async with semaphore:
+                return await self._load_chunks(policy, force)
+
+        return await asyncio.gather(
+            *(load(policy) for policy in policies), return_exceptions=True
+        )
+
+    async def _load_chunks(self, policy: Policy, force: bool) -> list[DocumentChunk]:
+        """Read and chunk a policy file, dropping stale vectors on reindex."""
         file_path = POLICIES_BASE_DIR.parent / policy.file_path
         if not file_path.exists():
             raise ValidationError(f"Policy file not found: {file_path}")
 
         if force and policy.is_indexed:
-            self.vectorstore.delete_policy(policy_id)
+            await asyncio.to_thread(self.vectorstore.delete_policy, policy.id)
 
-        chunks = self.document_loader.load_and_chunk(
+        # Loading and parsing (PDFs especially) is blocking file I/O
+        return await asyncio.to_thread(
+            self.document_loader.load_and_chunk,
             file_path,
             metadata={
                 "policy_id": policy.id,
@@ -200,12 +353,36 @@ class PolicyService:
             },
         )
 
-        chunk_count = self.vectorstore.add_chunks(chunks, policy_id)
-
+    async def _store_pending(
+        self,
+        pending: list[tuple[Policy, list[DocumentChunk]]],
+        summary: dict[str, Any],
+    ) -> None:
+        """Embed and store buffered chunks, recording the outcome per policy."""
+        if not pending:
+            return
+
+        try:
+            # Embedding is a blocking network call; keep the loop free
+            counts = await asyncio.to_thread(
+                self.vectorstore.add_chunks_batch,
+                {policy.id: chunks for policy, chunks in pending},
+            )
+        except Exception as e:
+            for policy, _ in pending:
+                self._record_error(summary, policy, e)
+            return
+
+        for policy, _ in pending:
+            self._mark_indexed(policy, counts[policy.id])
+            self._record_indexed(summary, policy, counts[policy.id])
+
+    @staticmethod
+    def _mark_indexed(policy: Policy, chunk_count: int) -> None:
+        """Record a completed index on the policy; the caller flushes."""
         policy.is_indexed = True
         policy.indexed_at = datetime.now(timezone.utc)
         policy.chunk_count = chunk_count
-        await self.session.flush()
 
         logger.info(
             "Policy '%s' indexed with %d chunks",
@@ -213,46 +390,37 @@ class PolicyService:
             chunk_count,
         )
 
-        return chunk_count
-
-    async def index_all_policies(
+    @staticmethod
+    def _record_indexed(
+        summary: dict[str, Any], policy: Policy, chunk_count: int
+    ) -> None:
+        summary["indexed_count"] += 1
+        summary["total_chunks"] += chunk_count
+        summary["policies"].append(policy.name)
+
+    @staticmethod
+    def _record_error(
+        summary: dict[str, Any], policy: Policy, error: Exception
+    ) -> None:
+        logger.error("Failed to index policy '%s': %s", policy.name, error)
+        summary["errors"].append(f"{policy.name}: {str(error)}")
+
+    async def _iter_policies_to_index(
         self,
-        policy_ids: list[str] | None = None,
-        force: bool = False,
-    ) -> dict[str, Any]:
-        """Index multiple policies.
-
-        Returns summary of indexing operation.
-        """
+        policy_ids: list[str] | None,
+        force: bool,
+    ) -> AsyncIterator[Policy]:
+        """Yield the policies an indexing run should process."""
         if policy_ids:
-            policies = await self.repo.get_by_ids(policy_ids)
+            for policy in await self.repo.get_by_ids(policy_ids):
+                yield policy
+        elif force:
+            for policy in await self.repo.get_active_policies():
+                yield policy
         else:
-            if force:
-                policies = await self.repo.get_active_policies()
-            else:
-                policies = await self.repo.get_unindexed_policies()
-
-        indexed_count = 0
-        total_chunks = 0
-        indexed_policies = []
-        errors = []
-
-        for policy in policies:
-            try:
-                chunks = await self.index_policy(policy.id, force)
-                indexed_count += 1
-                total_chunks += chunks
-                indexed_policies.append(policy.name)
-            except Exception as e:
-                logger.error("Failed to index policy '%s': %s", policy.name, e)
-                errors.append(f"{policy.name}: {str(e)}")
-
-        return {
-            "indexed_count": indexed_count,
-            "total_chunks": total_chunks,
-            "policies": indexed_policies,
-            "errors": errors,
-        }
+            # Unindexed policies are paged so large backlogs stay O(batch)
+            async for policy in self.repo.iter_unindexed_policies():
+                yield policy
 
     def get_vectorstore_stats(self) -> dict[str, Any]:
         """Get vector store statistics."""
@@ -265,13 +433,8 @@ class PolicyService:
         """
         deleted = self.vectorstore.clear()
 
-        policies = await self.repo.get_active_policies()
-        for policy in policies:
-            policy.is_indexed = False
-            policy.indexed_at = None
-            policy.chunk_count = 0
-
-        await self.session.flush()
+        # The collection held chunks of every policy, not only active ones
+        await self.repo.reset_index_state()
 
         logger.info(
             "Cleared vector store for tenant %s (%d chunks)",
@@ -3,7 +3,8 @@
 from enum import Enum
 
 from sqlalchemy import Boolean, String, Text
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import Enum as SqlEnum
+from sqlalchemy.orm import Mapped, mapped_column, validates
 
 from app.shared.models import BaseModel, TimestampMixin
 
@@ -39,7 +40,9 @@ class Tenant(BaseModel, TimestampMixin):
     )
 
     # Contact
-    email: Mapped[str] = mapped_column(String(255), nullable=False)
+    email: Mapped[str] = mapped_column(
+        String(255), unique=True, nullable=False, index=True
+    )
     phone: Mapped[str | None] = mapped_column(String(50), nullable=True)
 
     # Address
@@ -55,8 +58,9 @@ class Tenant(BaseModel, TimestampMixin):
         default=SubscriptionPlan.FREE.value,
         nullable=False,
     )
+    # tenant_status enum on PostgreSQL, VARCHAR elsewhere
     status: Mapped[str] = mapped_column(
-        String(50),
+        SqlEnum(*(s.value for s in TenantStatus), name="tenant_status"),
         default=TenantStatus.PENDING.value,
         nullable=False,
     )
@@ -79,5 +83,10 @@ class Tenant(BaseModel, TimestampMixin):
     # users = relationship("User", back_populates="tenant")
     # employees = relationship("Employee", back_populates="tenant")
 
+    @validates("domain")
+    def _normalize_domain(self, _key: str, domain: str) -> str:
+        # Stored lowercase so lookups compare the plain indexed column
+        return domain.strip().lower()
+
     def __repr__(self) -> str:
         return f"<Tenant {self.name} ({self.domain})>"
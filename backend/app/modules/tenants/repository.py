@@ -1,6 +1,6 @@
 """Tenant repository."""
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.modules.tenants.models import Tenant
@@ -22,6 +22,30 @@ class TenantRepository(BaseRepository[Tenant]):
         )
         return result.scalar_one_or_none()
 
+    async def list_with_total(
+        self,
+        offset: int = 0,
+        limit: int = 100,
+    ) -> tuple[list[Tenant], int]:
+        """Get one page of tenants, newest first, and the total count."""
+        # The window count carries the total on every row of the page
+        result = await self.session.execute(
+            select(Tenant, func.count().over())
+            .order_by(Tenant.created_at.desc(), Tenant.id)
+            .offset(offset)
+            .limit(limit)
+        )
+        tenants: list[Tenant] = []
+        total = 0
+        for tenant, window_total in result:
+            total = window_total
+            tenants.append(tenant)
+
+        if not tenants and offset:
+            # Past the last page there is no row to carry the total
+            total = await self.count()
+        return tenants, total
+
     async def get_by_email(self, email: str) -> Tenant | None:
         """Get tenant by email."""
         result = await self.session.execute(select(Tenant).where(Tenant.email == email))
@@ -8,11 +8,13 @@ the platform module (/api/v1/platform/tenants/*).
 from fastapi import APIRouter, Request
 from sqlalchemy import select
 
+from app.core.cache import cache
 from app.core.database import DbSession
 from app.core.exceptions import EntityNotFoundError
 from app.core.tenancy import extract_domain_from_host
 from app.modules.tenants.models import Tenant
 from app.modules.tenants.schemas import TenantPublicInfo
+from app.modules.tenants.service import TENANT_INFO_CACHE_TTL, tenant_info_cache_key
 
 router = APIRouter(prefix="/tenants", tags=["Tenants"])
 
@@ -35,18 +37,26 @@ async def get_tenant_info(
     host = request.headers.get("host", "")
     domain = extract_domain_from_host(host)
 
-    result = await session.execute(
-        select(Tenant).where(Tenant.domain == domain.lower())
-    )
-    tenant = result.scalar_one_or_none()
-
-    if not tenant:
+    cache_key = tenant_info_cache_key(domain)
+    cached = await cache.get(cache_key)
+    if cached is not None:
+        return TenantPublicInfo.model_validate(cached)
+
+    row = (
+        await session.execute(
+            select(
+                Tenant.id,
+                Tenant.name,
+                Tenant.domain,
+                Tenant.logo_url,
+                Tenant.primary_color,
+            ).where(Tenant.domain == domain)
+        )
+    ).one_or_none()
+
+    if not row:
         raise EntityNotFoundError("Tenant", domain)
 
-    return TenantPublicInfo(
-        id=tenant.id,
-        name=tenant.name,
-        domain=tenant.domain,
-        logo_url=tenant.logo_url,
-        primary_color=tenant.primary_color,
-    )
+    info = TenantPublicInfo.model_validate(row._mapping)
+    await cache.set(cache_key, info, ttl=TENANT_INFO_CACHE_TTL)
+    return info
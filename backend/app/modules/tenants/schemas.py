@@ -1,12 +1,30 @@
 """Tenant schemas."""
 
-import re
 from enum import Enum
 
 from pydantic import EmailStr, Field, field_validator
 
 from app.shared.schemas import BaseEntitySchema, BaseSchema
 
+_DOMAIN_LABEL_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789-")
+_MAX_DOMAIN_LABEL_LENGTH = 63
+HEX_COLOR_PATTERN = r"^#[0-9A-Fa-f]{6}$"
+
+
+def is_valid_domain(domain: str) -> bool:
+    """Check a lowercase domain has two or more well-formed labels.
+
+    Each label is 1-63 characters of a-z, 0-9 and inner hyphens.
+    """
+    labels = domain.split(".")
+    return len(labels) >= 2 and all(
+        0 < len(label) <= _MAX_DOMAIN_LABEL_LENGTH
+        and label[0] != "-"
+        and label[-1] != "-"
+        and _DOMAIN_LABEL_CHARS.issuperset(label)
+        for label in labels
+    )
+
 
 class SubscriptionPlan(str, Enum):
     """Subscription plans."""
@@ -51,9 +69,7 @@ class TenantCreate(BaseSchema):
     def validate_domain(cls, v: str) -> str:
         """Validate and normalize domain."""
         v = v.lower().strip()
-        # Basic domain validation
-        pattern = r"^[a-z0-9]([a-z0-9-]*[a-z0-9])?(\.[a-z0-9]([a-z0-9-]*[a-z0-9])?)+$"
-        if not re.match(pattern, v):
+        if not is_valid_domain(v):
             raise ValueError("Invalid domain format")
         return v
 
@@ -79,7 +95,7 @@ class TenantUpdate(BaseSchema):
 
     # Branding
     logo_url: str | None = Field(default=None, max_length=500)
-    primary_color: str | None = Field(default=None, pattern=r"^#[0-9A-Fa-f]{6}$")
+    primary_color: str | None = Field(default=None, pattern=HEX_COLOR_PATTERN)
 
 
 class TenantResponse(BaseEntitySchema):
@@ -1,12 +1,30 @@
 """Tenant service - business logic layer."""
 
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import cache
 from app.core.config import settings
 from app.core.exceptions import EntityAlreadyExistsError, EntityNotFoundError
+from app.core.tenancy import invalidate_tenant_domain
 from app.modules.tenants.models import Tenant, TenantStatus
 from app.modules.tenants.repository import TenantRepository
 from app.modules.tenants.schemas import TenantCreate, TenantUpdate
+from app.shared.schemas import apply_patch
+
+# Public branding is read on every frontend page load and rarely changes,
+# so it is shared across workers through Redis briefly
+TENANT_INFO_CACHE_TTL = 60
+
+
+def tenant_info_cache_key(domain: str) -> str:
+    """Cache key for a domain's public tenant info."""
+    return f"tenants:info:{domain}"
+
+
+async def invalidate_tenant_info(domain: str) -> None:
+    """Drop the cached public info for a tenant domain."""
+    await cache.delete(tenant_info_cache_key(domain))
 
 
 class TenantService:
@@ -18,21 +36,12 @@ class TenantService:
 
     async def create_tenant(self, data: TenantCreate) -> Tenant:
         """Create a new tenant."""
-        domain = data.domain.lower()
+        domain = data.domain
 
         # Check if domain is reserved
         if domain in settings.reserved_domains:
             raise EntityAlreadyExistsError("Tenant", f"Domain '{domain}' is reserved")
 
-        # Check if domain exists
-        if await self.repository.domain_exists(domain):
-            raise EntityAlreadyExistsError("Tenant", domain)
-
-        # Check if email exists
-        existing = await self.repository.get_by_email(data.email)
-        if existing:
-            raise EntityAlreadyExistsError("Tenant", data.email)
-
         tenant = Tenant(
             name=data.name,
             domain=domain,
@@ -48,7 +57,19 @@ class TenantService:
             status=TenantStatus.PENDING.value,
         )
 
-        return await self.repository.create(tenant)
+        # Domain and email are unique indexes, so the insert itself is the
+        # existence check; only a conflict looks up which one was taken
+        try:
+            async with self.session.begin_nested():
+                self.session.add(tenant)
+                await self.session.flush()
+        except IntegrityError:
+            taken_domain = await self.repository.domain_exists(domain)
+            raise EntityAlreadyExistsError(
+                "Tenant", domain if taken_domain else data.email
+            ) from None
+
+        return tenant
 
     async def get_tenant(self, tenant_id: str) -> Tenant:
         """Get tenant by ID."""
@@ -59,7 +80,7 @@ class TenantService:
 
     async def get_tenant_by_domain(self, domain: str) -> Tenant:
         """Get tenant by domain."""
-        tenant = await self.repository.get_by_domain(domain.lower())
+        tenant = await self.repository.get_by_domain(domain)
         if not tenant:
             raise EntityNotFoundError("Tenant", domain)
         return tenant
@@ -72,11 +93,17 @@ class TenantService:
         """Update tenant."""
         tenant = await self.get_tenant(tenant_id)
 
-        update_data = data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(tenant, field, value)
-
-        return await self.repository.update(tenant)
+        # Email is unique; a savepoint keeps a clash from poisoning the session
+        try:
+            async with self.session.begin_nested():
+                apply_patch(tenant, data)
+                tenant = await self.repository.update(tenant)
+        except IntegrityError:
+            if "email" not in data.model_fields_set:
+                raise
+            raise EntityAlreadyExistsError("Tenant", data.email) from None
+        await invalidate_tenant_info(tenant.domain)
+        return tenant
 
     async def activate_tenant(self, tenant_id: str) -> Tenant:
         """Activate a tenant."""
@@ -90,7 +117,10 @@ class TenantService:
         tenant = await self.get_tenant(tenant_id)
         tenant.status = TenantStatus.SUSPENDED.value
         tenant.is_active = False
-        return await self.repository.update(tenant)
+        tenant = await self.repository.update(tenant)
+        invalidate_tenant_domain(tenant.domain)
+        await invalidate_tenant_info(tenant.domain)
+        return tenant
 
     async def list_tenants(
         self,
@@ -98,11 +128,11 @@ class TenantService:
         limit: int = 100,
     ) -> tuple[list[Tenant], int]:
         """List all tenants with count."""
-        tenants = await self.repository.get_all(offset=offset, limit=limit)
-        total = await self.repository.count()
-        return tenants, total
+        return await self.repository.list_with_total(offset=offset, limit=limit)
 
     async def delete_tenant(self, tenant_id: str) -> None:
         """Delete a tenant (soft delete recommended in production)."""
         tenant = await self.get_tenant(tenant_id)
         await self.repository.delete(tenant)
+        invalidate_tenant_domain(tenant.domain)
+        await invalidate_tenant_info(tenant.domain)
@@ -3,7 +3,8 @@
 from enum import Enum
 from typing import Any
 
-from sqlalchemy import JSON, ForeignKey, String, Text
+from sqlalchemy import JSON, ForeignKey, Index, String, Text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.shared.models import BaseModel, TimestampMixin
@@ -43,12 +44,12 @@ class TenantSettings(BaseModel, TimestampMixin):
     category: Mapped[str] = mapped_column(
         String(50),
         nullable=False,
-        index=True,
     )
 
-    # JSON storage for flexible settings
+    # JSON storage for flexible settings; binary JSONB on PostgreSQL so reads
+    # skip reparsing text. Updates are merged in Python and written whole
     settings: Mapped[dict[str, Any]] = mapped_column(
-        JSON,
+        JSON().with_variant(JSONB(), "postgresql"),
         default=dict,
         nullable=False,
     )
@@ -56,7 +57,16 @@ class TenantSettings(BaseModel, TimestampMixin):
 
     tenant = relationship("Tenant", backref="settings_entries")
 
-    __table_args__ = ({"sqlite_autoincrement": True},)
+    # One row per category; lookups and upserts go through this index
+    __table_args__ = (
+        Index(
+            "uq_tenant_settings_tenant_category",
+            "tenant_id",
+            "category",
+            unique=True,
+        ),
+        {"sqlite_autoincrement": True},
+    )
 
     def __repr__(self) -> str:
         return f"<TenantSettings {self.tenant_id}:{self.category}>"
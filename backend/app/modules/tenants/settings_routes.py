@@ -1,8 +1,11 @@
 """Tenant settings API routes."""
 
-from typing import Annotated, Any
+from collections.abc import Awaitable, Callable
+from typing import Annotated, Any, NamedTuple
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
 
 from app.core.database import DbSession
 from app.core.rate_limit import rate_limit
@@ -24,8 +27,20 @@ from app.modules.tenants.settings_schemas import (
     TenantSettingsUpdate,
 )
 from app.modules.tenants.settings_service import TenantSettingsService
+from app.shared.schemas import BaseSchema
 
-router = APIRouter(prefix="/settings", tags=["Tenant Settings"])
+# Settings payloads are dict-heavy JSON documents; orjson encodes them faster
+# than the json.dumps call behind the default JSONResponse
+router = APIRouter(
+    prefix="/settings",
+    tags=["Tenant Settings"],
+    default_response_class=ORJSONResponse,
+)
+
+# The category list never changes, so encode it once at import
+_CATEGORIES_JSON = TypeAdapter(list[SettingsCategoryInfo]).dump_json(
+    SETTINGS_CATEGORIES_INFO
+)
 
 
 def get_settings_service(session: DbSession) -> TenantSettingsService:
@@ -38,13 +53,13 @@ def get_settings_service(session: DbSession) -> TenantSettingsService:
     response_model=list[SettingsCategoryInfo],
     summary="List setting categories",
 )
-async def list_categories() -> list[SettingsCategoryInfo]:
+async def list_categories() -> Response:
     """
     Get list of all available settings categories with metadata.
 
     Useful for building a settings UI with category navigation.
     """
-    return SETTINGS_CATEGORIES_INFO
+    return Response(content=_CATEGORIES_JSON, media_type="application/json")
 
 
 @router.get(
@@ -83,314 +98,131 @@ async def reset_all_settings(
     return await service.reset_all_settings(tenant.tenant_id)
 
 
-@router.get(
-    "/general",
-    response_model=GeneralSettings,
-    summary="Get general settings",
-)
-async def get_general_settings(
-    tenant: TenantDep,
-    service: TenantSettingsService = Depends(get_settings_service),
-) -> GeneralSettings:
-    """Get general settings (language, timezone, region, etc.)."""
-    return await service.get_general_settings(tenant.tenant_id)
-
-
-@router.patch(
-    "/general",
-    response_model=GeneralSettings,
-    summary="Update general settings",
-)
-async def update_general_settings(
-    data: TenantSettingsUpdate,
-    tenant: TenantDep,
-    service: TenantSettingsService = Depends(get_settings_service),
-    _: Annotated[None, Depends(rate_limit(30, 60))] = None,
-) -> GeneralSettings:
-    """Update general settings (partial update supported)."""
-    settings = await service.update_settings(
-        tenant.tenant_id,
-        SettingCategory.GENERAL,
-        data.settings,
-    )
-    return GeneralSettings(**settings.settings)
-
+class _CategoryRoutes(NamedTuple):
+    """GET/PATCH pair served for one settings category."""
 
-@router.get(
-    "/localization",
-    response_model=LocalizationSettings,
-    summary="Get localization settings",
-)
-async def get_localization_settings(
-    tenant: TenantDep,
-    service: TenantSettingsService = Depends(get_settings_service),
-) -> LocalizationSettings:
-    """Get localization settings (date/time formats, number formats, etc.)."""
-    return await service.get_localization_settings(tenant.tenant_id)
+    category: SettingCategory
+    schema: type[BaseSchema]
+    name: str
+    topics: str
+    update_limit: int
 
 
-@router.patch(
-    "/localization",
-    response_model=LocalizationSettings,
-    summary="Update localization settings",
-)
-async def update_localization_settings(
-    data: TenantSettingsUpdate,
-    tenant: TenantDep,
-    service: TenantSettingsService = Depends(get_settings_service),
-    _: Annotated[None, Depends(rate_limit(30, 60))] = None,
-) -> LocalizationSettings:
-    """Update localization settings (partial update supported)."""
-    settings = await service.update_settings(
-        tenant.tenant_id,
+_CATEGORY_ROUTES = (
+    _CategoryRoutes(
+        SettingCategory.GENERAL,
+        GeneralSettings,
+        "general",
+        "language, timezone, region, etc.",
+        30,
+    ),
+    _CategoryRoutes(
         SettingCategory.LOCALIZATION,
-        data.settings,
-    )
-    return LocalizationSettings(**settings.settings)
-
-
-@router.get(
-    "/notifications",
-    response_model=NotificationSettings,
-    summary="Get notification settings",
-)
-async def get_notification_settings(
-    tenant: TenantDep,
-    service: TenantSettingsService = Depends(get_settings_service),
-) -> NotificationSettings:
-    """Get notification settings (email, SMS, push preferences)."""
-    settings = await service.get_settings(
-        tenant.tenant_id, SettingCategory.NOTIFICATIONS
-    )
-    if settings is None:
-        return NotificationSettings()
-    return NotificationSettings(**settings.settings)
-
-
-@router.patch(
-    "/notifications",
-    response_model=NotificationSettings,
-    summary="Update notification settings",
-)
-async def update_notification_settings(
-    data: TenantSettingsUpdate,
-    tenant: TenantDep,
-    service: TenantSettingsService = Depends(get_settings_service),
-    _: Annotated[None, Depends(rate_limit(30, 60))] = None,
-) -> NotificationSettings:
-    """Update notification settings (partial update supported)."""
-    settings = await service.update_settings(
-        tenant.tenant_id,
+        LocalizationSettings,
+        "localization",
+        "date/time formats, number formats, etc.",
+        30,
+    ),
+    _CategoryRoutes(
         SettingCategory.NOTIFICATIONS,
-        data.settings,
-    )
-    return NotificationSettings(**settings.settings)
-
-
-@router.get(
-    "/security",
-    response_model=SecuritySettings,
-    summary="Get security settings",
-)
-async def get_security_settings(
-    tenant: TenantDep,
-    service: TenantSettingsService = Depends(get_settings_service),
-) -> SecuritySettings:
-    """Get security settings (password policies, 2FA, etc.)."""
-    return await service.get_security_settings(tenant.tenant_id)
-
-
-@router.patch(
-    "/security",
-    response_model=SecuritySettings,
-    summary="Update security settings",
-)
-async def update_security_settings(
-    data: TenantSettingsUpdate,
-    tenant: TenantDep,
-    service: TenantSettingsService = Depends(get_settings_service),
-    _: Annotated[None, Depends(rate_limit(20, 60))] = None,
-) -> SecuritySettings:
-    """Update security settings (partial update supported)."""
-    settings = await service.update_settings(
-        tenant.tenant_id,
+        NotificationSettings,
+        "notification",
+        "email, SMS, push preferences",
+        30,
+    ),
+    _CategoryRoutes(
         SettingCategory.SECURITY,
-        data.settings,
-    )
-    return SecuritySettings(**settings.settings)
-
-
-@router.get(
-    "/telemetry",
-    response_model=TelemetrySettings,
-    summary="Get telemetry settings",
-)
-async def get_telemetry_settings(
-    tenant: TenantDep,
-    service: TenantSettingsService = Depends(get_settings_service),
-) -> TelemetrySettings:
-    """Get telemetry settings (analytics, error tracking, etc.)."""
-    return await service.get_telemetry_settings(tenant.tenant_id)
-
-
-@router.patch(
-    "/telemetry",
-    response_model=TelemetrySettings,
-    summary="Update telemetry settings",
-)
-async def update_telemetry_settings(
-    data: TenantSettingsUpdate,
-    tenant: TenantDep,
-    service: TenantSettingsService = Depends(get_settings_service),
-    _: Annotated[None, Depends(rate_limit(30, 60))] = None,
-) -> TelemetrySettings:
-    """Update telemetry settings (partial update supported)."""
-    settings = await service.update_settings(
-        tenant.tenant_id,
+        SecuritySettings,
+        "security",
+        "password policies, 2FA, etc.",
+        20,
+    ),
+    _CategoryRoutes(
         SettingCategory.TELEMETRY,
-        data.settings,
-    )
-    return TelemetrySettings(**settings.settings)
-
-
-@router.get(
-    "/branding",
-    response_model=BrandingSettings,
-    summary="Get branding settings",
-)
-async def get_branding_settings(
-    tenant: TenantDep,
-    service: TenantSettingsService = Depends(get_settings_service),
-) -> BrandingSettings:
-    """Get branding settings (logo, colors, themes, etc.)."""
-    return await service.get_branding_settings(tenant.tenant_id)
-
-
-@router.patch(
-    "/branding",
-    response_model=BrandingSettings,
-    summary="Update branding settings",
-)
-async def update_branding_settings(
-    data: TenantSettingsUpdate,
-    tenant: TenantDep,
-    service: TenantSettingsService = Depends(get_settings_service),
-    _: Annotated[None, Depends(rate_limit(30, 60))] = None,
-) -> BrandingSettings:
-    """Update branding settings (partial update supported)."""
-    settings = await service.update_settings(
-        tenant.tenant_id,
+        TelemetrySettings,
+        "telemetry",
+        "analytics, error tracking, etc.",
+        30,
+    ),
+    _CategoryRoutes(
         SettingCategory.BRANDING,
-        data.settings,
-    )
-    return BrandingSettings(**settings.settings)
-
-
-@router.get(
-    "/features",
-    response_model=FeatureSettings,
-    summary="Get feature settings",
-)
-async def get_feature_settings(
-    tenant: TenantDep,
-    service: TenantSettingsService = Depends(get_settings_service),
-) -> FeatureSettings:
-    """Get feature settings (enable/disable features)."""
-    return await service.get_feature_settings(tenant.tenant_id)
-
-
-@router.patch(
-    "/features",
-    response_model=FeatureSettings,
-    summary="Update feature settings",
-)
-async def update_feature_settings(
-    data: TenantSettingsUpdate,
-    tenant: TenantDep,
-    service: TenantSettingsService = Depends(get_settings_service),
-    _: Annotated[None, Depends(rate_limit(20, 60))] = None,
-) -> FeatureSettings:
-    """Update feature settings (partial update supported)."""
-    settings = await service.update_settings(
-        tenant.tenant_id,
+        BrandingSettings,
+        "branding",
+        "logo, colors, themes, etc.",
+        30,
+    ),
+    _CategoryRoutes(
         SettingCategory.FEATURES,
-        data.settings,
-    )
-    return FeatureSettings(**settings.settings)
-
-
-@router.get(
-    "/compliance",
-    response_model=ComplianceSettings,
-    summary="Get compliance settings",
-)
-async def get_compliance_settings(
-    tenant: TenantDep,
-    service: TenantSettingsService = Depends(get_settings_service),
-) -> ComplianceSettings:
-    """Get compliance settings (GDPR, data retention, etc.)."""
-    settings = await service.get_settings(tenant.tenant_id, SettingCategory.COMPLIANCE)
-    if settings is None:
-        return ComplianceSettings()
-    return ComplianceSettings(**settings.settings)
-
-
-@router.patch(
-    "/compliance",
-    response_model=ComplianceSettings,
-    summary="Update compliance settings",
-)
-async def update_compliance_settings(
-    data: TenantSettingsUpdate,
-    tenant: TenantDep,
-    service: TenantSettingsService = Depends(get_settings_service),
-    _: Annotated[None, Depends(rate_limit(20, 60))] = None,
-) -> ComplianceSettings:
-    """Update compliance settings (partial update supported)."""
-    settings = await service.update_settings(
-        tenant.tenant_id,
+        FeatureSettings,
+        "feature",
+        "enable/disable features",
+        20,
+    ),
+    _CategoryRoutes(
         SettingCategory.COMPLIANCE,
-        data.settings,
-    )
-    return ComplianceSettings(**settings.settings)
-
-
-@router.get(
-    "/integrations",
-    response_model=IntegrationSettings,
-    summary="Get integration settings",
-)
-async def get_integration_settings(
-    tenant: TenantDep,
-    service: TenantSettingsService = Depends(get_settings_service),
-) -> IntegrationSettings:
-    """Get integration settings (Slack, Teams, SSO, etc.)."""
-    settings = await service.get_settings(
-        tenant.tenant_id, SettingCategory.INTEGRATIONS
-    )
-    if settings is None:
-        return IntegrationSettings()
-    return IntegrationSettings(**settings.settings)
-
-
-@router.patch(
-    "/integrations",
-    response_model=IntegrationSettings,
-    summary="Update integration settings",
-)
-async def update_integration_settings(
-    data: TenantSettingsUpdate,
-    tenant: TenantDep,
-    service: TenantSettingsService = Depends(get_settings_service),
-    _: Annotated[None, Depends(rate_limit(20, 60))] = None,
-) -> IntegrationSettings:
-    """Update integration settings (partial update supported)."""
-    settings = await service.update_settings(
-        tenant.tenant_id,
+        ComplianceSettings,
+        "compliance",
+        "GDPR, data retention, etc.",
+        20,
+    ),
+    _CategoryRoutes(
         SettingCategory.INTEGRATIONS,
-        data.settings,
+        IntegrationSettings,
+        "integration",
+        "Slack, Teams, SSO, etc.",
+        20,
+    ),
+)
+
+
+def _make_get_handler(
+    category: SettingCategory, schema: type[BaseSchema]
+) -> Callable[..., Awaitable[BaseSchema]]:
+    async def get_category_settings(
+        tenant: TenantDep,
+        service: TenantSettingsService = Depends(get_settings_service),
+    ) -> BaseSchema:
+        return await service.get_category_settings(tenant.tenant_id, category, schema)
+
+    return get_category_settings
+
+
+def _make_update_handler(
+    category: SettingCategory, schema: type[BaseSchema], update_limit: int
+) -> Callable[..., Awaitable[BaseSchema]]:
+    async def update_category_settings(
+        data: TenantSettingsUpdate,
+        tenant: TenantDep,
+        service: TenantSettingsService = Depends(get_settings_service),
+        _: Annotated[None, Depends(rate_limit(update_limit, 60))] = None,
+    ) -> BaseSchema:
+        settings = await service.update_settings(
+            tenant.tenant_id, category, data.settings
+        )
+        return schema.model_construct(**settings.settings)
+
+    return update_category_settings
+
+
+for route in _CATEGORY_ROUTES:
+    router.add_api_route(
+        f"/{route.category.value}",
+        _make_get_handler(route.category, route.schema),
+        methods=["GET"],
+        response_model=route.schema,
+        summary=f"Get {route.name} settings",
+        description=f"Get {route.name} settings ({route.topics}).",
+        name=f"get_{route.name}_settings",
+    )
+    router.add_api_route(
+        f"/{route.category.value}",
+        _make_update_handler(route.category, route.schema, route.update_limit),
+        methods=["PATCH"],
+        response_model=route.schema,
+        summary=f"Update {route.name} settings",
+        description=f"Update {route.name} settings (partial update supported).",
+        name=f"update_{route.name}_settings",
     )
-    return IntegrationSettings(**settings.settings)
 
 
 @router.post(
@@ -1,27 +1,14 @@
 """Tenant settings schemas."""
 
-from enum import Enum
-from typing import Any
+from typing import Annotated, Any, TypedDict
 
-from pydantic import Field
+from pydantic import Field, TypeAdapter, with_config
 
+from app.modules.tenants.schemas import HEX_COLOR_PATTERN
+from app.modules.tenants.settings_models import SettingCategory
 from app.shared.schemas import BaseEntitySchema, BaseSchema
 
 
-class SettingCategory(str, Enum):
-    """Categories of tenant settings."""
-
-    GENERAL = "general"
-    LOCALIZATION = "localization"
-    NOTIFICATIONS = "notifications"
-    SECURITY = "security"
-    INTEGRATIONS = "integrations"
-    TELEMETRY = "telemetry"
-    BRANDING = "branding"
-    FEATURES = "features"
-    COMPLIANCE = "compliance"
-
-
 class GeneralSettings(BaseSchema):
     """General tenant settings."""
 
@@ -256,17 +243,17 @@ class BrandingSettings(BaseSchema):
     primary_color: str = Field(
         default="#3B82F6",
         description="Primary brand color (hex)",
-        pattern=r"^#[0-9A-Fa-f]{6}$",
+        pattern=HEX_COLOR_PATTERN,
     )
     secondary_color: str = Field(
         default="#64748B",
         description="Secondary brand color (hex)",
-        pattern=r"^#[0-9A-Fa-f]{6}$",
+        pattern=HEX_COLOR_PATTERN,
     )
     accent_color: str = Field(
         default="#10B981",
         description="Accent color (hex)",
-        pattern=r"^#[0-9A-Fa-f]{6}$",
+        pattern=HEX_COLOR_PATTERN,
     )
     theme_mode: str = Field(
         default="system",
@@ -505,6 +492,38 @@ SETTINGS_SCHEMA_MAP: dict[SettingCategory, type[BaseSchema]] = {
     SettingCategory.INTEGRATIONS: IntegrationSettings,
 }
 
+# Built once at import and shared by every request; treat as read-only
+DEFAULT_SETTINGS: dict[SettingCategory, BaseSchema] = {
+    category: schema() for category, schema in SETTINGS_SCHEMA_MAP.items()
+}
+DEFAULT_DUMPS: dict[SettingCategory, dict[str, Any]] = {
+    category: defaults.model_dump() for category, defaults in DEFAULT_SETTINGS.items()
+}
+
+
+def _partial_adapter(schema: type[BaseSchema]) -> TypeAdapter[dict[str, Any]]:
+    """Validate any subset of a schema's fields, ignoring unknown keys.
+
+    Each field keeps its annotation, constraints and the schema's config,
+    but unlike the schema itself, fields left out are not filled in.
+    """
+    fields = {
+        name: Annotated[(field.annotation, *field.metadata)]
+        if field.metadata
+        else field.annotation
+        for name, field in schema.model_fields.items()
+    }
+    # The functional TypedDict form is the only way to build one per schema at
+    # runtime; mypy only understands it with a literal name and fields
+    partial = TypedDict(f"{schema.__name__}Update", fields, total=False)  # type: ignore[misc]
+    return TypeAdapter(with_config(schema.model_config)(partial))
+
+
+SETTINGS_UPDATE_ADAPTERS: dict[SettingCategory, TypeAdapter[dict[str, Any]]] = {
+    category: _partial_adapter(schema)
+    for category, schema in SETTINGS_SCHEMA_MAP.items()
+}
+
 
 SETTINGS_CATEGORIES_INFO: list[SettingsCategoryInfo] = [
     SettingsCategoryInfo(
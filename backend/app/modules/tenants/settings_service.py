@@ -1,29 +1,52 @@
 """Tenant settings service."""
 
-from typing import Any
+from collections.abc import Callable
+from typing import Any, TypeVar, cast
 
 from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import cache
 from app.modules.tenants.settings_models import SettingCategory, TenantSettings
 from app.modules.tenants.settings_schemas import (
+    DEFAULT_DUMPS,
+    DEFAULT_SETTINGS,
     SETTINGS_SCHEMA_MAP,
+    SETTINGS_UPDATE_ADAPTERS,
     AllSettingsResponse,
     BrandingSettings,
-    ComplianceSettings,
     FeatureSettings,
     GeneralSettings,
-    IntegrationSettings,
     LocalizationSettings,
-    NotificationSettings,
     SecuritySettings,
     TelemetrySettings,
 )
+from app.shared.schemas import BaseSchema
+
+# Settings are read on most page loads and rarely change, so each category
+# is shared across workers through Redis and dropped whenever it is written
+SETTINGS_CACHE_TTL = 300
+
+SchemaType = TypeVar("SchemaType", bound=BaseSchema)
+
+# Both dialects spell ON CONFLICT DO UPDATE the same way
+_UPSERT_INSERTS: dict[str, Callable[..., postgresql.Insert | sqlite.Insert]] = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+def settings_cache_key(category: SettingCategory) -> str:
+    """Cache key for one category of a tenant's settings."""
+    return f"settings:{category.value}"
 
 
 class TenantSettingsService:
     """Service for managing tenant settings."""
 
+    __slots__ = ("session",)
+
     def __init__(self, session: AsyncSession):
         self.session = session
 
@@ -41,6 +64,31 @@ class TenantSettingsService:
         )
         return result.scalar_one_or_none()
 
+    async def get_category_settings(
+        self,
+        tenant_id: str,
+        category: SettingCategory,
+        schema: type[SchemaType],
+    ) -> SchemaType:
+        """Get a category's settings with defaults, from the cache when warm."""
+        cache_key = settings_cache_key(category)
+        cached = await cache.get(cache_key, tenant_id=tenant_id)
+        if cached is not None:
+            return schema.model_construct(**cached)
+
+        settings = await self.get_settings(tenant_id, category)
+        if settings is None:
+            values = cast(SchemaType, DEFAULT_SETTINGS[category])
+        else:
+            values = schema.model_construct(**settings.settings)
+        await cache.set(
+            cache_key,
+            values.model_dump(mode="json"),
+            ttl=SETTINGS_CACHE_TTL,
+            tenant_id=tenant_id,
+        )
+        return values
+
     async def get_all_settings(self, tenant_id: str) -> AllSettingsResponse:
         """Get all settings for a tenant with defaults filled in."""
         result = await self.session.execute(
@@ -52,19 +100,16 @@ class TenantSettingsService:
         for setting in settings_list:
             settings_map[setting.category] = setting.settings
 
-        return AllSettingsResponse(
-            general=GeneralSettings(**(settings_map.get("general", {}))),
-            localization=LocalizationSettings(**(settings_map.get("localization", {}))),
-            notifications=NotificationSettings(
-                **(settings_map.get("notifications", {}))
-            ),
-            security=SecuritySettings(**(settings_map.get("security", {}))),
-            telemetry=TelemetrySettings(**(settings_map.get("telemetry", {}))),
-            branding=BrandingSettings(**(settings_map.get("branding", {}))),
-            features=FeatureSettings(**(settings_map.get("features", {}))),
-            compliance=ComplianceSettings(**(settings_map.get("compliance", {}))),
-            integrations=IntegrationSettings(**(settings_map.get("integrations", {}))),
-        )
+        # Stored values were validated on write; skip re-validating them
+        values: dict[str, Any] = {
+            category.value: (
+                schema.model_construct(**settings_map[category.value])
+                if category.value in settings_map
+                else DEFAULT_SETTINGS[category]
+            )
+            for category, schema in SETTINGS_SCHEMA_MAP.items()
+        }
+        return AllSettingsResponse.model_construct(**values)
 
     async def update_settings(
         self,
@@ -78,26 +123,18 @@ class TenantSettingsService:
         Performs a partial update - only updates provided fields.
         Validates against the category schema before saving.
         """
-        settings = await self.get_settings(tenant_id, category)
-
-        if settings is None:
-            schema_class = SETTINGS_SCHEMA_MAP[category]
-            validated = schema_class(**updates)
-
-            settings = TenantSettings(
-                tenant_id=tenant_id,
-                category=category.value,
-                settings=validated.model_dump(),
-            )
-            self.session.add(settings)
-        else:
-            merged = {**settings.settings, **updates}
-            schema_class = SETTINGS_SCHEMA_MAP[category]
-            validated = schema_class(**merged)
-            settings.settings = validated.model_dump()
-
+        # Only the submitted keys need validating; stored values already were
+        validated = SETTINGS_UPDATE_ADAPTERS[category].validate_python(updates)
+        current = await self.get_settings(tenant_id, category)
+        stored = current.settings if current else {}
+        merged = {
+            key: validated[key] if key in validated else stored.get(key, default)
+            for key, default in DEFAULT_DUMPS[category].items()
+        }
+
+        settings = await self._save(tenant_id, category, merged)
         await self.session.commit()
-        await self.session.refresh(settings)
+        await cache.delete(settings_cache_key(category), tenant_id=tenant_id)
         return settings
 
     async def reset_settings(
@@ -106,73 +143,98 @@ class TenantSettingsService:
         category: SettingCategory,
     ) -> TenantSettings:
         """Reset settings for a category to defaults."""
-        settings = await self.get_settings(tenant_id, category)
-
-        schema_class = SETTINGS_SCHEMA_MAP[category]
-        defaults = schema_class()
-
-        if settings is None:
-            settings = TenantSettings(
-                tenant_id=tenant_id,
-                category=category.value,
-                settings=defaults.model_dump(),
-            )
-            self.session.add(settings)
-        else:
-            settings.settings = defaults.model_dump()
-
+        settings = await self._save(tenant_id, category, DEFAULT_DUMPS[category])
         await self.session.commit()
-        await self.session.refresh(settings)
+        await cache.delete(settings_cache_key(category), tenant_id=tenant_id)
         return settings
 
+    async def _save(
+        self,
+        tenant_id: str,
+        category: SettingCategory,
+        values: dict[str, Any],
+    ) -> TenantSettings:
+        """Insert or replace a category's settings in one statement."""
+        result = await self.session.scalars(
+            self._upsert(tenant_id, {category: values}).returning(TenantSettings),
+            execution_options={"populate_existing": True},
+        )
+        return result.one()
+
+    def _upsert(
+        self,
+        tenant_id: str,
+        values: dict[SettingCategory, dict[str, Any]],
+    ) -> postgresql.Insert | sqlite.Insert:
+        """Build an insert-or-replace of several categories' settings."""
+        insert = _UPSERT_INSERTS[self.session.get_bind().dialect.name]
+        statement = insert(TenantSettings).values(
+            [
+                {"tenant_id": tenant_id, "category": category.value, "settings": v}
+                for category, v in values.items()
+            ]
+        )
+        return statement.on_conflict_do_update(
+            index_elements=[TenantSettings.tenant_id, TenantSettings.category],
+            set_={
+                "settings": statement.excluded.settings,
+                "updated_at": statement.excluded.updated_at,
+            },
+        )
+
     async def reset_all_settings(self, tenant_id: str) -> AllSettingsResponse:
-        """Reset all settings to defaults."""
+        """Reset all settings to defaults in a single upsert."""
+        await self.session.scalars(
+            self._upsert(
+                tenant_id,
+                {category: DEFAULT_DUMPS[category] for category in SettingCategory},
+            ).returning(TenantSettings),
+            execution_options={"populate_existing": True},
+        )
+        await self.session.commit()
         for category in SettingCategory:
-            await self.reset_settings(tenant_id, category)
+            await cache.delete(settings_cache_key(category), tenant_id=tenant_id)
 
-        return await self.get_all_settings(tenant_id)
+        defaults: dict[str, Any] = {
+            category.value: DEFAULT_SETTINGS[category] for category in SettingCategory
+        }
+        return AllSettingsResponse.model_construct(**defaults)
 
     async def get_general_settings(self, tenant_id: str) -> GeneralSettings:
         """Get general settings with defaults."""
-        settings = await self.get_settings(tenant_id, SettingCategory.GENERAL)
-        if settings is None:
-            return GeneralSettings()
-        return GeneralSettings(**settings.settings)
+        return await self.get_category_settings(
+            tenant_id, SettingCategory.GENERAL, GeneralSettings
+        )
 
     async def get_localization_settings(self, tenant_id: str) -> LocalizationSettings:
         """Get localization settings with defaults."""
-        settings = await self.get_settings(tenant_id, SettingCategory.LOCALIZATION)
-        if settings is None:
-            return LocalizationSettings()
-        return LocalizationSettings(**settings.settings)
+        return await self.get_category_settings(
+            tenant_id, SettingCategory.LOCALIZATION, LocalizationSettings
+        )
 
     async def get_security_settings(self, tenant_id: str) -> SecuritySettings:
         """Get security settings with defaults."""
-        settings = await self.get_settings(tenant_id, SettingCategory.SECURITY)
-        if settings is None:
-            return SecuritySettings()
-        return SecuritySettings(**settings.settings)
+        return await self.get_category_settings(
+            tenant_id, SettingCategory.SECURITY, SecuritySettings
+        )
 
     async def get_feature_settings(self, tenant_id: str) -> FeatureSettings:
         """Get feature settings with defaults."""
-        settings = await self.get_settings(tenant_id, SettingCategory.FEATURES)
-        if settings is None:
-            return FeatureSettings()
-        return FeatureSettings(**settings.settings)
+        return await self.get_category_settings(
+            tenant_id, SettingCategory.FEATURES, FeatureSettings
+        )
 
     async def get_branding_settings(self, tenant_id: str) -> BrandingSettings:
         """Get branding settings with defaults."""
-        settings = await self.get_settings(tenant_id, SettingCategory.BRANDING)
-        if settings is None:
-            return BrandingSettings()
-        return BrandingSettings(**settings.settings)
+        return await self.get_category_settings(
+            tenant_id, SettingCategory.BRANDING, BrandingSettings
+        )
 
     async def get_telemetry_settings(self, tenant_id: str) -> TelemetrySettings:
         """Get telemetry settings with defaults."""
-        settings = await self.get_settings(tenant_id, SettingCategory.TELEMETRY)
-        if settings is None:
-            return TelemetrySettings()
-        return TelemetrySettings(**settings.settings)
+        return await self.get_category_settings(
+            tenant_id, SettingCategory.TELEMETRY, TelemetrySettings
+        )
 
     async def get_setting_value(
         self,
@@ -184,9 +246,7 @@ class TenantSettingsService:
         """Get a single setting value."""
         settings = await self.get_settings(tenant_id, category)
         if settings is None:
-            schema_class = SETTINGS_SCHEMA_MAP[category]
-            defaults = schema_class()
-            return getattr(defaults, key, default)
+            return getattr(DEFAULT_SETTINGS[category], key, default)
         return settings.settings.get(key, default)
 
     async def is_feature_enabled(self, tenant_id: str, feature: str) -> bool:
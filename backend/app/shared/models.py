@@ -2,9 +2,13 @@
 
 import uuid
 from datetime import datetime, timezone
+from typing import Any
 
 from sqlalchemy import DateTime, String, event
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import Mapped, declared_attr, mapped_column
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.expression import FunctionElement
 
 from app.core.database import Base, current_tenant_id
 
@@ -52,6 +56,36 @@ class BaseModel(Base, TimestampMixin):
     )
 
 
+class GenerateUUID(FunctionElement[str]):
+    """SQL-side equivalent of the BaseModel ID default.
+
+    Lets INSERT ... SELECT statements mint primary keys in the database.
+    """
+
+    type = String(36)
+    inherit_cache = True
+
+
+@compiles(GenerateUUID)
+def _compile_generate_uuid(
+    _element: GenerateUUID, _compiler: SQLCompiler, **_kw: Any
+) -> str:
+    return "CAST(gen_random_uuid() AS VARCHAR(36))"
+
+
+@compiles(GenerateUUID, "sqlite")
+def _compile_generate_uuid_sqlite(
+    _element: GenerateUUID, _compiler: SQLCompiler, **_kw: Any
+) -> str:
+    # Random version 4 UUID assembled from randomblob() hex digits
+    return (
+        "lower(hex(randomblob(4)) || '-' || hex(randomblob(2)) || '-4' || "
+        "substr(hex(randomblob(2)), 2) || '-' || "
+        "substr('89ab', 1 + (abs(random()) % 4), 1) || "
+        "substr(hex(randomblob(2)), 2) || '-' || hex(randomblob(6)))"
+    )
+
+
 class TenantBaseModel(BaseModel, TenantMixin):
     """Base model for tenant-scoped entities."""
 
@@ -2,8 +2,17 @@
 
 from typing import Any, Generic, TypeVar
 
-from sqlalchemy import Select, func, select
+from sqlalchemy import (
+    BigInteger,
+    Select,
+    cast,
+    column,
+    func,
+    select,
+    table,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.selectable import ScalarSelect
 
 from app.core.database import current_tenant_id
 from app.core.exceptions import EntityNotFoundError, TenantMismatchError
@@ -12,6 +21,24 @@ from app.shared.models import BaseModel, TenantBaseModel
 ModelType = TypeVar("ModelType", bound=BaseModel)
 TenantModelType = TypeVar("TenantModelType", bound=TenantBaseModel)
 
+_PG_CLASS = table("pg_class", column("oid"), column("reltuples"))
+
+
+def estimated_row_count(table_name: str) -> ScalarSelect[int]:
+    """Scalar subquery for PostgreSQL's planner row estimate of a table.
+
+    reltuples is refreshed by ANALYZE/autovacuum and is -1 (or 0 on older
+    servers) for a table never analyzed, so compare it against a threshold
+    before trusting it. Embed it in a larger query to avoid a round trip.
+    The name is resolved through to_regclass, i.e. the search_path, so a
+    same-named table in another schema is never matched.
+    """
+    return (
+        select(cast(_PG_CLASS.c.reltuples, BigInteger))
+        .where(_PG_CLASS.c.oid == func.to_regclass(table_name))
+        .scalar_subquery()
+    )
+
 
 class BaseRepository(Generic[ModelType]):
     """Base repository for non-tenant models."""
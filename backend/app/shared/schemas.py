@@ -49,6 +49,12 @@ class TenantEntitySchema(BaseEntitySchema, TenantSchema):
     pass
 
 
+def apply_patch(target: object, patch: BaseModel) -> None:
+    """Copy only the fields a partial-update schema had set onto ``target``."""
+    for field in patch.model_fields_set:
+        setattr(target, field, getattr(patch, field))
+
+
 class PaginationParams(BaseSchema):
     """Pagination parameters."""
 
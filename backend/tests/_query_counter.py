@@ -0,0 +1,32 @@
+"""Record the SQL statements an engine executes, to catch N+1 regressions."""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+class QueryCounter:
+    """Statements seen on an engine while the counter is active."""
+
+    def __init__(self) -> None:
+        self.statements: list[str] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def record(self, _conn, _cursor, statement, _parameters, _context, _many):
+        self.statements.append(statement)
+
+
+@contextmanager
+def count_queries(engine: AsyncEngine) -> Iterator[QueryCounter]:
+    """Count every statement sent to the database inside the block."""
+    counter = QueryCounter()
+    event.listen(engine.sync_engine, "before_cursor_execute", counter.record)
+    try:
+        yield counter
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", counter.record)
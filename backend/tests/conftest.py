@@ -3,9 +3,12 @@
 import asyncio
 import os
 import shutil
-from collections.abc import AsyncGenerator, Generator
+import sys
+from collections.abc import AsyncGenerator, Callable, Generator, Iterator
+from contextlib import AbstractContextManager, contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any
 
 # Set mock API key before importing app modules
 os.environ.setdefault("OPENAI_API_KEY", "sk-test-key-for-testing")
@@ -15,11 +18,13 @@ import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
+from app.core.cache import DEFAULT_TTL, Cache, cache
 from app.core.database import Base, get_async_session
 from app.core.security import create_access_token, get_password_hash
 from app.main import app
 from app.modules.auth.models import User, UserStatus
 from app.modules.tenants.models import Tenant, TenantStatus
+from tests._query_counter import QueryCounter, count_queries
 
 # Base domain for multi-tenancy
 BASE_DOMAIN = "samvit.bhanu.dev"
@@ -34,6 +39,41 @@ POLICIES_DIR = Path("data/policies")
 CHROMA_DIR = Path("data/chroma")
 
 
+class FakeCache(Cache):
+    """In-memory stand-in for the Redis cache, keyed and serialized alike."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.data: dict[str, str] = {}
+
+    async def get(self, key: str, tenant_id: str | None = None) -> Any:
+        value = self.data.get(self._build_key(key, tenant_id))
+        return self._serializer.deserialize(value)
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: int = DEFAULT_TTL,  # noqa: ARG002
+        tenant_id: str | None = None,
+    ) -> bool:
+        self.data[self._build_key(key, tenant_id)] = self._serializer.serialize(value)
+        return True
+
+    async def delete(self, key: str, tenant_id: str | None = None) -> bool:
+        return self.data.pop(self._build_key(key, tenant_id), None) is not None
+
+
+@pytest.fixture
+def fake_cache(monkeypatch: pytest.MonkeyPatch) -> FakeCache:
+    """Route every app module's shared cache to memory."""
+    fake = FakeCache()
+    for name, module in list(sys.modules.items()):
+        if name.startswith("app.") and getattr(module, "cache", None) is cache:
+            monkeypatch.setattr(module, "cache", fake)
+    return fake
+
+
 @pytest.fixture(scope="session")
 def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
     """Create an event loop for the test session."""
@@ -68,6 +108,58 @@ async def test_engine(test_db_path: Path):
     await engine.dispose()
 
 
+@pytest.fixture
+def assert_query_count(
+    test_engine,
+) -> Callable[[int], AbstractContextManager[QueryCounter]]:
+    """Context manager failing when a block runs more than N statements."""
+
+    @contextmanager
+    def check(max_queries: int) -> Iterator[QueryCounter]:
+        with count_queries(test_engine) as counter:
+            yield counter
+        assert counter.count <= max_queries, (
+            f"expected at most {max_queries} queries, ran {counter.count}:\n"
+            + "\n".join(counter.statements)
+        )
+
+    return check
+
+
+@pytest.fixture(autouse=True)
+def reset_vectorstores() -> Iterator[None]:
+    """Drop cached tenant vector stores so fakes never leak between tests."""
+    from app.ai.rag.vectorstore import get_tenant_vectorstore
+
+    yield
+    get_tenant_vectorstore.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def isolated_embedding_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Iterator[None]:
+    """Keep the persistent embedding cache out of the working tree."""
+    from app.ai.rag.embedding_cache import get_embedding_cache
+    from app.core.config import settings
+
+    monkeypatch.setattr(
+        settings, "embedding_cache_path", tmp_path / "embedding_cache.sqlite3"
+    )
+    get_embedding_cache.cache_clear()
+    yield
+    get_embedding_cache.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_components_cache() -> Iterator[None]:
+    """Drop in-process salary component lists so they never leak between tests."""
+    from app.modules.payroll.service import _components_cache
+
+    yield
+    _components_cache.clear()
+
+
 @pytest_asyncio.fixture(scope="function")
 async def session_maker(test_engine):
     """Create a shared session maker for both fixtures and app."""
@@ -115,6 +207,9 @@ async def client(
     monkeypatch.setattr(tenancy_module, "async_session_maker", session_maker)
     monkeypatch.setattr(db_module, "async_session_maker", session_maker)
 
+    # Each test gets a fresh database, so drop domains cached by earlier tests
+    tenancy_module.clear_tenant_domain_cache()
+
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
         yield ac
@@ -75,6 +75,25 @@ class TestCompanyRegistration:
 
         assert response.status_code == 422  # Validation error
 
+    @pytest.mark.parametrize("subdomain", ["-leading", "trailing-", "double--hyphen"])
+    async def test_register_company_subdomain_hyphen_placement(
+        self, client: AsyncClient, subdomain: str
+    ):
+        """Test subdomains cannot start, end or repeat a hyphen."""
+        data = {
+            "company_name": "Hyphen Company",
+            "subdomain": subdomain,
+            "company_email": "info@hyphen.com",
+            "admin_email": "admin@hyphen.com",
+            "admin_password": "Admin@12345",
+            "admin_first_name": "Admin",
+            "admin_last_name": "User",
+        }
+
+        response = await client.post("/api/v1/auth/register/company", json=data)
+
+        assert response.status_code == 422
+
     async def test_register_company_weak_password(self, client: AsyncClient):
         """Test company registration with weak password."""
         data = {
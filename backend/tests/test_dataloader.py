@@ -0,0 +1,125 @@
+"""Tests for the request-scoped DataLoader."""
+
+import asyncio
+
+import pytest
+
+from app.core.dataloader import DataLoader
+
+
+class RecordingBatchFn:
+    """Batch function that records every call it receives."""
+
+    def __init__(self, data: dict[str, int]) -> None:
+        self.data = data
+        self.calls: list[list[str]] = []
+
+    async def __call__(self, keys: list[str]) -> dict[str, int]:
+        self.calls.append(keys)
+        return {k: self.data[k] for k in keys if k in self.data}
+
+
+class TestDataLoader:
+    """Tests for DataLoader batching and memoization."""
+
+    @pytest.mark.asyncio
+    async def test_coalesces_loads_in_same_tick(self) -> None:
+        """Test concurrent loads are resolved by a single batch call."""
+        batch_fn = RecordingBatchFn({"a": 1, "b": 2})
+        loader = DataLoader(batch_fn)
+
+        results = await asyncio.gather(loader.load("a"), loader.load("b"))
+
+        assert results == [1, 2]
+        assert batch_fn.calls == [["a", "b"]]
+
+    @pytest.mark.asyncio
+    async def test_missing_key_resolves_to_none(self) -> None:
+        """Test keys absent from the batch result resolve to None."""
+        loader = DataLoader(RecordingBatchFn({"a": 1}))
+
+        assert await loader.load("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_memoizes_loaded_keys(self) -> None:
+        """Test repeated loads of the same key do not hit the batch function."""
+        batch_fn = RecordingBatchFn({"a": 1})
+        loader = DataLoader(batch_fn)
+
+        assert await loader.load("a") == 1
+        assert await loader.load("a") == 1
+        assert len(batch_fn.calls) == 1
+
+        loader.clear("a")
+        assert await loader.load("a") == 1
+        assert len(batch_fn.calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_prime_skips_batch_call(self) -> None:
+        """Test primed keys are served without a batch call."""
+        batch_fn = RecordingBatchFn({})
+        loader = DataLoader(batch_fn)
+        loader.prime("a", 42)
+
+        assert await loader.load_many(["a"]) == [42]
+        assert batch_fn.calls == []
+
+    @pytest.mark.asyncio
+    async def test_batch_error_propagates_and_is_not_memoized(self) -> None:
+        """Test a failing batch fails every waiter and allows a retry."""
+        attempts = 0
+
+        async def flaky(keys: list[str]) -> dict[str, int]:
+            nonlocal attempts
+            attempts += 1
+            if attempts == 1:
+                raise RuntimeError("db down")
+            return dict.fromkeys(keys, 7)
+
+        loader = DataLoader(flaky)
+
+        with pytest.raises(RuntimeError):
+            await loader.load("a")
+        assert await loader.load("a") == 7
+
+    @pytest.mark.asyncio
+    async def test_holds_dispatch_task_until_batch_finishes(self) -> None:
+        """Test an in-flight batch task stays referenced by its loader."""
+        release = asyncio.Event()
+
+        async def slow(keys: list[str]) -> dict[str, int]:
+            await release.wait()
+            return dict.fromkeys(keys, 1)
+
+        loader = DataLoader(slow)
+        future = loader.load("a")
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        assert len(loader._dispatch_tasks) == 1
+
+        release.set()
+        assert await future == 1
+        await asyncio.sleep(0)
+        assert not loader._dispatch_tasks
+
+    @pytest.mark.asyncio
+    async def test_cancelled_batch_cancels_waiters(self) -> None:
+        """Test cancelling a batch resolves its loads instead of hanging them."""
+        started = asyncio.Event()
+
+        async def hang(keys: list[str]) -> dict[str, int]:  # noqa: ARG001
+            started.set()
+            await asyncio.Event().wait()
+            return {}
+
+        loader = DataLoader(hang)
+        future = loader.load("a")
+        await started.wait()
+
+        for task in loader._dispatch_tasks:
+            task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(future, timeout=1)
+        assert "a" not in loader._futures
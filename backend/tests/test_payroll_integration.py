@@ -0,0 +1,347 @@
+"""Integration tests for payroll endpoints."""
+
+import uuid
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.modules.auth.models import User
+from app.modules.employees.models import Employee
+from app.modules.payroll.models import (
+    EmployeeSalary,
+    EmployeeSalaryComponent,
+    PayrollPeriod,
+    PayrollStatus,
+    SalaryComponent,
+    SalaryStructure,
+)
+from app.modules.payroll.schemas import SalaryComponentUpdate
+from app.modules.payroll.service import PayrollService
+from app.modules.tenants.models import Tenant
+from tests.conftest import get_auth_headers
+
+pytestmark = pytest.mark.asyncio
+
+
+# --- Fixtures ---
+
+
+@pytest.fixture
+async def test_component(
+    test_session: AsyncSession, test_tenant: Tenant
+) -> SalaryComponent:
+    """Create a test salary component."""
+    component = SalaryComponent(
+        id=str(uuid.uuid4()),
+        tenant_id=test_tenant.id,
+        name="Basic Salary",
+        code="BASIC",
+        component_type="earning",
+        is_active=True,
+        created_at=datetime.now(timezone.utc),
+        updated_at=datetime.now(timezone.utc),
+    )
+    test_session.add(component)
+    await test_session.commit()
+    await test_session.refresh(component)
+    return component
+
+
+# --- Salary Component Tests ---
+
+
+class TestSalaryComponents:
+    """Tests for salary component endpoints."""
+
+    async def test_create_component(
+        self,
+        client: AsyncClient,
+        test_tenant: Tenant,
+        test_user: User,
+    ):
+        """Test creating a component returns defaults without a reload."""
+        response = await client.post(
+            "/api/v1/payroll/components",
+            json={"name": "HRA", "code": "HRA", "component_type": "earning"},
+            headers=get_auth_headers(test_user, test_tenant),
+        )
+
+        assert response.status_code == 201
+        result = response.json()
+        assert result["code"] == "HRA"
+        assert result["is_active"] is True
+        assert result["created_at"] is not None
+
+    async def test_list_components_returns_etag(
+        self,
+        client: AsyncClient,
+        test_tenant: Tenant,
+        test_user: User,
+        test_component: SalaryComponent,
+    ):
+        """Test listing components sets an ETag header."""
+        response = await client.get(
+            "/api/v1/payroll/components",
+            headers=get_auth_headers(test_user, test_tenant),
+        )
+
+        assert response.status_code == 200
+        assert response.headers["etag"].startswith('W/"1-')
+        assert [c["id"] for c in response.json()] == [test_component.id]
+
+    async def test_list_components_not_modified(
+        self,
+        client: AsyncClient,
+        test_tenant: Tenant,
+        test_user: User,
+        test_component: SalaryComponent,  # noqa: ARG002
+    ):
+        """Test a matching If-None-Match short-circuits with 304."""
+        headers = get_auth_headers(test_user, test_tenant)
+        first = await client.get("/api/v1/payroll/components", headers=headers)
+        etag = first.headers["etag"]
+
+        response = await client.get(
+            "/api/v1/payroll/components",
+            headers={**headers, "If-None-Match": etag},
+        )
+
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+        assert response.content == b""
+
+    async def test_list_components_etag_changes_on_write(
+        self,
+        client: AsyncClient,
+        test_tenant: Tenant,
+        test_user: User,
+        test_component: SalaryComponent,
+    ):
+        """Test updating a component invalidates the previous ETag."""
+        headers = get_auth_headers(test_user, test_tenant)
+        first = await client.get("/api/v1/payroll/components", headers=headers)
+
+        await client.patch(
+            f"/api/v1/payroll/components/{test_component.id}",
+            json={"name": "Base Pay"},
+            headers=headers,
+        )
+        response = await client.get(
+            "/api/v1/payroll/components",
+            headers={**headers, "If-None-Match": first.headers["etag"]},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != first.headers["etag"]
+
+    async def test_list_components_served_from_memory(
+        self,
+        test_session: AsyncSession,
+        test_tenant: Tenant,
+        test_component: SalaryComponent,
+        assert_query_count,
+    ):
+        """Test a warm list with a matching fingerprint skips the database."""
+        service = PayrollService(test_session, test_tenant.id)
+        fingerprint = await service.components_fingerprint()
+        await service.list_components(fingerprint=fingerprint)
+
+        with assert_query_count(0):
+            components = await service.list_components(fingerprint=fingerprint)
+
+        assert [c.id for c in components] == [test_component.id]
+
+    async def test_list_components_reloads_after_update(
+        self,
+        test_session: AsyncSession,
+        test_tenant: Tenant,
+        test_component: SalaryComponent,
+    ):
+        """Test updating a component drops the tenant's cached lists."""
+        service = PayrollService(test_session, test_tenant.id)
+        await service.list_components()
+
+        await service.update_component(
+            test_component.id, SalaryComponentUpdate(name="Base Pay")
+        )
+        components = await service.list_components()
+
+        assert [c.name for c in components] == ["Base Pay"]
+
+    async def test_get_component_invalid_id(
+        self,
+        client: AsyncClient,
+        test_tenant: Tenant,
+        test_user: User,
+    ):
+        """Test malformed component IDs are rejected before the service."""
+        response = await client.get(
+            "/api/v1/payroll/components/not-a-uuid",
+            headers=get_auth_headers(test_user, test_tenant),
+        )
+
+        assert response.status_code == 422
+
+
+# --- Employee Salary Tests ---
+
+
+class TestEmployeeSalaries:
+    """Tests for employee salary endpoints."""
+
+    async def test_get_employee_salary_not_found(
+        self,
+        client: AsyncClient,
+        test_tenant: Tenant,
+        test_user: User,
+    ):
+        """Test an employee without a current salary returns 404."""
+        response = await client.get(
+            f"/api/v1/payroll/employee-salaries/{uuid.uuid4()}",
+            headers=get_auth_headers(test_user, test_tenant),
+        )
+
+        assert response.status_code == 404
+
+
+# --- Payroll Period Tests ---
+
+
+class TestPayslipGeneration:
+    """Tests for payslip generation."""
+
+    async def test_generate_payslips_unknown_period(
+        self,
+        client: AsyncClient,
+        test_tenant: Tenant,
+        test_user: User,
+    ):
+        """Test generating payslips for an unknown period returns 404."""
+        response = await client.post(
+            f"/api/v1/payroll/periods/{uuid.uuid4()}/generate",
+            headers=get_auth_headers(test_user, test_tenant),
+        )
+
+        assert response.status_code == 404
+
+    async def test_generate_payslips_requires_draft_period(
+        self,
+        client: AsyncClient,
+        test_session: AsyncSession,
+        test_tenant: Tenant,
+        test_user: User,
+    ):
+        """Test generating payslips for a non-draft period is rejected."""
+        period = PayrollPeriod(
+            id=str(uuid.uuid4()),
+            tenant_id=test_tenant.id,
+            name="Payroll - 06/2025",
+            month=6,
+            year=2025,
+            start_date=date(2025, 6, 1),
+            end_date=date(2025, 6, 30),
+            status=PayrollStatus.APPROVED.value,
+        )
+        test_session.add(period)
+        await test_session.commit()
+
+        response = await client.post(
+            f"/api/v1/payroll/periods/{period.id}/generate",
+            headers=get_auth_headers(test_user, test_tenant),
+        )
+
+        assert response.status_code == 400
+
+    async def test_generate_payslips_computes_totals(
+        self,
+        client: AsyncClient,
+        test_session: AsyncSession,
+        test_tenant: Tenant,
+        test_user: User,
+        test_component: SalaryComponent,
+    ):
+        """Test generated payslips carry SQL-aggregated totals and items."""
+        tenant_id = test_tenant.id
+        deduction = SalaryComponent(
+            id=str(uuid.uuid4()),
+            tenant_id=tenant_id,
+            name="Provident Fund",
+            code="PF",
+            component_type="deduction",
+        )
+        structure = SalaryStructure(
+            id=str(uuid.uuid4()), tenant_id=tenant_id, name="Standard", code="STD"
+        )
+        employee = Employee(
+            id=str(uuid.uuid4()),
+            tenant_id=tenant_id,
+            employee_code="EMP001",
+            first_name="John",
+            last_name="Doe",
+            email="john.doe@example.com",
+            date_of_joining=date(2024, 1, 1),
+        )
+        salary = EmployeeSalary(
+            id=str(uuid.uuid4()),
+            tenant_id=tenant_id,
+            employee_id=employee.id,
+            structure_id=structure.id,
+            annual_ctc=Decimal("120000"),
+            monthly_gross=Decimal("10000"),
+            effective_from=date(2025, 1, 1),
+        )
+        period = PayrollPeriod(
+            id=str(uuid.uuid4()),
+            tenant_id=tenant_id,
+            name="Payroll - 06/2025",
+            month=6,
+            year=2025,
+            start_date=date(2025, 6, 1),
+            end_date=date(2025, 6, 30),
+        )
+        test_session.add_all(
+            [
+                deduction,
+                structure,
+                employee,
+                salary,
+                period,
+                EmployeeSalaryComponent(
+                    tenant_id=tenant_id,
+                    employee_salary_id=salary.id,
+                    component_id=test_component.id,
+                    amount=Decimal("10000.00"),
+                ),
+                EmployeeSalaryComponent(
+                    tenant_id=tenant_id,
+                    employee_salary_id=salary.id,
+                    component_id=deduction.id,
+                    amount=Decimal("1200.50"),
+                ),
+            ]
+        )
+        await test_session.commit()
+        headers = get_auth_headers(test_user, test_tenant)
+
+        response = await client.post(
+            f"/api/v1/payroll/periods/{period.id}/generate", headers=headers
+        )
+
+        assert response.status_code == 200
+        [payslip] = response.json()
+        assert payslip["employee_id"] == employee.id
+        assert (payslip["year"], payslip["month"]) == (2025, 6)
+        assert payslip["gross_earnings"] == 10000.0
+        assert payslip["total_deductions"] == 1200.5
+        assert payslip["net_pay"] == 8799.5
+        assert uuid.UUID(payslip["id"])
+
+        service = PayrollService(test_session, tenant_id)
+        items = (await service.get_payslip(payslip["id"])).items
+        assert sorted(item.amount for item in items) == [
+            Decimal("1200.50"),
+            Decimal("10000.00"),
+        ]
@@ -0,0 +1,383 @@
+"""Tests for platform administration service."""
+
+import asyncio
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from pydantic import ValidationError as PydanticValidationError
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.exceptions import EntityAlreadyExistsError, EntityNotFoundError
+from app.modules.auth.models import User
+from app.modules.platform.service import PlatformService
+from app.modules.tenants.models import Tenant, TenantStatus
+from app.modules.tenants.schemas import TenantCreate, TenantUpdate
+from tests.conftest import BASE_DOMAIN, FakeCache
+
+pytestmark = pytest.mark.asyncio
+
+
+# --- Fixtures ---
+
+
+@pytest.fixture
+async def second_tenant(test_session: AsyncSession) -> Tenant:
+    """Create a second, pending tenant."""
+    tenant = Tenant(
+        id=str(uuid.uuid4()),
+        name="Second Org",
+        domain=f"second.{BASE_DOMAIN}",
+        email="admin@second.example.com",
+        status=TenantStatus.PENDING.value,
+        is_active=True,
+        created_at=datetime.now(timezone.utc),
+        updated_at=datetime.now(timezone.utc),
+    )
+    test_session.add(tenant)
+    await test_session.commit()
+    return tenant
+
+
+# --- Tenant Creation Tests ---
+
+
+class TestCreateTenant:
+    """Tests for tenant creation."""
+
+    async def test_create_tenant(self, test_session: AsyncSession):
+        """Test a new tenant is created pending."""
+        service = PlatformService(test_session)
+
+        tenant = await service.create_tenant(
+            TenantCreate(
+                name="New Org", domain=f"new.{BASE_DOMAIN}", email="new@example.com"
+            )
+        )
+
+        assert tenant.id is not None
+        assert tenant.status == TenantStatus.PENDING.value
+
+    @pytest.mark.parametrize(
+        "domain",
+        [
+            "acme",
+            "-acme.example.com",
+            "acme-.example.com",
+            "acme..com",
+            "ac_me.com",
+            f"{'a' * 64}.com",
+        ],
+    )
+    async def test_create_tenant_rejects_malformed_domain(self, domain: str):
+        """Test domains with bad labels fail schema validation."""
+        with pytest.raises(PydanticValidationError, match="Invalid domain format"):
+            TenantCreate(name="Bad Org", domain=domain, email="bad@example.com")
+
+    async def test_create_tenant_normalizes_domain(self):
+        """Test domains are lowercased and stripped before validation."""
+        data = TenantCreate(
+            name="Acme", domain=" HR.Acme-Corp.COM ", email="hr@example.com"
+        )
+
+        assert data.domain == "hr.acme-corp.com"
+
+    async def test_create_tenant_duplicate_domain(
+        self,
+        test_session: AsyncSession,
+        test_tenant: Tenant,
+    ):
+        """Test a taken domain is reported as a conflict on the domain."""
+        service = PlatformService(test_session)
+
+        with pytest.raises(EntityAlreadyExistsError) as exc_info:
+            await service.create_tenant(
+                TenantCreate(
+                    name="Copy", domain=test_tenant.domain, email="copy@example.com"
+                )
+            )
+
+        assert exc_info.value.details["identifier"] == test_tenant.domain
+
+    async def test_create_tenant_duplicate_email(
+        self,
+        test_session: AsyncSession,
+        test_tenant: Tenant,
+    ):
+        """Test a taken email is reported as a conflict on the email."""
+        service = PlatformService(test_session)
+
+        with pytest.raises(EntityAlreadyExistsError) as exc_info:
+            await service.create_tenant(
+                TenantCreate(
+                    name="Copy", domain=f"copy.{BASE_DOMAIN}", email=test_tenant.email
+                )
+            )
+
+        assert exc_info.value.details["identifier"] == test_tenant.email
+
+        # The failed insert only rolled back its savepoint
+        assert await service.get_tenant(test_tenant.id) is test_tenant
+
+    async def test_update_tenant_duplicate_email(
+        self,
+        test_session: AsyncSession,
+        test_tenant: Tenant,
+        second_tenant: Tenant,
+    ):
+        """Test updating to a taken email is a conflict, not a broken session."""
+        service = PlatformService(test_session)
+
+        with pytest.raises(EntityAlreadyExistsError) as exc_info:
+            await service.update_tenant(
+                second_tenant.id, TenantUpdate(email=test_tenant.email)
+            )
+
+        assert exc_info.value.details["identifier"] == test_tenant.email
+        tenant = await service.update_tenant(
+            second_tenant.id, TenantUpdate(name="Still Usable")
+        )
+        assert tenant.email != test_tenant.email
+
+
+# --- Tenant Lifecycle Tests ---
+
+
+class TestTenantLifecycle:
+    """Tests for tenant updates and status changes."""
+
+    async def test_update_tenant(
+        self,
+        test_session: AsyncSession,
+        second_tenant: Tenant,
+    ):
+        """Test only the supplied fields change and the loaded tenant is synced."""
+        service = PlatformService(test_session)
+
+        tenant = await service.update_tenant(
+            second_tenant.id, TenantUpdate(name="Renamed Org")
+        )
+
+        assert tenant is second_tenant
+        assert tenant.name == "Renamed Org"
+        assert tenant.email == "admin@second.example.com"
+
+    async def test_update_unknown_tenant(self, test_session: AsyncSession):
+        """Test updating an unknown tenant raises not found."""
+        service = PlatformService(test_session)
+
+        with pytest.raises(EntityNotFoundError):
+            await service.update_tenant(str(uuid.uuid4()), TenantUpdate(name="Nope"))
+
+    async def test_activate_tenant_needs_no_reload(
+        self,
+        test_session: AsyncSession,
+        second_tenant: Tenant,
+    ):
+        """Test returned tenant state is readable without a refresh."""
+        service = PlatformService(test_session)
+        previous_update = second_tenant.updated_at
+
+        tenant = await service.activate_tenant(second_tenant.id)
+
+        assert "updated_at" not in sa_inspect(tenant).expired_attributes
+        assert tenant.status == TenantStatus.ACTIVE.value
+        assert tenant.is_active is True
+        assert tenant.updated_at >= previous_update
+
+
+# --- Tenant Lookup Tests ---
+
+
+class TestTenantLookup:
+    """Tests for tenant lookups."""
+
+    async def test_get_tenant_by_domain_is_case_insensitive(
+        self,
+        test_session: AsyncSession,
+        test_tenant: Tenant,
+        second_tenant: Tenant,
+    ):
+        """Test domain lookups normalize case and bind the domain per call."""
+        service = PlatformService(test_session)
+
+        assert await service.get_tenant_by_domain(test_tenant.domain.upper()) is (
+            test_tenant
+        )
+        assert await service.get_tenant_by_domain(second_tenant.domain) is (
+            second_tenant
+        )
+
+
+# --- Tenant Stats Tests ---
+
+
+class TestTenantStats:
+    """Tests for tenant statistics."""
+
+    async def test_get_all_tenant_stats(
+        self,
+        test_session: AsyncSession,
+        test_tenant: Tenant,
+        test_user: User,  # noqa: ARG002
+        second_tenant: Tenant,
+    ):
+        """Test listing tenant stats returns the page, counts and total."""
+        service = PlatformService(test_session)
+
+        stats, total = await service.get_all_tenant_stats(offset=0, limit=10)
+
+        assert total == 2
+        by_id = {s.tenant_id: s for s in stats}
+        assert by_id[test_tenant.id].user_count == 1
+        assert by_id[second_tenant.id].user_count == 0
+        assert by_id[second_tenant.id].status == TenantStatus.PENDING.value
+
+    async def test_get_all_tenant_stats_pagination(
+        self,
+        test_session: AsyncSession,
+        test_tenant: Tenant,  # noqa: ARG002
+        second_tenant: Tenant,  # noqa: ARG002
+    ):
+        """Test the total is unaffected by the page window."""
+        service = PlatformService(test_session)
+
+        stats, total = await service.get_all_tenant_stats(offset=1, limit=1)
+
+        assert len(stats) == 1
+        assert total == 2
+
+    async def test_get_all_tenant_stats_past_last_page(
+        self,
+        test_session: AsyncSession,
+        test_tenant: Tenant,  # noqa: ARG002
+        second_tenant: Tenant,  # noqa: ARG002
+    ):
+        """Test an empty page past the end still reports the total."""
+        service = PlatformService(test_session)
+
+        stats, total = await service.get_all_tenant_stats(offset=10, limit=10)
+
+        assert stats == []
+        assert total == 2
+
+    async def test_search_tenants_includes_counts(
+        self,
+        test_session: AsyncSession,
+        test_tenant: Tenant,
+        test_user: User,  # noqa: ARG002
+        second_tenant: Tenant,  # noqa: ARG002
+    ):
+        """Test search results carry per-tenant user counts."""
+        service = PlatformService(test_session)
+
+        stats = await service.search_tenants(query=test_tenant.name)
+
+        assert [s.tenant_id for s in stats] == [test_tenant.id]
+        assert stats[0].user_count == 1
+        assert stats[0].employee_count == 0
+
+    async def test_get_tenant_stats(
+        self,
+        test_session: AsyncSession,
+        test_tenant: Tenant,
+        test_user: User,  # noqa: ARG002
+    ):
+        """Test single tenant stats include user and employee counts."""
+        service = PlatformService(test_session)
+
+        stats = await service.get_tenant_stats(test_tenant.id)
+
+        assert stats is not None
+        assert stats.domain == test_tenant.domain
+        assert stats.user_count == 1
+        assert stats.employee_count == 0
+
+    async def test_get_tenant_stats_unknown_tenant(
+        self,
+        test_session: AsyncSession,
+    ):
+        """Test stats for an unknown tenant return None."""
+        service = PlatformService(test_session)
+
+        assert await service.get_tenant_stats(str(uuid.uuid4())) is None
+
+
+# --- Platform Stats Tests ---
+
+
+class TestPlatformStats:
+    """Tests for platform-wide statistics."""
+
+    async def test_get_platform_stats(
+        self,
+        test_session: AsyncSession,
+        test_tenant: Tenant,  # noqa: ARG002
+        test_user: User,  # noqa: ARG002
+        second_tenant: Tenant,  # noqa: ARG002
+    ):
+        """Test platform stats count tenants by status and users."""
+        service = PlatformService(test_session)
+
+        stats = await service.get_platform_stats()
+
+        assert stats.total_tenants == 2
+        assert stats.active_tenants == 1
+        assert stats.pending_tenants == 1
+        assert stats.suspended_tenants == 0
+        assert stats.total_users == 1
+        assert stats.tenants_created_last_7_days == 2
+
+    async def test_get_platform_stats_is_one_query(
+        self,
+        test_session: AsyncSession,
+        test_user: User,  # noqa: ARG002
+        assert_query_count,
+    ):
+        """Test uncached stats, totals included, come from one statement."""
+        service = PlatformService(test_session)
+
+        with assert_query_count(1):
+            stats = await service.get_platform_stats()
+
+        assert stats.total_users == 1
+
+    async def test_stats_cache_is_dropped_after_commit(
+        self,
+        test_session: AsyncSession,
+        fake_cache: FakeCache,
+    ):
+        """Test a write drops cached stats only once its transaction commits."""
+        service = PlatformService(test_session)
+        await service.get_platform_stats()
+
+        await service.create_tenant(
+            TenantCreate(
+                name="New Org", domain=f"new.{BASE_DOMAIN}", email="new@example.com"
+            )
+        )
+        await asyncio.sleep(0)
+        assert fake_cache.data
+
+        await test_session.commit()
+        await asyncio.sleep(0)
+        assert not fake_cache.data
+
+    async def test_large_table_totals_use_inline_estimates(self):
+        """Test PostgreSQL totals read the planner estimate in the same SELECT."""
+        bind = SimpleNamespace(dialect=postgresql.dialect())
+        service = PlatformService(SimpleNamespace(bind=bind))
+
+        sql = str(
+            select(service._total_rows_column(User)).compile(
+                dialect=postgresql.dialect()
+            )
+        )
+
+        assert "pg_class.reltuples" in sql
+        assert "count(*)" in sql
+        assert sql.startswith("SELECT CASE WHEN")
@@ -32,6 +32,41 @@ Business casual attire is required Monday through Thursday. Fridays are casual d
 """
 
 
+class RecordingCollection:
+    """Stand-in Chroma collection that records each upsert call."""
+
+    def __init__(self) -> None:
+        self.upserts: list[list[str]] = []
+
+    def upsert(self, ids, documents, metadatas, embeddings) -> None:
+        assert len(ids) == len(documents) == len(metadatas) == len(embeddings)
+        self.upserts.append(ids)
+
+
+class CountingEmbeddingFunction:
+    """Stand-in embedding function that records the texts it embeds."""
+
+    model_name = "fake-model"
+
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+
+    @staticmethod
+    def name() -> str:
+        return "fake"
+
+    def __call__(self, documents: list[str]) -> list[list[float]]:
+        self.calls.append(documents)
+        return [[float(len(doc)), 0.5] for doc in documents]
+
+
+def offline_store(store):
+    """Point a vector store at recording fakes instead of Chroma."""
+    store._collection = RecordingCollection()
+    store._embedder = CountingEmbeddingFunction()
+    return store._collection
+
+
 class TestPolicyManagement:
     """Test policy CRUD operations."""
 
@@ -261,6 +296,100 @@ class TestPolicyManagement:
         assert response.status_code == 409
         assert "already exists" in response.json()["detail"].lower()
 
+    @pytest.mark.asyncio
+    async def test_policy_names_are_unique_among_live_policies(
+        self,
+        test_session,
+        test_tenant,
+        tmp_path,
+        monkeypatch,
+    ):
+        """Test name conflicts ignore case and archived policies."""
+        import io
+
+        from app.core.exceptions import EntityAlreadyExistsError
+        from app.modules.policies import service as policy_service
+        from app.modules.policies.models import PolicyCategory, PolicyStatus
+        from app.modules.policies.schemas import PolicyCreate, PolicyUpdate
+        from app.modules.policies.service import PolicyService
+
+        monkeypatch.setattr(policy_service, "POLICIES_BASE_DIR", tmp_path / "policies")
+        service = PolicyService(test_session, test_tenant.id)
+
+        async def upload(name: str):
+            return await service.upload_policy(
+                io.BytesIO(b"# Policy"),
+                "policy.md",
+                PolicyCreate(name=name, category=PolicyCategory.GENERAL),
+            )
+
+        first = await upload("Travel Policy")
+        with pytest.raises(EntityAlreadyExistsError):
+            await upload("TRAVEL policy")
+        # The losing upload's file is removed; the session stays usable
+        assert [p.name for p in (tmp_path / "policies").rglob("*.md")] == [
+            first.file_path.rsplit("/", 1)[-1]
+        ]
+
+        other = await upload("Expense Policy")
+        with pytest.raises(EntityAlreadyExistsError):
+            await service.update_policy(other.id, PolicyUpdate(name="Travel Policy"))
+
+        await service.update_policy(
+            first.id, PolicyUpdate(status=PolicyStatus.ARCHIVED)
+        )
+        replacement = await upload("Travel Policy")
+        assert replacement.id != first.id
+
+    @pytest.mark.asyncio
+    async def test_update_policy_only_maps_name_conflicts(
+        self,
+        test_session,
+        test_tenant,
+        tmp_path,
+        monkeypatch,
+    ):
+        """Test integrity errors other than a name clash are not a 409."""
+        import io
+
+        from sqlalchemy.exc import IntegrityError
+
+        from app.modules.policies import service as policy_service
+        from app.modules.policies.models import PolicyCategory
+        from app.modules.policies.schemas import PolicyCreate, PolicyUpdate
+        from app.modules.policies.service import PolicyService
+
+        monkeypatch.setattr(policy_service, "POLICIES_BASE_DIR", tmp_path / "policies")
+        service = PolicyService(test_session, test_tenant.id)
+        policy = await service.upload_policy(
+            io.BytesIO(b"# Policy"),
+            "policy.md",
+            PolicyCreate(name="Travel Policy", category=PolicyCategory.GENERAL),
+        )
+
+        # name is NOT NULL, so this fails on a constraint other than the index
+        with pytest.raises(IntegrityError):
+            await service.update_policy(policy.id, PolicyUpdate(name=None))
+
+    @pytest.mark.asyncio
+    async def test_metadata_operations_skip_vectorstore(
+        self,
+        test_session,
+        test_tenant,
+        monkeypatch,
+    ):
+        """Test listing policies never resolves the tenant vector store."""
+        from app.modules.policies import service as policy_service
+        from app.modules.policies.service import PolicyService
+
+        def fail(_tenant_id):
+            raise AssertionError("vector store should not be opened")
+
+        monkeypatch.setattr(policy_service, "get_tenant_vectorstore", fail)
+        service = PolicyService(test_session, test_tenant.id)
+
+        assert await service.list_policies() == ([], 0)
+
 
 class TestPolicyIndexing:
     """Test policy indexing for RAG."""
@@ -347,6 +476,156 @@ class TestPolicyIndexing:
         data = index_response.json()
         assert data["indexed_count"] >= 3
 
+    @pytest.mark.asyncio
+    async def test_index_all_policies_shares_embedding_batches(
+        self,
+        test_session,
+        test_tenant,
+        tmp_path,
+        monkeypatch,
+    ):
+        """Test chunks from several policies are stored in one batch."""
+        from app.modules.policies import service as policy_service
+        from app.modules.policies.models import Policy
+        from app.modules.policies.service import PolicyService
+
+        monkeypatch.setattr(policy_service, "POLICIES_BASE_DIR", tmp_path / "policies")
+        policies = []
+        for i in range(3):
+            (tmp_path / f"{i}.md").write_text(f"# Policy {i}\n\nContent {i}")
+            policies.append(
+                Policy(
+                    tenant_id=test_tenant.id,
+                    name=f"Policy {i}",
+                    category="general",
+                    file_path=f"{i}.md",
+                    file_name=f"{i}.md",
+                    file_type="md",
+                    file_size=1,
+                )
+            )
+        policies.append(
+            Policy(
+                tenant_id=test_tenant.id,
+                name="Missing File",
+                category="general",
+                file_path="missing.md",
+                file_name="missing.md",
+                file_type="md",
+                file_size=1,
+            )
+        )
+        test_session.add_all(policies)
+        await test_session.flush()
+
+        service = PolicyService(test_session, test_tenant.id)
+        collection = offline_store(service.vectorstore)
+
+        result = await service.index_all_policies()
+
+        assert result["indexed_count"] == 3
+        assert result["total_chunks"] == 3
+        assert [e.split(":")[0] for e in result["errors"]] == ["Missing File"]
+        assert len(collection.upserts) == 1
+        assert all(p.is_indexed for p in policies[:3])
+        assert not policies[3].is_indexed
+
+    @pytest.mark.asyncio
+    async def test_index_all_policies_across_load_windows(
+        self,
+        test_session,
+        test_tenant,
+        tmp_path,
+        monkeypatch,
+        assert_query_count,
+    ):
+        """Test policies over several windows and pages are all indexed."""
+        from app.ai.rag.embeddings import EmbeddingConfig
+        from app.modules.policies import service as policy_service
+        from app.modules.policies.models import Policy
+        from app.modules.policies.repository import PolicyRepository
+        from app.modules.policies.service import PolicyService
+
+        monkeypatch.setattr(policy_service, "POLICIES_BASE_DIR", tmp_path / "policies")
+        monkeypatch.setattr(policy_service, "INDEX_LOAD_WINDOW", 2)
+        monkeypatch.setattr(
+            PolicyRepository.iter_unindexed_policies, "__defaults__", (2,)
+        )
+        monkeypatch.setattr(policy_service, "INDEX_LOAD_CONCURRENCY", 1)
+        # Store (and mark indexed) each window before the next page loads
+        monkeypatch.setattr(
+            policy_service,
+            "get_embedding_config",
+            lambda: EmbeddingConfig(batch_size=2),
+        )
+        policies = []
+        for i in range(5):
+            (tmp_path / f"{i}.md").write_text(f"# Policy {i}\n\nContent {i}")
+            policies.append(
+                Policy(
+                    tenant_id=test_tenant.id,
+                    name=f"Policy {i}",
+                    category="general",
+                    file_path=f"{i}.md",
+                    file_name=f"{i}.md",
+                    file_type="md",
+                    file_size=1,
+                )
+            )
+        test_session.add_all(policies)
+        await test_session.flush()
+
+        service = PolicyService(test_session, test_tenant.id)
+        offline_store(service.vectorstore)
+        # Even a session that autoflushes must not write once per page
+        test_session.sync_session.autoflush = True
+
+        with assert_query_count(len(policies) + 5) as counter:
+            result = await service.index_all_policies()
+
+        assert result["errors"] == []
+        assert result["indexed_count"] == 5
+        assert all(p.is_indexed and p.chunk_count == 1 for p in policies)
+        # Page queries do not autoflush; every state change goes out together
+        updates = [s for s in counter.statements if s.startswith("UPDATE policies")]
+        assert len(updates) == 1
+
+    @pytest.mark.asyncio
+    async def test_update_policy_resets_index_only_for_indexed_fields(
+        self,
+        test_session,
+        test_tenant,
+        assert_query_count,
+    ):
+        """Test metadata edits reset the index flag within a single UPDATE."""
+        from app.modules.policies.models import Policy
+        from app.modules.policies.schemas import PolicyUpdate
+        from app.modules.policies.service import PolicyService
+
+        policy = Policy(
+            tenant_id=test_tenant.id,
+            name="Leave Policy",
+            category="leave",
+            file_path="policies/leave.md",
+            file_name="leave.md",
+            file_type="md",
+            file_size=1,
+            is_indexed=True,
+        )
+        test_session.add(policy)
+        await test_session.flush()
+        service = PolicyService(test_session, test_tenant.id)
+
+        await service.update_policy(policy.id, PolicyUpdate(description="Notes"))
+        assert policy.is_indexed is True
+
+        with assert_query_count(1):
+            updated = await service.update_policy(
+                policy.id, PolicyUpdate(version="2.0")
+            )
+        assert updated is policy
+        assert (policy.version, policy.is_indexed) == ("2.0", False)
+
     @pytest.mark.asyncio
     async def test_vectorstore_stats(
         self,
@@ -446,6 +725,166 @@ class TestPolicyRAGChat:
         assert "answer" in data
 
 
+class TestPolicyRepository:
+    """Test policy repository queries."""
+
+    @pytest.mark.asyncio
+    async def test_get_by_ids_spans_chunks(
+        self,
+        test_session,
+        test_tenant,
+        monkeypatch,
+    ):
+        """Test ID lookups larger than one chunk return every policy."""
+        from app.modules.policies import repository
+        from app.modules.policies.models import Policy
+        from app.modules.policies.repository import PolicyRepository
+
+        monkeypatch.setattr(repository, "GET_BY_IDS_CHUNK_SIZE", 2)
+        policies = [
+            Policy(
+                tenant_id=test_tenant.id,
+                name=f"Policy {i}",
+                category="general",
+                file_path=f"policies/{i}.md",
+                file_name=f"{i}.md",
+                file_type="md",
+                file_size=1,
+            )
+            for i in range(5)
+        ]
+        test_session.add_all(policies)
+        await test_session.flush()
+
+        repo = PolicyRepository(test_session, test_tenant.id)
+        found = await repo.get_by_ids([p.id for p in policies] + ["missing"])
+
+        assert {p.id for p in found} == {p.id for p in policies}
+
+    @pytest.mark.asyncio
+    async def test_list_filtered_pages_in_sql(
+        self,
+        test_session,
+        test_tenant,
+    ):
+        """Test filters, paging and totals are applied by the query."""
+        from app.modules.policies.models import Policy
+        from app.modules.policies.repository import PolicyRepository
+
+        statuses = ["active", "active", "active", "draft", "archived"]
+        test_session.add_all(
+            Policy(
+                tenant_id=test_tenant.id,
+                name=f"Policy {i}",
+                category="leave" if i % 2 else "general",
+                file_path=f"policies/{i}.md",
+                file_name=f"{i}.md",
+                file_type="md",
+                file_size=1,
+                status=status,
+            )
+            for i, status in enumerate(statuses)
+        )
+        await test_session.flush()
+        repo = PolicyRepository(test_session, test_tenant.id)
+
+        page, total = await repo.list_filtered(offset=1, limit=1)
+        assert total == 3
+        assert [p.name for p in page] == ["Policy 1"]
+
+        everything, total = await repo.list_filtered(include_archived=True)
+        assert total == len(everything) == 5
+
+        general, total = await repo.list_filtered(category="general")
+        assert [p.name for p in general] == ["Policy 0", "Policy 2"]
+        assert total == 2
+
+        drafts, total = await repo.list_filtered(status="draft", category="leave")
+        assert ([p.name for p in drafts], total) == (["Policy 3"], 1)
+
+        past_end, total = await repo.list_filtered(offset=10, limit=5)
+        assert (past_end, total) == ([], 3)
+
+    @pytest.mark.asyncio
+    async def test_reset_index_state(
+        self,
+        test_session,
+        test_tenant,
+        assert_query_count,
+    ):
+        """Test every policy is reset by a single statement."""
+        from datetime import datetime, timezone
+
+        from app.modules.policies.models import Policy
+        from app.modules.policies.repository import PolicyRepository
+
+        policies = [
+            Policy(
+                tenant_id=test_tenant.id,
+                name=f"Policy {i}",
+                category="general",
+                file_path=f"policies/{i}.md",
+                file_name=f"{i}.md",
+                file_type="md",
+                file_size=1,
+                status=status,
+                is_indexed=True,
+                indexed_at=datetime.now(timezone.utc),
+                chunk_count=3,
+            )
+            for i, status in enumerate(["active", "archived"])
+        ]
+        test_session.add_all(policies)
+        await test_session.flush()
+        repo = PolicyRepository(test_session, test_tenant.id)
+
+        with assert_query_count(1):
+            assert await repo.reset_index_state() == 2
+
+        for policy in policies:
+            assert (policy.is_indexed, policy.indexed_at, policy.chunk_count) == (
+                False,
+                None,
+                0,
+            )
+
+    @pytest.mark.asyncio
+    async def test_iter_unindexed_policies_pages_by_id(
+        self,
+        test_session,
+        test_tenant,
+    ):
+        """Test keyset pages cover every unindexed policy exactly once."""
+        from app.modules.policies.models import Policy
+        from app.modules.policies.repository import PolicyRepository
+
+        policies = [
+            Policy(
+                tenant_id=test_tenant.id,
+                name=f"Policy {i}",
+                category="general",
+                file_path=f"policies/{i}.md",
+                file_name=f"{i}.md",
+                file_type="md",
+                file_size=1,
+                is_indexed=i == 0,
+            )
+            for i in range(6)
+        ]
+        test_session.add_all(policies)
+        await test_session.flush()
+
+        repo = PolicyRepository(test_session, test_tenant.id)
+        seen = []
+        async for policy in repo.iter_unindexed_policies(batch_size=2):
+            # Indexing mid-iteration must not shift later pages
+            policy.is_indexed = True
+            await test_session.flush()
+            seen.append(policy.id)
+
+        assert seen == sorted(p.id for p in policies[1:])
+
+
 class TestDocumentLoader:
     """Test document loading and chunking."""
 
@@ -490,6 +929,25 @@ class TestDocumentLoader:
             assert len(chunk.content) <= 150
             assert chunk.source_file == "test.txt"
 
+    def test_chunk_text_deduplicates_repeated_chunks(self):
+        """Test repeated chunks are kept once and renumbered when enabled."""
+        from app.ai.rag.document_loader import ChunkingConfig, DocumentLoader
+
+        text = "Company Confidential\n\nLeave rules.\n\nCompany Confidential"
+        config = ChunkingConfig(chunk_size=25, chunk_overlap=0)
+
+        plain = DocumentLoader(config).chunk_text(text)
+        config.deduplicate = True
+        deduped = DocumentLoader(config).chunk_text(text)
+
+        assert [c.content for c in plain].count("Company Confidential") == 2
+        assert [c.content for c in deduped] == [
+            "Company Confidential",
+            "Leave rules.",
+        ]
+        assert [c.chunk_index for c in deduped] == [0, 1]
+        assert all(c.metadata["total_chunks"] == 2 for c in deduped)
+
     def test_load_and_chunk(self, tmp_path):
         """Test combined load and chunk."""
         from app.ai.rag.document_loader import DocumentLoader
@@ -516,6 +974,39 @@ class TestDocumentLoader:
             loader.load_file(test_file)
 
 
+class TestEmbeddingCache:
+    """Test the content-hash embedding cache."""
+
+    def test_cached_texts_are_not_re_embedded(self, tmp_path):
+        """Test only unseen texts reach the embedding function."""
+        from app.ai.rag.embedding_cache import CachedEmbedder, EmbeddingCache
+
+        embedding_function = CountingEmbeddingFunction()
+        embedder = CachedEmbedder(
+            embedding_function, EmbeddingCache(tmp_path / "cache.sqlite3")
+        )
+
+        first = embedder(["alpha", "beta", "alpha"])
+        second = embedder(["beta", "gamma"])
+
+        assert embedding_function.calls == [["alpha", "beta"], ["gamma"]]
+        assert first == [[5.0, 0.5], [4.0, 0.5], [5.0, 0.5]]
+        assert second == [[4.0, 0.5], [5.0, 0.5]]
+
+    def test_cache_is_keyed_by_model(self, tmp_path):
+        """Test vectors cached for one model are not served for another."""
+        from app.ai.rag.embedding_cache import CachedEmbedder, EmbeddingCache
+
+        cache = EmbeddingCache(tmp_path / "cache.sqlite3")
+        CachedEmbedder(CountingEmbeddingFunction(), cache)(["alpha"])
+
+        other_model = CountingEmbeddingFunction()
+        other_model.model_name = "other-model"
+        CachedEmbedder(other_model, cache)(["alpha"])
+
+        assert other_model.calls == [["alpha"]]
+
+
 class TestVectorStore:
     """Test vector store operations."""
 
@@ -585,6 +1076,33 @@ class TestVectorStore:
 
         store.clear()
 
+    def test_add_chunks_batch_splits_by_batch_size(self):
+        """Test chunks across policies are upserted in fixed-size batches."""
+        from app.ai.rag.document_loader import DocumentChunk
+        from app.ai.rag.vectorstore import PolicyVectorStore
+
+        store = PolicyVectorStore(self.VECTORSTORE_TEST_TENANT)
+        collection = offline_store(store)
+
+        counts = store.add_chunks_batch(
+            {
+                "policy-a": [
+                    DocumentChunk(content=f"a{i}", chunk_index=i) for i in range(3)
+                ],
+                "policy-b": [
+                    DocumentChunk(content=f"b{i}", chunk_index=i) for i in range(2)
+                ],
+            },
+            batch_size=2,
+        )
+
+        assert counts == {"policy-a": 3, "policy-b": 2}
+        assert collection.upserts == [
+            ["policy-a::0", "policy-a::1"],
+            ["policy-a::2", "policy-b::0"],
+            ["policy-b::1"],
+        ]
+
     def test_get_stats(self):
         """Test getting store statistics."""
         from app.ai.rag.vectorstore import PolicyVectorStore
@@ -0,0 +1,136 @@
+"""Query-count guards for list endpoints prone to N+1 regressions."""
+
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.security import get_password_hash
+from app.modules.auth.models import User, UserStatus
+from app.modules.platform.service import PlatformService
+from app.modules.policies.models import Policy, PolicyCategory, PolicyStatus
+from app.modules.policies.service import PolicyService
+from app.modules.tenants.models import Tenant, TenantStatus
+from tests.conftest import BASE_DOMAIN
+
+pytestmark = pytest.mark.asyncio
+
+TENANT_COUNT = 5
+
+
+# --- Fixtures ---
+
+
+@pytest.fixture
+async def tenants_with_users(test_session: AsyncSession) -> list[Tenant]:
+    """Create several tenants, each with one user."""
+    now = datetime.now(timezone.utc)
+    tenants = []
+    for i in range(TENANT_COUNT):
+        tenant = Tenant(
+            id=str(uuid.uuid4()),
+            name=f"Org {i}",
+            domain=f"org{i}.{BASE_DOMAIN}",
+            email=f"admin@org{i}.example.com",
+            status=TenantStatus.ACTIVE.value,
+            created_at=now,
+            updated_at=now,
+        )
+        user = User(
+            id=str(uuid.uuid4()),
+            tenant_id=tenant.id,
+            email=f"user@org{i}.example.com",
+            password_hash=get_password_hash("Test@12345"),
+            first_name="Org",
+            last_name="User",
+            status=UserStatus.ACTIVE.value,
+        )
+        test_session.add_all([tenant, user])
+        tenants.append(tenant)
+    await test_session.commit()
+    return tenants
+
+
+@pytest.fixture
+async def tenant_policies(
+    test_session: AsyncSession, test_tenant: Tenant
+) -> list[Policy]:
+    """Create several active policies for the test tenant."""
+    policies = [
+        Policy(
+            tenant_id=test_tenant.id,
+            name=f"Policy {i}",
+            category=PolicyCategory.GENERAL.value,
+            file_path=f"policies/policy-{i}.md",
+            file_name=f"policy-{i}.md",
+            file_type="md",
+            version="1.0",
+            status=PolicyStatus.ACTIVE.value,
+        )
+        for i in range(TENANT_COUNT)
+    ]
+    test_session.add_all(policies)
+    await test_session.commit()
+    return policies
+
+
+# --- Platform Query Counts ---
+
+
+class TestPlatformQueryCounts:
+    """Tenant listings stay a fixed number of queries however many rows."""
+
+    async def test_get_all_tenant_stats(
+        self,
+        test_session: AsyncSession,
+        tenants_with_users: list[Tenant],  # noqa: ARG002
+        assert_query_count,
+    ):
+        """Test a stats page and its total come from one query."""
+        service = PlatformService(test_session)
+
+        with assert_query_count(1):
+            stats, total = await service.get_all_tenant_stats(offset=0, limit=50)
+
+        assert total == TENANT_COUNT
+        assert all(s.user_count == 1 for s in stats)
+
+    async def test_search_tenants(
+        self,
+        test_session: AsyncSession,
+        tenants_with_users: list[Tenant],  # noqa: ARG002
+        assert_query_count,
+    ):
+        """Test search results and their counts come from one query."""
+        service = PlatformService(test_session)
+
+        with assert_query_count(1):
+            stats = await service.search_tenants(query="Org")
+
+        assert len(stats) == TENANT_COUNT
+
+
+# --- Policy Query Counts ---
+
+
+class TestPolicyQueryCounts:
+    """Policy listings do not issue a query per policy."""
+
+    async def test_list_policies(
+        self,
+        test_session: AsyncSession,
+        test_tenant: Tenant,
+        tenant_policies: list[Policy],  # noqa: ARG002
+        assert_query_count,
+    ):
+        """Test listing active policies is a single query."""
+        service = PolicyService(test_session, test_tenant.id)
+
+        with assert_query_count(1):
+            policies, total = await service.list_policies()
+
+        assert total == TENANT_COUNT
+        assert {p.name for p in policies} == {
+            f"Policy {i}" for i in range(TENANT_COUNT)
+        }
@@ -0,0 +1,215 @@
+"""Tests for tenant domain resolution."""
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core import tenancy
+from app.core.exceptions import EntityAlreadyExistsError
+from app.modules.platform.service import PlatformService
+from app.modules.tenants import service as tenant_service
+from app.modules.tenants.models import Tenant, TenantStatus
+from app.modules.tenants.schemas import TenantCreate, TenantUpdate
+from tests.conftest import FakeCache, get_tenant_headers
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture(autouse=True)
+def empty_domain_cache():
+    """Start and finish every test with an empty domain cache."""
+    tenancy.clear_tenant_domain_cache()
+    yield
+    tenancy.clear_tenant_domain_cache()
+
+
+class TestTenantService:
+    """Tests for tenant creation through the tenant service."""
+
+    async def test_create_tenant(self, test_session: AsyncSession):
+        """Test a new tenant is inserted pending."""
+        service = tenant_service.TenantService(test_session)
+
+        tenant = await service.create_tenant(
+            TenantCreate(name="New Org", domain="new.example.com", email="n@x.com")
+        )
+
+        assert tenant.status == TenantStatus.PENDING.value
+        assert await service.get_tenant_by_domain("new.example.com") is tenant
+
+    @pytest.mark.parametrize("field", ["domain", "email"])
+    async def test_create_tenant_conflict(
+        self,
+        test_session: AsyncSession,
+        test_tenant: Tenant,
+        field: str,
+    ):
+        """Test a taken domain or email is reported as that identifier."""
+        service = tenant_service.TenantService(test_session)
+        values = {"name": "Copy", "domain": "copy.example.com", "email": "c@x.com"}
+        values[field] = getattr(test_tenant, field)
+
+        with pytest.raises(EntityAlreadyExistsError) as exc_info:
+            await service.create_tenant(TenantCreate(**values))
+
+        assert exc_info.value.details["identifier"] == values[field]
+
+    async def test_list_tenants(
+        self,
+        test_session: AsyncSession,
+        test_tenant: Tenant,
+        assert_query_count,
+    ):
+        """Test a page and its total come from one query."""
+        service = tenant_service.TenantService(test_session)
+
+        with assert_query_count(1):
+            tenants, total = await service.list_tenants()
+        assert (tenants, total) == ([test_tenant], 1)
+
+        assert await service.list_tenants(offset=5) == ([], 1)
+
+    async def test_update_tenant_applies_only_set_fields(
+        self,
+        test_session: AsyncSession,
+        test_tenant: Tenant,
+    ):
+        """Test fields left out of the update keep their values."""
+        service = tenant_service.TenantService(test_session)
+
+        tenant = await service.update_tenant(
+            test_tenant.id, TenantUpdate(city="Pune", phone=None)
+        )
+
+        assert (tenant.city, tenant.phone) == ("Pune", None)
+        assert tenant.name == "Test Company"
+
+    async def test_update_tenant_duplicate_email(
+        self,
+        test_session: AsyncSession,
+        test_tenant: Tenant,
+    ):
+        """Test updating to a taken email is reported as a conflict."""
+        service = tenant_service.TenantService(test_session)
+        other = await service.create_tenant(
+            TenantCreate(name="Other Org", domain="other.example.com", email="o@x.com")
+        )
+
+        with pytest.raises(EntityAlreadyExistsError) as exc_info:
+            await service.update_tenant(other.id, TenantUpdate(email=test_tenant.email))
+
+        assert exc_info.value.details["identifier"] == test_tenant.email
+        # Only the savepoint rolled back; the session still loads the tenant
+        await test_session.refresh(other)
+        assert other.email == "o@x.com"
+
+
+class TestTenantDomain:
+    """Tests for tenant domain normalization."""
+
+    async def test_domain_is_stored_lowercase(self, test_session: AsyncSession):
+        """Test mixed-case domains are normalized on the model and found."""
+        tenant = Tenant(
+            name="Mixed Case",
+            domain=" HR.Mixed-Case.Example.COM ",
+            email="admin@mixed-case.example.com",
+        )
+        test_session.add(tenant)
+        await test_session.flush()
+
+        assert tenant.domain == "hr.mixed-case.example.com"
+        domain = tenancy.extract_domain_from_host("HR.Mixed-Case.Example.com:8000")
+        assert await tenancy.lookup_tenant_id(test_session, domain) == tenant.id
+
+
+class TestDomainCache:
+    """Tests for the per-process domain to tenant cache."""
+
+    async def test_lookup_caches_active_tenant(
+        self,
+        test_session: AsyncSession,
+        test_tenant: Tenant,
+    ):
+        """Test a successful lookup is served from the cache afterwards."""
+        assert tenancy.get_cached_tenant_id(test_tenant.domain) is None
+
+        tenant_id = await tenancy.lookup_tenant_id(test_session, test_tenant.domain)
+
+        assert tenant_id == test_tenant.id
+        assert tenancy.get_cached_tenant_id(test_tenant.domain) == test_tenant.id
+
+    async def test_unknown_domain_is_not_cached(
+        self,
+        test_session: AsyncSession,
+    ):
+        """Test misses are not cached so new tenants resolve immediately."""
+        assert await tenancy.lookup_tenant_id(test_session, "nope.example.com") is None
+        assert tenancy.get_cached_tenant_id("nope.example.com") is None
+
+    async def test_expired_entry_is_dropped(
+        self,
+        test_session: AsyncSession,
+        test_tenant: Tenant,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Test entries older than the TTL are not served."""
+        monkeypatch.setattr(tenancy, "DOMAIN_CACHE_TTL", -1)
+
+        await tenancy.lookup_tenant_id(test_session, test_tenant.domain)
+
+        assert tenancy.get_cached_tenant_id(test_tenant.domain) is None
+
+    async def test_suspend_invalidates_domain(
+        self,
+        test_session: AsyncSession,
+        test_tenant: Tenant,
+    ):
+        """Test suspending a tenant stops its domain resolving."""
+        await tenancy.lookup_tenant_id(test_session, test_tenant.domain)
+
+        await PlatformService(test_session).suspend_tenant(test_tenant.id)
+
+        assert tenancy.get_cached_tenant_id(test_tenant.domain) is None
+        assert await tenancy.lookup_tenant_id(test_session, test_tenant.domain) is None
+
+
+class TestTenantInfo:
+    """Tests for the cached public tenant info endpoint."""
+
+    async def test_info_is_cached_until_tenant_update(
+        self,
+        client: AsyncClient,
+        test_session: AsyncSession,
+        test_tenant: Tenant,
+        fake_cache: FakeCache,
+    ):
+        """Test branding is served from cache and refreshed on update."""
+        headers = get_tenant_headers(test_tenant)
+
+        first = await client.get("/api/v1/tenants/info", headers=headers)
+
+        assert first.status_code == 200
+        assert first.json()["name"] == test_tenant.name
+        assert fake_cache.data
+
+        await PlatformService(test_session).update_tenant(
+            test_tenant.id, TenantUpdate(name="Renamed Company")
+        )
+        await test_session.commit()
+
+        assert not fake_cache.data
+        second = await client.get("/api/v1/tenants/info", headers=headers)
+        assert second.json()["name"] == "Renamed Company"
+
+    async def test_unknown_domain_returns_404(
+        self,
+        client: AsyncClient,
+        fake_cache: FakeCache,
+    ):
+        """Test unknown domains are not cached."""
+        response = await client.get(
+            "/api/v1/tenants/info", headers={"Host": "nope.example.com"}
+        )
+
+        assert response.status_code == 404
+        assert not fake_cache.data
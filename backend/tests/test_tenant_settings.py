@@ -0,0 +1,262 @@
+"""Tests for tenant settings service."""
+
+import pytest
+from httpx import AsyncClient
+from pydantic import ValidationError as PydanticValidationError
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.modules.tenants.models import Tenant
+from app.modules.tenants.settings_models import SettingCategory, TenantSettings
+from app.modules.tenants.settings_schemas import (
+    DEFAULT_DUMPS,
+    SETTINGS_CATEGORIES_INFO,
+    SETTINGS_UPDATE_ADAPTERS,
+    BrandingSettings,
+    GeneralSettings,
+    SecuritySettings,
+)
+from app.modules.tenants.settings_service import TenantSettingsService
+from tests.conftest import FakeCache, get_tenant_headers
+
+pytestmark = pytest.mark.asyncio
+
+
+async def count_rows(session: AsyncSession, tenant_id: str) -> int:
+    """Count stored settings rows for a tenant."""
+    return await session.scalar(
+        select(func.count())
+        .select_from(TenantSettings)
+        .where(TenantSettings.tenant_id == tenant_id)
+    )
+
+
+# --- Update Tests ---
+
+
+class TestUpdateSettings:
+    """Tests for partial settings updates."""
+
+    async def test_update_creates_then_merges(
+        self,
+        test_session: AsyncSession,
+        test_tenant: Tenant,
+    ):
+        """Test the first update inserts and later ones merge into one row."""
+        service = TenantSettingsService(test_session)
+
+        created = await service.update_settings(
+            test_tenant.id, SettingCategory.GENERAL, {"language": "hi"}
+        )
+        updated = await service.update_settings(
+            test_tenant.id, SettingCategory.GENERAL, {"timezone": "UTC"}
+        )
+
+        assert updated is created
+        assert updated.settings["language"] == "hi"
+        assert updated.settings["timezone"] == "UTC"
+        assert await count_rows(test_session, test_tenant.id) == 1
+
+    async def test_update_rejects_invalid_values(
+        self,
+        test_session: AsyncSession,
+        test_tenant: Tenant,
+    ):
+        """Test merged values are validated against the category schema."""
+        service = TenantSettingsService(test_session)
+
+        with pytest.raises(PydanticValidationError):
+            await service.update_settings(
+                test_tenant.id, SettingCategory.BRANDING, {"primary_color": "blue"}
+            )
+
+        assert await count_rows(test_session, test_tenant.id) == 0
+
+    async def test_update_validates_only_submitted_keys(
+        self,
+        test_session: AsyncSession,
+        test_tenant: Tenant,
+    ):
+        """Test updates are coerced, unknown keys dropped and gaps defaulted."""
+        service = TenantSettingsService(test_session)
+
+        settings = await service.update_settings(
+            test_tenant.id,
+            SettingCategory.GENERAL,
+            {"fiscal_year_start_month": "1", "unknown": True},
+        )
+
+        assert settings.settings == {
+            **GeneralSettings().model_dump(),
+            "fiscal_year_start_month": 1,
+        }
+        with pytest.raises(PydanticValidationError) as excinfo:
+            await service.update_settings(
+                test_tenant.id, SettingCategory.GENERAL, {"week_start_day": 9}
+            )
+        assert excinfo.value.errors()[0]["loc"] == ("week_start_day",)
+
+    @pytest.mark.parametrize("category", list(SettingCategory))
+    async def test_update_accepts_every_category(
+        self,
+        test_session: AsyncSession,
+        test_tenant: Tenant,
+        category: SettingCategory,
+    ):
+        """Test each category the service accepts has an update adapter."""
+        assert category in SETTINGS_UPDATE_ADAPTERS
+        service = TenantSettingsService(test_session)
+
+        settings = await service.update_settings(test_tenant.id, category, {})
+
+        assert settings.settings == DEFAULT_DUMPS[category]
+
+
+# --- Reset Tests ---
+
+
+class TestResetSettings:
+    """Tests for restoring default settings."""
+
+    async def test_reset_restores_defaults(
+        self,
+        test_session: AsyncSession,
+        test_tenant: Tenant,
+    ):
+        """Test a reset overwrites stored values in place."""
+        service = TenantSettingsService(test_session)
+        await service.update_settings(
+            test_tenant.id, SettingCategory.GENERAL, {"language": "hi"}
+        )
+
+        reset = await service.reset_settings(test_tenant.id, SettingCategory.GENERAL)
+
+        assert reset.settings["language"] == "en"
+        assert await count_rows(test_session, test_tenant.id) == 1
+
+    async def test_reset_does_not_share_defaults(
+        self,
+        test_session: AsyncSession,
+        test_tenant: Tenant,
+    ):
+        """Test the stored row never aliases the shared default values."""
+        service = TenantSettingsService(test_session)
+
+        reset = await service.reset_settings(test_tenant.id, SettingCategory.SECURITY)
+        reset.settings["allowed_2fa_methods"].append("sms")
+
+        assert (
+            DEFAULT_DUMPS[SettingCategory.SECURITY] == SecuritySettings().model_dump()
+        )
+
+    async def test_reset_all_in_one_statement(
+        self,
+        test_session: AsyncSession,
+        test_tenant: Tenant,
+        fake_cache: FakeCache,
+        assert_query_count,
+    ):
+        """Test every category is reset by one upsert and its cache dropped."""
+        service = TenantSettingsService(test_session)
+        general = await service.update_settings(
+            test_tenant.id, SettingCategory.GENERAL, {"language": "hi"}
+        )
+        await service.get_branding_settings(test_tenant.id)
+
+        with assert_query_count(1):
+            reset = await service.reset_all_settings(test_tenant.id)
+
+        assert reset.general.language == "en"
+        assert general.settings["language"] == "en"
+        assert not fake_cache.data
+        assert await count_rows(test_session, test_tenant.id) == len(SettingCategory)
+
+
+# --- Route Tests ---
+
+
+class TestSettingsRoutes:
+    """Tests for the settings API."""
+
+    async def test_list_categories(
+        self,
+        client: AsyncClient,
+        test_tenant: Tenant,
+    ):
+        """Test the precomputed category list is served as JSON."""
+        response = await client.get(
+            "/api/v1/settings/categories", headers=get_tenant_headers(test_tenant)
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == [
+            info.model_dump(mode="json") for info in SETTINGS_CATEGORIES_INFO
+        ]
+
+    async def test_category_get_and_patch(
+        self,
+        client: AsyncClient,
+        test_tenant: Tenant,
+    ):
+        """Test category routes serve defaults and return merged updates."""
+        headers = get_tenant_headers(test_tenant)
+
+        default = await client.get("/api/v1/settings/branding", headers=headers)
+        updated = await client.patch(
+            "/api/v1/settings/branding",
+            json={"settings": {"primary_color": "#112233"}},
+            headers=headers,
+        )
+        fetched = await client.get("/api/v1/settings/branding", headers=headers)
+
+        assert default.status_code == 200
+        assert updated.status_code == 200
+        assert updated.json()["primary_color"] == "#112233"
+        assert fetched.json() == {**default.json(), "primary_color": "#112233"}
+
+
+# --- Read Tests ---
+
+
+class TestGetSettings:
+    """Tests for reading stored settings."""
+
+    async def test_get_all_settings_fills_defaults(
+        self,
+        test_session: AsyncSession,
+        test_tenant: Tenant,
+    ):
+        """Test stored values are returned alongside defaults."""
+        service = TenantSettingsService(test_session)
+        await service.update_settings(
+            test_tenant.id, SettingCategory.GENERAL, {"language": "hi"}
+        )
+
+        settings = await service.get_all_settings(test_tenant.id)
+
+        assert settings.general.language == "hi"
+        assert settings.general.timezone == "Asia/Kolkata"
+        assert settings.branding.primary_color == BrandingSettings().primary_color
+        assert settings.model_dump()["security"] == SecuritySettings().model_dump()
+
+    async def test_category_settings_cached_until_written(
+        self,
+        test_session: AsyncSession,
+        test_tenant: Tenant,
+        fake_cache: FakeCache,
+        assert_query_count,
+    ):
+        """Test cached reads skip the database and writes drop the entry."""
+        service = TenantSettingsService(test_session)
+        await service.get_general_settings(test_tenant.id)
+
+        with assert_query_count(0):
+            cached = await service.get_general_settings(test_tenant.id)
+        await service.update_settings(
+            test_tenant.id, SettingCategory.GENERAL, {"language": "hi"}
+        )
+
+        assert cached.language == "en"
+        assert not fake_cache.data
+        assert (await service.get_general_settings(test_tenant.id)).language == "hi"